@@ -0,0 +1,42 @@
+"""Add documents.parent_id for document version trees
+
+Revision ID: 16a5f9cd18d7
+Revises: a438c3077ff4
+Create Date: 2026-10-16 00:00:00
+
+Each version of a document points at the version it was derived from;
+originals have no parent. The index serves the recursive walk down the
+version tree in get_document_versions.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "16a5f9cd18d7"
+down_revision = "a438c3077ff4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # create_all() may have made the column already
+    if "parent_id" not in {column["name"] for column in inspector.get_columns("documents")}:
+        # Batch mode, since SQLite cannot add a foreign key with ALTER TABLE
+        with op.batch_alter_table("documents") as batch:
+            batch.add_column(sa.Column("parent_id", sa.String(36), nullable=True))
+            batch.create_foreign_key(
+                "fk_documents_parent_id_documents", "documents", ["parent_id"], ["id"]
+            )
+    if "ix_documents_parent_id" not in {
+        index["name"] for index in inspector.get_indexes("documents")
+    }:
+        op.create_index("ix_documents_parent_id", "documents", ["parent_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_documents_parent_id", table_name="documents")
+    with op.batch_alter_table("documents") as batch:
+        batch.drop_constraint("fk_documents_parent_id_documents", type_="foreignkey")
+        batch.drop_column("parent_id")
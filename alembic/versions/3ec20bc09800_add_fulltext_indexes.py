@@ -0,0 +1,38 @@
+"""Add the full-text search indexes and fill them
+
+Revision ID: 3ec20bc09800
+Revises: d9ac50bb900e
+Create Date: 2026-10-16 00:00:00
+
+On SQLite each searchable table gets its FTS5 table, keyed on the row id,
+and the triggers keeping it in sync, and the FTS tables are filled from
+the rows already there. On PostgreSQL each gets the generated search_vector
+column, which is computed for existing rows as it is added, and its GIN
+index. Other backends get nothing; search() falls back to ilike there.
+"""
+from alembic import op
+
+from casebuilder.db.fulltext import FULLTEXT_INDEXES, install_fulltext_indexes
+
+# revision identifiers, used by Alembic.
+revision = "3ec20bc09800"
+down_revision = "d9ac50bb900e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Idempotent, so tables create_all() already indexed are just rebuilt
+    install_fulltext_indexes(op.get_bind(), rebuild=True)
+
+
+def downgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+    for index in FULLTEXT_INDEXES.values():
+        if dialect_name == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {index.fts_table}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {index.fts_table}")
+        elif dialect_name == "postgresql":
+            op.execute(f"DROP INDEX IF EXISTS ix_{index.table}_search_vector")
+            op.execute(f"ALTER TABLE {index.table} DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,154 @@
+"""Add custody_events and backfill it from evidence.chain_of_custody
+
+Revision ID: a438c3077ff4
+Revises:
+Create Date: 2026-10-16 00:00:00
+
+Moves each evidence item's chain_of_custody JSON list into hash-chained
+custody_events rows, one per entry, in list order. The JSON column is left
+in place and untouched; downgrade writes the events back into it.
+"""
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import sqlalchemy as sa
+from alembic import op
+
+from casebuilder.db.custody import GENESIS_HASH, custody_event_hash, normalize_timestamp
+
+# revision identifiers, used by Alembic.
+revision = "a438c3077ff4"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Rows per INSERT during the backfill
+BATCH_SIZE = 1000
+
+evidence = sa.table(
+    "evidence",
+    sa.column("id", sa.String),
+    sa.column("chain_of_custody", sa.JSON),
+    sa.column("created_at", sa.DateTime),
+)
+
+custody_events = sa.table(
+    "custody_events",
+    sa.column("id", sa.String),
+    sa.column("evidence_id", sa.String),
+    sa.column("sequence", sa.Integer),
+    sa.column("action", sa.String),
+    sa.column("actor_id", sa.String),
+    sa.column("occurred_at", sa.DateTime),
+    sa.column("details", sa.JSON),
+    sa.column("previous_hash", sa.String),
+    sa.column("hash", sa.String),
+)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _event_rows(evidence_id: str, chain: list, created_at: Optional[datetime]):
+    """custody_events rows for one item's JSON chain, hash-chained in order."""
+    previous_hash = GENESIS_HASH
+    for sequence, entry in enumerate(chain):
+        details: Dict[str, Any] = dict(entry) if isinstance(entry, dict) else {"value": entry}
+        actor_id = details.pop("user_id", None)
+        occurred_at = (
+            _parse_timestamp(details.pop("timestamp", None))
+            or created_at
+            or datetime.utcnow()
+        )
+        chained = {
+            "previous_hash": previous_hash,
+            "evidence_id": evidence_id,
+            "sequence": sequence,
+            "action": str(details.pop("action", "custody_event")),
+            "actor_id": None if actor_id is None else str(actor_id),
+            "occurred_at": normalize_timestamp(occurred_at),
+            "details": details,
+        }
+        previous_hash = custody_event_hash(**chained)
+        yield {"id": str(uuid.uuid4()), **chained, "hash": previous_hash}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # create_all() may have made the table already
+    if not sa.inspect(bind).has_table("custody_events"):
+        op.create_table(
+            "custody_events",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("sequence", sa.Integer(), nullable=False),
+            sa.Column("action", sa.String(50), nullable=False),
+            sa.Column("occurred_at", sa.DateTime(), nullable=False),
+            sa.Column("details", sa.JSON(), nullable=True),
+            sa.Column("previous_hash", sa.String(64), nullable=False),
+            sa.Column("hash", sa.String(64), nullable=False),
+            sa.Column("evidence_id", sa.String(36), sa.ForeignKey("evidence.id"), nullable=False),
+            sa.Column("actor_id", sa.String(36), sa.ForeignKey("users.id"), nullable=True),
+            sa.UniqueConstraint(
+                "evidence_id", "sequence", name="uq_custody_events_evidence_sequence"
+            ),
+        )
+        op.create_index(
+            "ix_custody_events_evidence_occurred_at",
+            "custody_events", ["evidence_id", "occurred_at"]
+        )
+        op.create_index(
+            "ix_custody_events_actor_occurred_at", "custody_events", ["actor_id", "occurred_at"]
+        )
+        op.create_index("ix_custody_events_occurred_at", "custody_events", ["occurred_at"])
+
+    # Items that already have events (a re-run) keep them
+    migrated = set(bind.execute(sa.select(custody_events.c.evidence_id).distinct()).scalars())
+
+    rows = []
+    items = bind.execute(
+        sa.select(evidence.c.id, evidence.c.chain_of_custody, evidence.c.created_at)
+    )
+    for evidence_id, chain, created_at in items:
+        if not chain or evidence_id in migrated:
+            continue
+        rows.extend(_event_rows(evidence_id, chain, created_at))
+        if len(rows) >= BATCH_SIZE:
+            op.bulk_insert(custody_events, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(custody_events, rows)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    # Write every item's events, including ones added since the upgrade,
+    # back into its JSON chain
+    chains: Dict[str, list] = {}
+    events = bind.execute(
+        sa.select(
+            custody_events.c.evidence_id, custody_events.c.action, custody_events.c.actor_id,
+            custody_events.c.occurred_at, custody_events.c.details
+        ).order_by(custody_events.c.evidence_id, custody_events.c.sequence)
+    )
+    for evidence_id, action, actor_id, occurred_at, details in events:
+        entry = dict(details or {})
+        entry.update(action=action, timestamp=occurred_at.isoformat(), user_id=actor_id)
+        chains.setdefault(evidence_id, []).append(entry)
+    for evidence_id, chain in chains.items():
+        bind.execute(
+            sa.update(evidence).where(evidence.c.id == evidence_id).values(chain_of_custody=chain)
+        )
+
+    op.drop_index("ix_custody_events_occurred_at", table_name="custody_events")
+    op.drop_index("ix_custody_events_actor_occurred_at", table_name="custody_events")
+    op.drop_index("ix_custody_events_evidence_occurred_at", table_name="custody_events")
+    op.drop_table("custody_events")
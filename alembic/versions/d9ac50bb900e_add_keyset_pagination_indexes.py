@@ -0,0 +1,41 @@
+"""Add the composite indexes behind keyset pagination
+
+Revision ID: d9ac50bb900e
+Revises: 16a5f9cd18d7
+Create Date: 2026-10-16 00:00:00
+
+get_multi_keyset orders by (created_at, id), within a case where the
+list is per case; timeline events are ordered by event_date instead.
+Each index matches one of those orders, so a page is an index range scan
+rather than a sort of the whole table.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d9ac50bb900e"
+down_revision = "16a5f9cd18d7"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES = (
+    ("ix_cases_created_at_id", "cases", ["created_at", "id"]),
+    ("ix_documents_case_created_at_id", "documents", ["case_id", "created_at", "id"]),
+    ("ix_evidence_case_created_at_id", "evidence", ["case_id", "created_at", "id"]),
+    ("ix_timeline_events_case_event_date_id", "timeline_events",
+     ["case_id", "event_date", "id"]),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        # create_all() may have made the index already
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -1,11 +1,17 @@
 """Evidence API endpoints for the CaseBuilder application."""
 
+import asyncio
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from casebuilder.config import settings
 from casebuilder.db.base import get_async_db
+from casebuilder.db.models import Document
+from casebuilder.services.content_store import ContentStore
 
 router = APIRouter()
 
@@ -13,9 +19,10 @@ router = APIRouter()
 class EvidenceService:
     """Service class for evidence operations."""
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, store: Optional[ContentStore] = None) -> None:
         """Initialize the evidence service."""
         self.db = db
+        self.store = store
 
     async def create_evidence(
         self,
@@ -26,8 +33,14 @@ class EvidenceService:
         tags: Optional[List[str]] = None,
         created_by: int,
     ) -> Dict[str, Any]:
-        """Create a new evidence record."""
-        return {
+        """Create a new evidence record.
+
+        The upload is stored in the content store under its SHA-256; bytes
+        already stored (by an earlier upload or an organized layout) are not
+        written again, and a document of the case already holding them is
+        returned as ``duplicate_of``.
+        """
+        evidence = {
             "id": 1,
             "filename": file.filename,
             "case_id": case_id,
@@ -36,6 +49,23 @@ class EvidenceService:
             "created_by": created_by,
             "status": "uploaded",
         }
+        if self.store is not None:
+            blob = await asyncio.to_thread(self.store.put_stream, file.file)
+            evidence.update(
+                file_hash=blob.file_hash,
+                file_size=blob.size,
+                file_path=str(blob.path),
+                deduplicated=not blob.created,
+            )
+            if not blob.created:
+                existing = await self.db.scalar(
+                    select(Document.id)
+                    .where(Document.file_hash == blob.file_hash, Document.case_id == case_id)
+                    .limit(1)
+                )
+                if existing is not None:
+                    evidence["duplicate_of"] = existing
+        return evidence
 
     async def get_evidence(self, evidence_id: int) -> Optional[Dict[str, Any]]:
         """Get evidence by ID."""
@@ -62,11 +92,18 @@ class EvidenceService:
         return None
 
 
+@lru_cache()
+def get_content_store() -> ContentStore:
+    """Get the shared content-addressable store."""
+    return ContentStore(settings.storage.content_store_path)
+
+
 def get_evidence_service(
     db: AsyncSession = Depends(get_async_db),
+    store: ContentStore = Depends(get_content_store),
 ) -> EvidenceService:
     """Get evidence service instance."""
-    return EvidenceService(db)
+    return EvidenceService(db, store)
 
 
 @router.post("/upload/", status_code=status.HTTP_201_CREATED)
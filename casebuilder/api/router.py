@@ -1,12 +1,16 @@
 # casebuilder/api/router.py - All API routes for the application
 
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status
+from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Query, Response, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Any
+from typing import List, Any, Optional
 
 # Import our database dependency and models
 from casebuilder.database import get_db
 from casebuilder.models import Evidence, EvidenceCreate, EvidenceRead
+from casebuilder.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursor, build_page, keyset_select
+)
 
 router = APIRouter()
 
@@ -25,8 +29,30 @@ async def create_evidence(
 @router.get("/evidence/{case_id}", response_model=List[EvidenceRead])
 async def get_evidence_for_case(
     case_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ) -> List[Evidence]:
-    """Get all evidence for a specific case."""
-    result = await db.execute(Evidence.__table__.select().where(Evidence.case_id == case_id))
-    return result.fetchall()
+    """Get the evidence for a specific case.
+
+    Without ``limit`` or ``cursor`` all of it is returned. Otherwise one page
+    is returned, oldest first, and the token for the next page (if any) is
+    in the X-Next-Cursor response header; pass it back as ``cursor``.
+    """
+    if limit is None and cursor is None:
+        result = await db.execute(Evidence.__table__.select().where(Evidence.case_id == case_id))
+        return result.fetchall()
+
+    limit = limit or DEFAULT_PAGE_SIZE
+    try:
+        query = keyset_select(
+            select(Evidence).where(Evidence.case_id == case_id),
+            (Evidence.created_at, Evidence.id), cursor, limit, db.get_bind().dialect.name
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    page = build_page((await db.execute(query)).all(), limit)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
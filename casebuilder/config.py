@@ -40,6 +40,10 @@ class StorageSettings(BaseModel):
         default=Path("./temp"),
         description="Temporary file storage path"
     )
+    content_store_path: Path = Field(
+        default=Path("./data/content"),
+        description="Content-addressable blob store (one copy per SHA-256)"
+    )
     allowed_extensions: List[str] = Field(
         default=[
             # Documents
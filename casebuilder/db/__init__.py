@@ -3,6 +3,7 @@ Database package for Mega CaseBuilder 3000.
 """
 from .base import Base, get_db, get_async_session, init_db, SessionLocal, AsyncSessionLocal
 from .models import *  # noqa: F401, F403
+from .unit_of_work import UnitOfWork
 
 __all__ = [
     "Base",
@@ -11,4 +12,5 @@ __all__ = [
     "init_db",
     "SessionLocal",
     "AsyncSessionLocal",
+    "UnitOfWork",
 ]
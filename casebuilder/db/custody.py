@@ -0,0 +1,78 @@
+"""
+Hash chain over the chain-of-custody events of an evidence item.
+
+Each custody_events row stores the SHA-256 of its own contents together
+with the hash of the item's previous event, so editing, deleting or
+reordering any event breaks every hash after it. verify_custody_chain
+recomputes the chain from the stored rows.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+# previous_hash of an item's first custody event
+GENESIS_HASH = "0" * 64
+
+
+def normalize_timestamp(value: datetime) -> datetime:
+    """Naive UTC datetime, the form custody timestamps are stored and hashed in."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def custody_event_hash(
+    *,
+    previous_hash: str,
+    evidence_id: str,
+    sequence: int,
+    action: str,
+    actor_id: Optional[str],
+    occurred_at: datetime,
+    details: Optional[Dict[str, Any]],
+) -> str:
+    """SHA-256 (hex) of a custody event chained to the hash before it."""
+    payload = {
+        "previous_hash": previous_hash,
+        "evidence_id": evidence_id,
+        "sequence": sequence,
+        "action": action,
+        "actor_id": actor_id,
+        "occurred_at": normalize_timestamp(occurred_at).isoformat(timespec="microseconds"),
+        "details": details or {},
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def verify_custody_chain(events: Iterable[Any]) -> Optional[int]:
+    """
+    Check the hash chain of one item's custody events.
+
+    Args:
+        events: The item's events (CustodyEvent rows or anything with the
+            same attributes), ordered by sequence
+
+    Returns:
+        Optional[int]: The sequence of the first event that does not match
+        its hash or does not follow the one before it; None if the chain
+        is intact
+    """
+    previous_hash = GENESIS_HASH
+    for expected_sequence, event in enumerate(events):
+        if event.sequence != expected_sequence or event.previous_hash != previous_hash:
+            return event.sequence
+        digest = custody_event_hash(
+            previous_hash=previous_hash,
+            evidence_id=event.evidence_id,
+            sequence=event.sequence,
+            action=event.action,
+            actor_id=event.actor_id,
+            occurred_at=event.occurred_at,
+            details=event.details,
+        )
+        if digest != event.hash:
+            return event.sequence
+        previous_hash = event.hash
+    return None
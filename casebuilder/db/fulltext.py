@@ -0,0 +1,254 @@
+"""
+Full-text search indexes for repository search().
+
+SQLite gets an FTS5 table per searchable table holding a copy of its text
+columns and the row's ``id``, kept in sync by insert/update/delete
+triggers; PostgreSQL gets a weighted
+``search_vector`` tsvector column (generated, so always in sync) with a GIN
+index. Both are created along with the tables (``register_fulltext_indexes``)
+or added to an existing database with ``install_fulltext_indexes``.
+build_search_query() turns a search-box string into a ranked, snippeted
+SELECT for whichever backend is in use, with an ``ilike`` fallback for
+anything else.
+
+Query syntax: words are AND-ed, ``"quoted words"`` match as a phrase and a
+trailing ``*`` makes a word a prefix (``depo*`` matches ``deposition``).
+"""
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    DDL, column, event, func, inspect, literal, literal_column, or_, select, table as table_clause,
+    text, true
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration used on PostgreSQL
+PG_TEXT_SEARCH_CONFIG = "english"
+
+# Markers around matched terms in snippets
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+
+# Approximate number of words in a snippet
+SNIPPET_WORDS = 12
+
+_TOKEN_RE = re.compile(r'"([^"]*)"?|(\S+)')
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class FullTextIndex:
+    """Searchable text columns of one table, most important first.
+
+    ``weights`` line up with ``columns``: bm25 column weights on SQLite and,
+    mapped onto the four tsvector classes A-D, setweight() labels on
+    PostgreSQL.
+    """
+    table: str
+    columns: Tuple[str, ...]
+    weights: Tuple[float, ...]
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+    @property
+    def pg_labels(self) -> Tuple[str, ...]:
+        top = max(self.weights)
+        return tuple(
+            "A" if w >= top else "B" if w >= top / 2 else "C" if w >= top / 5 else "D"
+            for w in self.weights
+        )
+
+
+FULLTEXT_INDEXES = {
+    index.table: index for index in (
+        FullTextIndex("cases", ("title", "case_number", "description"), (10.0, 8.0, 2.0)),
+        FullTextIndex("documents", ("title", "file_name", "description"), (10.0, 5.0, 2.0)),
+        FullTextIndex("evidence", ("title", "exhibit_number", "description"), (10.0, 8.0, 2.0)),
+        FullTextIndex("timeline_events", ("title", "description"), (10.0, 2.0)),
+    )
+}
+
+
+@dataclass(frozen=True)
+class SearchTerm:
+    """One word or phrase of a parsed search query."""
+    words: Tuple[str, ...]
+    prefix: bool = False
+
+
+def parse_search_query(query: str) -> List[SearchTerm]:
+    """Split a search-box string into terms.
+
+    Only word characters survive, so the result is safe to splice into an
+    FTS5 MATCH expression or a tsquery. A bare word with punctuation inside
+    (``smith-jones``) becomes a phrase of its parts.
+    """
+    terms = []
+    for phrase, word in _TOKEN_RE.findall(query):
+        raw = phrase if phrase or not word else word
+        words = tuple(_WORD_RE.findall(raw))
+        if words:
+            terms.append(SearchTerm(words, prefix=not phrase and raw.endswith("*")))
+    return terms
+
+
+def to_fts5_match(terms: Sequence[SearchTerm]) -> str:
+    """FTS5 MATCH expression for parsed terms (implicit AND)."""
+    return " ".join(
+        '"' + " ".join(term.words) + '"' + ("*" if term.prefix else "") for term in terms
+    )
+
+
+def to_tsquery(terms: Sequence[SearchTerm]) -> str:
+    """PostgreSQL to_tsquery() input for parsed terms."""
+    return " & ".join(
+        "(" + " <-> ".join(term.words) + (":*" if term.prefix else "") + ")" for term in terms
+    )
+
+
+# --- DDL ---------------------------------------------------------------------------
+
+def _sqlite_ddl(index: FullTextIndex) -> List[str]:
+    table, fts = index.table, index.fts_table
+    cols = ", ".join(index.columns)
+    new = ", ".join(f"new.{c}" for c in index.columns)
+    # Keyed on the text primary key, not the rowid: the tables have no INTEGER
+    # PRIMARY KEY, so VACUUM may renumber their rowids. id comes last so the
+    # bm25 weights still line up with the text columns.
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, id UNINDEXED, "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}({cols}, id) VALUES ({new}, new.id); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE id = old.id; END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols}, id ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE id = old.id; "
+        f"INSERT INTO {fts}({cols}, id) VALUES ({new}, new.id); END",
+    ]
+
+
+def _sqlite_rebuild(index: FullTextIndex) -> List[str]:
+    cols = ", ".join(index.columns)
+    return [
+        f"DELETE FROM {index.fts_table}",
+        f"INSERT INTO {index.fts_table}({cols}, id) SELECT {cols}, id FROM {index.table}",
+    ]
+
+
+def _pg_ddl(index: FullTextIndex) -> List[str]:
+    vector = " || ".join(
+        f"setweight(to_tsvector('{PG_TEXT_SEARCH_CONFIG}', coalesce({c}, '')), '{label}')"
+        for c, label in zip(index.columns, index.pg_labels)
+    )
+    return [
+        f"ALTER TABLE {index.table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{index.table}_search_vector "
+        f"ON {index.table} USING GIN (search_vector)",
+    ]
+
+
+def fulltext_ddl(dialect_name: str, index: FullTextIndex) -> List[str]:
+    """Statements creating the full-text index of one table (none if unsupported)."""
+    if dialect_name == "sqlite":
+        return _sqlite_ddl(index)
+    if dialect_name == "postgresql":
+        return _pg_ddl(index)
+    return []
+
+
+def register_fulltext_indexes(metadata: Any) -> None:
+    """Create each table's full-text index right after metadata.create_all() creates it."""
+    for index in FULLTEXT_INDEXES.values():
+        table = metadata.tables.get(index.table)
+        if table is None:
+            continue
+        for dialect_name in ("sqlite", "postgresql"):
+            for statement in fulltext_ddl(dialect_name, index):
+                event.listen(table, "after_create", DDL(statement).execute_if(dialect=dialect_name))
+
+
+def install_fulltext_indexes(connection: Connection, rebuild: bool = True) -> None:
+    """Add the full-text indexes to an existing database (idempotent).
+
+    With ``rebuild`` the SQLite FTS tables are refilled from the rows
+    already in their tables, e.g. for a database that had rows before its
+    triggers existed. Use as ``await conn.run_sync(install_fulltext_indexes)`` on an async
+    connection.
+    """
+    dialect_name = connection.dialect.name
+    inspector = inspect(connection)
+    for index in FULLTEXT_INDEXES.values():
+        if not inspector.has_table(index.table):
+            continue
+        for statement in fulltext_ddl(dialect_name, index):
+            connection.execute(text(statement))
+        if rebuild and dialect_name == "sqlite":
+            for statement in _sqlite_rebuild(index):
+                connection.execute(text(statement))
+    logger.info(f"Full-text indexes installed ({dialect_name})")
+
+
+# --- Queries -----------------------------------------------------------------------
+
+def build_search_query(model: Any, query: str, dialect_name: str) -> Optional[Select]:
+    """Ranked search over ``model``'s full-text index.
+
+    Returns a SELECT of ``(model, rank, snippet)`` rows ordered best first
+    (higher rank is better), ready for filters, offset and limit; or None
+    when the query has no searchable words. Dialects without an index fall
+    back to ``ilike`` over the same columns with a zero rank and no snippet.
+    """
+    index = FULLTEXT_INDEXES[model.__tablename__]
+    terms = parse_search_query(query)
+    if not terms:
+        return None
+    table = model.__tablename__
+
+    if dialect_name == "sqlite":
+        fts = index.fts_table
+        fts_table = table_clause(fts, column("id"))
+        weights = ", ".join(str(w) for w in index.weights)
+        rank = literal_column(f"-bm25({fts}, {weights})")
+        snippet = func.snippet(
+            literal_column(fts), -1, SNIPPET_START, SNIPPET_END, "…", SNIPPET_WORDS
+        )
+        return (
+            select(model, rank.label("rank"), snippet.label("snippet"))
+            .join(fts_table, fts_table.c.id == model.id)
+            .where(literal_column(fts).op("MATCH")(to_fts5_match(terms)))
+            .order_by(rank.desc())
+        )
+
+    if dialect_name == "postgresql":
+        tsquery = func.to_tsquery(literal_column(f"'{PG_TEXT_SEARCH_CONFIG}'"), to_tsquery(terms))
+        vector = literal_column(f"{table}.search_vector")
+        rank = func.ts_rank_cd(vector, tsquery)
+        document = func.concat_ws(" ", *(getattr(model, c) for c in index.columns))
+        snippet = func.ts_headline(
+            literal_column(f"'{PG_TEXT_SEARCH_CONFIG}'"), document, tsquery,
+            f"StartSel={SNIPPET_START}, StopSel={SNIPPET_END}, "
+            f"MaxWords={SNIPPET_WORDS * 2}, MinWords={SNIPPET_WORDS // 2}"
+        )
+        return (
+            select(model, rank.label("rank"), snippet.label("snippet"))
+            .where(vector.op("@@")(tsquery))
+            .order_by(rank.desc())
+        )
+
+    # No index: every word or phrase must appear in one of the columns
+    condition = true()
+    for term in terms:
+        pattern = "%" + " ".join(term.words) + "%"
+        condition = condition & or_(*(getattr(model, c).ilike(pattern) for c in index.columns))
+    return select(model, literal(0.0).label("rank"), literal(None).label("snippet")).where(condition)
@@ -11,11 +11,13 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLAlchemyEnum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     JSON,
     Table,
+    UniqueConstraint,
     Type,
     TypeVar,
 )
@@ -119,6 +121,10 @@ class Case(Base):
     """Case model representing a legal case."""
 
     __tablename__ = "cases"
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_cases_created_at_id", "created_at", "id"),
+    )
 
     id = Column(UUIDString(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=False)
@@ -189,6 +195,10 @@ class Document(Base):
     """Document model for storing case-related files and metadata."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Keyset pagination order within a case
+        Index("ix_documents_case_created_at_id", "case_id", "created_at", "id"),
+    )
 
     id = Column(UUIDString(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=False)
@@ -207,6 +217,8 @@ class Document(Base):
     # Foreign keys
     case_id = Column(UUIDString(36), ForeignKey("cases.id"), nullable=False)
     uploaded_by_id = Column(UUIDString(36), ForeignKey("users.id"), nullable=False)
+    # Previous version of this document; None for an original
+    parent_id = Column(UUIDString(36), ForeignKey("documents.id"), nullable=True, index=True)
 
     # Relationships
     case = relationship("Case", back_populates="documents")
@@ -253,6 +265,10 @@ class Evidence(Base):
     """Evidence model representing pieces of evidence in a case."""
 
     __tablename__ = "evidence"
+    __table_args__ = (
+        # Keyset pagination order within a case
+        Index("ix_evidence_case_created_at_id", "case_id", "created_at", "id"),
+    )
 
     id = Column(UUIDString(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=False)
@@ -263,6 +279,7 @@ class Evidence(Base):
         default=EvidenceStatus.PENDING_REVIEW
     )
     exhibit_number = Column(String(50), nullable=True)
+    # Superseded by custody_events; kept read-only for the backfill and downgrade
     chain_of_custody = Column(JSON, default=list)
     metadata_ = Column("metadata", JSON, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -276,11 +293,53 @@ class Evidence(Base):
     case = relationship("Case", back_populates="evidence_items")
     document = relationship("Document", back_populates="evidence")
     timeline_events = relationship("TimelineEvent", back_populates="evidence")
+    custody_events = relationship(
+        "CustodyEvent",
+        back_populates="evidence",
+        order_by="CustodyEvent.sequence"
+    )
 
     def __repr__(self) -> str:
         return f"<Evidence {self.title} ({self.evidence_type})>"
 
 
+class CustodyEvent(Base):
+    """
+    Append-only chain-of-custody entry for an evidence item.
+
+    Events are numbered per item and hash-chained (see
+    casebuilder.db.custody); the unique (evidence_id, sequence) pair makes
+    concurrent appends to one item conflict instead of forking the chain.
+    """
+
+    __tablename__ = "custody_events"
+    __table_args__ = (
+        UniqueConstraint("evidence_id", "sequence", name="uq_custody_events_evidence_sequence"),
+        Index("ix_custody_events_evidence_occurred_at", "evidence_id", "occurred_at"),
+        Index("ix_custody_events_actor_occurred_at", "actor_id", "occurred_at"),
+        Index("ix_custody_events_occurred_at", "occurred_at"),
+    )
+
+    id = Column(UUIDString(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    sequence = Column(Integer, nullable=False)  # Position in the item's chain, from 0
+    action = Column(String(50), nullable=False)
+    occurred_at = Column(DateTime, nullable=False)  # Naive UTC
+    details = Column(JSON, default=dict)
+    previous_hash = Column(String(64), nullable=False)
+    hash = Column(String(64), nullable=False)
+
+    # Foreign keys
+    evidence_id = Column(UUIDString(36), ForeignKey("evidence.id"), nullable=False)
+    actor_id = Column(UUIDString(36), ForeignKey("users.id"), nullable=True)
+
+    # Relationships
+    evidence = relationship("Evidence", back_populates="custody_events")
+    actor = relationship("User")
+
+    def __repr__(self) -> str:
+        return f"<CustodyEvent {self.evidence_id}#{self.sequence} {self.action}>"
+
+
 class TimelineEventType(str, Enum):
     """Timeline event type enumeration."""
 
@@ -301,6 +360,10 @@ class TimelineEvent(Base):
     """Timeline event model for case chronology."""
 
     __tablename__ = "timeline_events"
+    __table_args__ = (
+        # Keyset pagination order within a case
+        Index("ix_timeline_events_case_event_date_id", "case_id", "event_date", "id"),
+    )
 
     id = Column(UUIDString(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=False)
@@ -346,3 +409,9 @@ class Tag(Base):
 
     def __repr__(self) -> str:
         return f"<Tag {self.name}>"
+
+
+# Full-text search indexes (FTS5 / tsvector), created along with their tables
+from .fulltext import register_fulltext_indexes  # noqa: E402
+
+register_fulltext_indexes(Base.metadata)
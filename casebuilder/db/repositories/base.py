@@ -2,29 +2,62 @@
 Base repository class with common CRUD operations.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from operator import itemgetter
+from typing import (
+    Any, Callable, Dict, Generic, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar, Union
+)
 
 from pydantic import BaseModel
-from sqlalchemy import delete, select, update
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, aliased, joinedload
 
 from ....db.base import Base
+from ...pagination import (
+    APPROXIMATE_COUNT_THRESHOLD, Page, build_counted_page, build_page, count_select,
+    counted_select, estimate_select, keyset_select, parse_estimate
+)
+from ..fulltext import FULLTEXT_INDEXES, build_search_query
+from ..unit_of_work import in_unit_of_work
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# Rows per statement in the create_many/update_many/delete_many bulk methods
+DEFAULT_BULK_CHUNK_SIZE = 1000
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Consecutive slices of ``items`` holding at most ``size`` items each."""
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class SearchHit(NamedTuple):
+    """A full-text search result."""
+    item: Any
+    rank: float  # Higher is a better match
+    snippet: Optional[str]  # Matched text with terms wrapped in <mark>
+
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
     """
     Base repository class with common CRUD operations.
 
+    Writes commit on their own, except inside a UnitOfWork on the session,
+    where they are flushed and committed together when the unit exits.
+
     Args:
         model: SQLAlchemy model class
         db_session: SQLAlchemy session (sync or async)
     """
 
+    # Columns keyset (cursor) pages are ordered and continued by; unique together
+    keyset_columns: Tuple[str, ...] = ("created_at", "id")
+
     def __init__(self, model: Type[ModelType], db_session: Union[Session, AsyncSession]):
         self.model = model
         self.db_session = db_session
@@ -34,6 +67,26 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         """Check if the repository is using an async session."""
         return hasattr(self.db_session, "execute")
 
+    @property
+    def dialect(self):
+        """SQLAlchemy dialect of the database backend."""
+        return self.db_session.get_bind().dialect
+
+    @property
+    def dialect_name(self) -> str:
+        """Name of the database backend, e.g. 'sqlite' or 'postgresql'."""
+        return self.dialect.name
+
+    def _apply_filters(self, query, filters: Dict[str, Any]):
+        """Add equality (or IN, for lists and tuples) conditions on model attributes."""
+        for key, value in filters.items():
+            if hasattr(self.model, key):
+                if isinstance(value, (list, tuple)):
+                    query = query.where(getattr(self.model, key).in_(value))
+                else:
+                    query = query.where(getattr(self.model, key) == value)
+        return query
+
     async def get(self, id: Any, **kwargs) -> Optional[ModelType]:
         """
         Get a single record by ID.
@@ -94,6 +147,223 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
 
         return result.scalars().all()
 
+    async def get_page(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        approximate: bool = False,
+        **filters
+    ) -> Page[ModelType]:
+        """
+        Get a page of records together with the total number of matches.
+
+        Items and total come from one statement (a ``count(*) OVER ()``
+        window) rather than get_multi plus count(). Pages are ordered by
+        ``keyset_columns`` so consecutive offsets do not overlap.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            approximate: Accept the query planner's estimate as the total
+                when it is APPROXIMATE_COUNT_THRESHOLD rows or more, instead
+                of counting every match (PostgreSQL only; elsewhere the
+                total is always exact)
+            **filters: Filter criteria
+
+        Returns:
+            Page[ModelType]: The records, ``total`` and ``total_is_estimate``
+        """
+        order = [getattr(self.model, name) for name in self.keyset_columns]
+        query = self._apply_filters(select(self.model), filters).order_by(*order)
+
+        if approximate:
+            estimate = await self._estimate_count(query)
+            if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+                result = await self._execute(query.offset(skip).limit(limit))
+                return Page(list(result.scalars().all()), total=estimate, total_is_estimate=True)
+
+        return await self._fetch_counted_page(query, skip, limit)
+
+    async def _estimate_count(self, query) -> Optional[int]:
+        """Planner row estimate for ``query``, or None where there is none."""
+        statement = estimate_select(query, self.dialect)
+        if statement is None:
+            return None
+        result = await self._execute(statement)
+        return parse_estimate(result.scalar_one())
+
+    async def _fetch_counted_page(
+        self,
+        query,
+        skip: int,
+        limit: int,
+        item: Callable[[Any], Any] = itemgetter(0)
+    ) -> Page:
+        """Run ``query`` as one offset page carrying the total match count."""
+        result = await self._execute(counted_select(query, skip, limit))
+        page = build_counted_page(result.all(), skip, item)
+
+        if page.total is None:
+            # Past the last page: no row came back to carry the total
+            result = await self._execute(count_select(query))
+            page.total = result.scalar_one()
+        return page
+
+    async def get_multi_keyset(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        descending: bool = False,
+        **filters
+    ) -> Page[ModelType]:
+        """
+        Get a page of records by keyset (cursor) pagination.
+
+        Pages are ordered by ``keyset_columns`` and continue from the last
+        row of the previous page, so deep pages cost the same as the first.
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, None for the first page
+            limit: Maximum number of records to return
+            descending: Order newest first
+            **filters: Filter criteria
+
+        Returns:
+            Page[ModelType]: The records and the cursor of the next page
+
+        Raises:
+            InvalidCursor: If the cursor was not issued for this listing
+        """
+        query = self._apply_filters(select(self.model), filters)
+        return await self._fetch_keyset_page(query, cursor, limit, descending)
+
+    async def _fetch_keyset_page(
+        self,
+        query,
+        cursor: Optional[str],
+        limit: int,
+        descending: bool = False,
+        unique: bool = False
+    ) -> Page[ModelType]:
+        """Run ``query`` as one keyset page over ``keyset_columns``."""
+        columns = [getattr(self.model, name) for name in self.keyset_columns]
+        query = keyset_select(query, columns, cursor, limit, self.dialect_name, descending)
+
+        if self.is_async:
+            result = await self.db_session.execute(query)
+        else:
+            result = self.db_session.execute(query)
+
+        if unique:
+            result = result.unique()
+        return build_page(result.all(), limit)
+
+    async def search(
+        self,
+        query: str,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        **filters
+    ) -> List[ModelType]:
+        """
+        Full-text search, best matches first.
+
+        Args:
+            query: Search query string (words, "phrases" and prefix* terms)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            **filters: Additional filter criteria
+
+        Returns:
+            List[ModelType]: List of matching records
+        """
+        hits = await self.search_ranked(query, skip=skip, limit=limit, **filters)
+        return [hit.item for hit in hits]
+
+    async def search_ranked(
+        self,
+        query: str,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        **filters
+    ) -> List[SearchHit]:
+        """
+        Full-text search returning each match's rank and snippet.
+
+        Uses the table's FTS5 index on SQLite and its tsvector index on
+        PostgreSQL (see casebuilder.db.fulltext); other backends fall back
+        to ``ilike`` matching without ranking.
+
+        Args:
+            query: Search query string (words, "phrases" and prefix* terms)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            **filters: Additional filter criteria
+
+        Returns:
+            List[SearchHit]: Matches, best first
+        """
+        if self.model.__tablename__ not in FULLTEXT_INDEXES:
+            raise NotImplementedError(f"{self.model.__name__} has no full-text index")
+
+        query_obj = build_search_query(self.model, query, self.dialect_name)
+        if query_obj is None:
+            return []
+        query_obj = self._apply_filters(query_obj, filters).offset(skip).limit(limit)
+
+        if self.is_async:
+            result = await self.db_session.execute(query_obj)
+        else:
+            result = self.db_session.execute(query_obj)
+
+        return [SearchHit(item, rank, snippet) for item, rank, snippet in result.all()]
+
+    async def search_page(
+        self,
+        query: str,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        **filters
+    ) -> Page[SearchHit]:
+        """
+        Full-text search page together with the total number of matches.
+
+        Like search_ranked, with the total counted in the same statement.
+
+        Args:
+            query: Search query string (words, "phrases" and prefix* terms)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            **filters: Additional filter criteria
+
+        Returns:
+            Page[SearchHit]: Matches, best first, and ``total``
+        """
+        if self.model.__tablename__ not in FULLTEXT_INDEXES:
+            raise NotImplementedError(f"{self.model.__name__} has no full-text index")
+
+        query_obj = build_search_query(self.model, query, self.dialect_name)
+        if query_obj is None:
+            return Page([], total=0)
+
+        # Count in an outer SELECT: SQLite does not allow FTS5's bm25() and
+        # snippet() in a query that also has a window function
+        matches = self._apply_filters(query_obj, filters).order_by(None).subquery()
+        hit = aliased(self.model, matches)
+        query_obj = (
+            select(hit, matches.c.rank, matches.c.snippet)
+            .order_by(matches.c.rank.desc())
+        )
+
+        return await self._fetch_counted_page(
+            query_obj, skip, limit, item=lambda row: SearchHit(row[0], row[1], row[2])
+        )
+
     async def create(self, obj_in: CreateSchemaType, **kwargs) -> ModelType:
         """
         Create a new record.
@@ -108,17 +378,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         obj_in_data = obj_in.dict(exclude_unset=True)
         obj_in_data.update(kwargs)
 
+        db_obj = self.model(**obj_in_data)
+        self.db_session.add(db_obj)
+        await self._commit()
+
         if self.is_async:
-            # For async, we need to create the instance and add it to the session
-            db_obj = self.model(**obj_in_data)
-            self.db_session.add(db_obj)
-            await self.db_session.commit()
             await self.db_session.refresh(db_obj)
         else:
-            # For sync, we can use the session.add() pattern
-            db_obj = self.model(**obj_in_data)
-            self.db_session.add(db_obj)
-            self.db_session.commit()
             self.db_session.refresh(db_obj)
 
         return db_obj
@@ -148,13 +414,12 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
             if hasattr(db_obj, field):
                 setattr(db_obj, field, value)
 
+        self.db_session.add(db_obj)
+        await self._commit()
+
         if self.is_async:
-            self.db_session.add(db_obj)
-            await self.db_session.commit()
             await self.db_session.refresh(db_obj)
         else:
-            self.db_session.add(db_obj)
-            self.db_session.commit()
             self.db_session.refresh(db_obj)
 
         return db_obj
@@ -169,18 +434,183 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         Returns:
             bool: True if the record was deleted, False otherwise
         """
+        result = await self._execute(
+            delete(self.model).where(self.model.id == id).returning(self.model.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        await self._commit()
+        return deleted
+
+    async def create_many(
+        self,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        **kwargs
+    ) -> List[ModelType]:
+        """
+        Create many records in one transaction.
+
+        Each chunk is a single multi-row ``INSERT ... RETURNING`` where the
+        backend supports it (SQLite 3.35+, PostgreSQL), so the created rows,
+        server defaults included, come back without a SELECT per row. Other
+        backends get one executemany INSERT per chunk. Rows are batched
+        together when they set the same fields.
+
+        Args:
+            objs_in: Pydantic models or dicts with data to create
+            chunk_size: Maximum rows per INSERT statement
+            **kwargs: Additional attributes to set on every record
+
+        Returns:
+            List[ModelType]: The created records, in the order given
+        """
+        rows = []
+        for obj_in in objs_in:
+            data = dict(obj_in) if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
+            data.update(kwargs)
+            rows.append(data)
+
+        returning = self.dialect.insert_executemany_returning
+        created: List[ModelType] = []
+        try:
+            for chunk in _chunks(rows, chunk_size):
+                if returning:
+                    result = await self._execute(
+                        insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                        chunk
+                    )
+                    created.extend(result.scalars().all())
+                else:
+                    db_objs = [self.model(**data) for data in chunk]
+                    self.db_session.add_all(db_objs)
+                    if self.is_async:
+                        await self.db_session.flush()
+                    else:
+                        self.db_session.flush()
+                    created.extend(db_objs)
+            await self._commit()
+        except Exception:
+            await self._rollback()
+            raise
+
+        return created
+
+    async def update_many(
+        self,
+        objs_in: Sequence[Dict[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE
+    ) -> int:
+        """
+        Update many records by primary key in one transaction.
+
+        Each dict holds the record's ``id`` and the fields to set on it.
+        Each chunk is an executemany ``UPDATE ... WHERE id = ?``. Dicts that
+        set the same fields share a statement. Backends that cannot count
+        the rows an executemany matched get one statement per row instead.
+
+        Args:
+            objs_in: Dicts of ``id`` and the fields to update
+            chunk_size: Maximum rows per UPDATE statement
+
+        Returns:
+            int: The number of records updated; an ``id`` that matches no
+            record is not counted
+        """
+        table = self.model.__table__
+        columns = self.model.__mapper__.columns
+        executemany = self.dialect.supports_sane_multi_rowcount
+        updated = 0
+        try:
+            for chunk in _chunks(list(objs_in), chunk_size):
+                groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+                for row in chunk:
+                    fields = tuple(key for key in row if key != "id")
+                    groups.setdefault(fields, []).append(
+                        {"_id": row["id"], **{f"_{key}": row[key] for key in fields}}
+                    )
+                for fields, params in groups.items():
+                    statement = (
+                        update(table)
+                        .where(table.c.id == bindparam("_id"))
+                        .values({columns[key]: bindparam(f"_{key}") for key in fields})
+                    )
+                    if executemany:
+                        updated += (await self._execute(statement, params)).rowcount
+                    else:
+                        for param in params:
+                            updated += (await self._execute(statement, param)).rowcount
+            await self._commit()
+        except Exception:
+            await self._rollback()
+            raise
+
+        return updated
+
+    async def delete_many(
+        self,
+        ids: Sequence[Any],
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE
+    ) -> int:
+        """
+        Delete many records by ID in one transaction.
+
+        Each chunk is a single ``DELETE ... WHERE id IN (...)``.
+
+        Args:
+            ids: The IDs of the records to delete
+            chunk_size: Maximum IDs per DELETE statement
+
+        Returns:
+            int: The number of records deleted
+        """
+        deleted = 0
+        try:
+            for chunk in _chunks(list(ids), chunk_size):
+                result = await self._execute(
+                    delete(self.model).where(self.model.id.in_(chunk))
+                )
+                deleted += result.rowcount
+            await self._commit()
+        except Exception:
+            await self._rollback()
+            raise
+
+        return deleted
+
+    async def _execute(self, statement, params=None):
+        """Execute a statement on the session, sync or async."""
         if self.is_async:
-            result = await self.db_session.execute(
-                delete(self.model).where(self.model.id == id).returning(self.model.id)
-            )
+            return await self.db_session.execute(statement, params)
+        return self.db_session.execute(statement, params)
+
+    async def _commit(self) -> None:
+        """
+        Commit this repository's writes.
+
+        Inside a UnitOfWork on the session they are only flushed; the unit
+        commits once when it exits.
+        """
+        if in_unit_of_work(self.db_session):
+            if self.is_async:
+                await self.db_session.flush()
+            else:
+                self.db_session.flush()
+        elif self.is_async:
             await self.db_session.commit()
-            return result.scalar_one_or_none() is not None
         else:
-            result = self.db_session.execute(
-                delete(self.model).where(self.model.id == id).returning(self.model.id)
-            )
             self.db_session.commit()
-            return result.scalar_one_or_none() is not None
+
+    async def _rollback(self) -> None:
+        """Roll back after a failed write, unless a UnitOfWork owns the transaction."""
+        if in_unit_of_work(self.db_session):
+            return
+        if self.is_async:
+            await self.db_session.rollback()
+        else:
+            self.db_session.rollback()
 
     async def exists(self, **filters) -> bool:
         """
@@ -327,6 +757,35 @@ class BaseRepositoryAsync(BaseRepository[ModelType, CreateSchemaType, UpdateSche
         result = await self.db_session.execute(query)
         return list(result.unique().scalars().all())
 
+    async def get_multi_with_related_keyset(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        relationships: Optional[List[str]] = None,
+        **filters
+    ) -> Page[ModelType]:
+        """
+        Keyset-paginated get_multi_with_related.
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, None for the first page
+            limit: Maximum number of records to return
+            relationships: Optional list of relationship names to load
+            **filters: Filter criteria
+
+        Returns:
+            Page[ModelType]: The records, with related models loaded, and the
+            cursor of the next page
+        """
+        query = select(self.model)
+
+        for rel in relationships or ():
+            if hasattr(self.model, rel):
+                query = query.options(joinedload(getattr(self.model, rel)))
+
+        query = self._apply_filters(query, filters)
+        return await self._fetch_keyset_page(query, cursor, limit, unique=True)
+
 
 class BaseRepositorySync(BaseRepository[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
     """
@@ -21,49 +21,6 @@ class CaseRepository(BaseRepository[Case, CaseCreate, CaseUpdate]):
     def __init__(self, db_session: Union[Session, AsyncSession]):
         super().__init__(Case, db_session)
     
-    async def search(
-        self,
-        query: str,
-        *,
-        skip: int = 0,
-        limit: int = 100,
-        **filters
-    ) -> List[Case]:
-        """
-        Search cases by title, description, or case number.
-        
-        Args:
-            query: Search query string
-            skip: Number of records to skip
-            limit: Maximum number of records to return
-            **filters: Additional filter criteria
-            
-        Returns:
-            List[Case]: List of matching cases
-        """
-        search_condition = or_(
-            Case.title.ilike(f"%{query}%"),
-            Case.description.ilike(f"%{query}%"),
-            Case.case_number.ilike(f"%{query}%")
-        )
-        
-        query_obj = select(Case).where(search_condition).offset(skip).limit(limit)
-        
-        # Apply additional filters
-        for key, value in filters.items():
-            if hasattr(Case, key):
-                if isinstance(value, (list, tuple)):
-                    query_obj = query_obj.where(getattr(Case, key).in_(value))
-                else:
-                    query_obj = query_obj.where(getattr(Case, key) == value)
-        
-        if self.is_async:
-            result = await self.db_session.execute(query_obj)
-        else:
-            result = self.db_session.execute(query_obj)
-            
-        return result.scalars().all()
-    
     async def get_by_status(
         self, 
         status: CaseStatus, 
@@ -232,7 +189,7 @@ class CaseRepositoryAsync(CaseRepository, BaseRepositoryAsync[Case, CaseCreate,
         )
         
         await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await self._commit()
         return True
     
     async def remove_participant(self, case_id: str, user_id: str) -> bool:
@@ -254,7 +211,7 @@ class CaseRepositoryAsync(CaseRepository, BaseRepositoryAsync[Case, CaseCreate,
         )
         
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await self._commit()
         return result.rowcount > 0
 
 
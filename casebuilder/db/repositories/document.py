@@ -2,10 +2,11 @@
 Document repository implementation.
 """
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, bindparam, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload, selectinload
 
@@ -14,6 +15,46 @@ from ...models import Document, DocumentStatus, DocumentType, Case, User, Tag
 from .base import BaseRepository, BaseRepositoryAsync, BaseRepositorySync
 
 
+@lru_cache(maxsize=None)
+def _version_tree_query():
+    """
+    SELECT of every version in the tree of the ``:document_id`` document.
+
+    A recursive CTE walks up parent_id to the original, then down to every
+    version derived from it. UNION (not UNION ALL) stops the walk should a
+    bad parent_id ever form a cycle. Built once: constructing the statement
+    costs more than running it for short chains.
+    """
+    from sqlalchemy.orm import aliased
+    
+    ancestors = (
+        select(Document.id, Document.parent_id)
+        .where(Document.id == bindparam("document_id"))
+        .cte("ancestors", recursive=True)
+    )
+    parent = aliased(Document)
+    ancestors = ancestors.union(
+        select(parent.id, parent.parent_id)
+        .join(ancestors, parent.id == ancestors.c.parent_id)
+    )
+    
+    version_tree = (
+        select(ancestors.c.id)
+        .where(ancestors.c.parent_id.is_(None))
+        .cte("version_tree", recursive=True)
+    )
+    child = aliased(Document)
+    version_tree = version_tree.union(
+        select(child.id).join(version_tree, child.parent_id == version_tree.c.id)
+    )
+    
+    return (
+        select(Document)
+        .join(version_tree, Document.id == version_tree.c.id)
+        .order_by(Document.created_at, Document.id)
+    )
+
+
 class DocumentRepository(BaseRepository[Document, DocumentCreate, DocumentUpdate]):
     """
     Repository for Document model with common CRUD operations.
@@ -22,49 +63,6 @@ class DocumentRepository(BaseRepository[Document, DocumentCreate, DocumentUpdate
     def __init__(self, db_session: Union[Session, AsyncSession]):
         super().__init__(Document, db_session)
     
-    async def search(
-        self,
-        query: str,
-        *,
-        skip: int = 0,
-        limit: int = 100,
-        **filters
-    ) -> List[Document]:
-        """
-        Search documents by title, description, or content.
-        
-        Args:
-            query: Search query string
-            skip: Number of records to skip
-            limit: Maximum number of records to return
-            **filters: Additional filter criteria
-            
-        Returns:
-            List[Document]: List of matching documents
-        """
-        search_condition = or_(
-            Document.title.ilike(f"%{query}%"),
-            Document.description.ilike(f"%{query}%"),
-            Document.content.ilike(f"%{query}%")
-        )
-        
-        query_obj = select(Document).where(search_condition).offset(skip).limit(limit)
-        
-        # Apply additional filters
-        for key, value in filters.items():
-            if hasattr(Document, key):
-                if isinstance(value, (list, tuple)):
-                    query_obj = query_obj.where(getattr(Document, key).in_(value))
-                else:
-                    query_obj = query_obj.where(getattr(Document, key) == value)
-        
-        if self.is_async:
-            result = await self.db_session.execute(query_obj)
-        else:
-            result = self.db_session.execute(query_obj)
-            
-        return result.scalars().all()
-    
     async def get_by_case(
         self, 
         case_id: str, 
@@ -92,6 +90,31 @@ class DocumentRepository(BaseRepository[Document, DocumentCreate, DocumentUpdate
             **filters
         )
     
+    async def get_by_hash(
+        self,
+        file_hash: str,
+        *,
+        case_id: Optional[str] = None
+    ) -> Optional[Document]:
+        """
+        Get a document already holding content with this SHA-256.
+        
+        Upload paths check this before storing bytes again; the existing
+        document's ``file_path`` points at the shared blob.
+        
+        Args:
+            file_hash: SHA-256 of the content
+            case_id: Only match documents of this case
+            
+        Returns:
+            Optional[Document]: The first such document, if any
+        """
+        filters = {"file_hash": file_hash}
+        if case_id is not None:
+            filters["case_id"] = case_id
+        documents = await self.get_multi(limit=1, **filters)
+        return documents[0] if documents else None
+    
     async def get_by_type(
         self, 
         doc_type: DocumentType, 
@@ -213,7 +236,7 @@ class DocumentRepositoryAsync(DocumentRepository, BaseRepositoryAsync[Document,
         )
         
         await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await self._commit()
         return True
     
     async def remove_tag(self, document_id: str, tag_id: str) -> bool:
@@ -235,48 +258,25 @@ class DocumentRepositoryAsync(DocumentRepository, BaseRepositoryAsync[Document,
         )
         
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await self._commit()
         return result.rowcount > 0
     
     async def get_document_versions(self, document_id: str) -> List[Document]:
         """
         Get all versions of a document.
         
+        The whole version tree (the original and every version descended
+        from it) is resolved in one query with a recursive CTE.
+        
         Args:
             document_id: The ID of the document (can be any version)
             
         Returns:
             List[Document]: List of document versions in chronological order
         """
-        from sqlalchemy import select
-        
-        # First, find the root document (the original version)
-        query = select(Document).where(Document.id == document_id)
-        result = await self.db_session.execute(query)
-        doc = result.scalar_one_or_none()
-        
-        if not doc:
-            return []
-        
-        # If this is a version, find the root document
-        while doc.parent_id is not None:
-            query = select(Document).where(Document.id == doc.parent_id)
-            result = await self.db_session.execute(query)
-            doc = result.scalar_one()
-        
-        # Now get all versions (including the root)
-        versions_query = (
-            select(Document)
-            .where(
-                or_(
-                    Document.id == doc.id,
-                    Document.parent_id == doc.id
-                )
-            )
-            .order_by(Document.created_at)
+        result = await self.db_session.execute(
+            _version_tree_query(), {"document_id": document_id}
         )
-        
-        result = await self.db_session.execute(versions_query)
         return list(result.scalars().all())
 
 
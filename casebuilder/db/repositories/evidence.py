@@ -10,9 +10,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from ....schemas.evidence import EvidenceCreate, EvidenceUpdate
-from ...models import Evidence, EvidenceStatus, EvidenceType, Case, Document, Tag
+from ...models import CustodyEvent, Evidence, EvidenceStatus, EvidenceType, Case, Document, Tag
+from ..custody import GENESIS_HASH, custody_event_hash, normalize_timestamp, verify_custody_chain
 from .base import BaseRepository, BaseRepositoryAsync, BaseRepositorySync
 
+# Tries add_custody_event makes when concurrent appends take its sequence number
+CUSTODY_APPEND_ATTEMPTS = 5
+
+
+def _custody_entry(event: CustodyEvent) -> Dict[str, Any]:
+    """A custody event in the dict shape of the old chain_of_custody JSON."""
+    entry = dict(event.details or {})
+    entry.update({
+        'action': event.action,
+        'timestamp': event.occurred_at.isoformat(),
+        'user_id': event.actor_id,
+        'sequence': event.sequence,
+        'hash': event.hash,
+    })
+    return entry
+
 
 class EvidenceRepository(BaseRepository[Evidence, EvidenceCreate, EvidenceUpdate]):
     """
@@ -22,49 +39,6 @@ class EvidenceRepository(BaseRepository[Evidence, EvidenceCreate, EvidenceUpdate
     def __init__(self, db_session: Union[Session, AsyncSession]):
         super().__init__(Evidence, db_session)
     
-    async def search(
-        self,
-        query: str,
-        *,
-        skip: int = 0,
-        limit: int = 100,
-        **filters
-    ) -> List[Evidence]:
-        """
-        Search evidence by title, description, or notes.
-        
-        Args:
-            query: Search query string
-            skip: Number of records to skip
-            limit: Maximum number of records to return
-            **filters: Additional filter criteria
-            
-        Returns:
-            List[Evidence]: List of matching evidence items
-        """
-        search_condition = or_(
-            Evidence.title.ilike(f"%{query}%"),
-            Evidence.description.ilike(f"%{query}%"),
-            Evidence.notes.ilike(f"%{query}%")
-        )
-        
-        query_obj = select(Evidence).where(search_condition).offset(skip).limit(limit)
-        
-        # Apply additional filters
-        for key, value in filters.items():
-            if hasattr(Evidence, key):
-                if isinstance(value, (list, tuple)):
-                    query_obj = query_obj.where(getattr(Evidence, key).in_(value))
-                else:
-                    query_obj = query_obj.where(getattr(Evidence, key) == value)
-        
-        if self.is_async:
-            result = await self.db_session.execute(query_obj)
-        else:
-            result = self.db_session.execute(query_obj)
-            
-        return result.scalars().all()
-    
     async def get_by_case(
         self, 
         case_id: str, 
@@ -217,7 +191,7 @@ class EvidenceRepositoryAsync(EvidenceRepository, BaseRepositoryAsync[Evidence,
         )
         
         await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await self._commit()
         return True
     
     async def remove_from_timeline(
@@ -243,7 +217,7 @@ class EvidenceRepositoryAsync(EvidenceRepository, BaseRepositoryAsync[Evidence,
         )
         
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await self._commit()
         return result.rowcount > 0
     
     async def get_chain_of_custody(self, evidence_id: str) -> List[Dict[str, Any]]:
@@ -258,15 +232,61 @@ class EvidenceRepositoryAsync(EvidenceRepository, BaseRepositoryAsync[Evidence,
         """
         from sqlalchemy import select
         
-        query = select(Evidence).where(Evidence.id == evidence_id)
+        query = (
+            select(CustodyEvent)
+            .where(CustodyEvent.evidence_id == evidence_id)
+            .order_by(CustodyEvent.sequence)
+        )
         result = await self.db_session.execute(query)
-        evidence = result.scalar_one_or_none()
+        return [_custody_entry(event) for event in result.scalars()]
+    
+    async def get_custody_events(
+        self, 
+        *, 
+        evidence_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[CustodyEvent]:
+        """
+        Get custody events by item, actor and/or date range.
+        
+        Each combination is served by an index on custody_events.
         
-        if not evidence:
-            return []
+        Args:
+            evidence_id: Optional evidence item filter
+            actor_id: Optional filter on the user who recorded the event
+            start_date: Optional start of the date range (inclusive)
+            end_date: Optional end of the date range (inclusive)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            List[CustodyEvent]: Matching custody events, oldest first
+        """
+        from sqlalchemy import select
+        
+        query = select(CustodyEvent)
         
-        # The chain of custody is stored as a JSON field
-        return evidence.chain_of_custody or []
+        if evidence_id is not None:
+            query = query.where(CustodyEvent.evidence_id == evidence_id)
+        if actor_id is not None:
+            query = query.where(CustodyEvent.actor_id == actor_id)
+        if start_date:
+            query = query.where(CustodyEvent.occurred_at >= normalize_timestamp(start_date))
+        if end_date:
+            query = query.where(CustodyEvent.occurred_at <= normalize_timestamp(end_date))
+        
+        query = (
+            query
+            .order_by(CustodyEvent.occurred_at, CustodyEvent.sequence)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db_session.execute(query)
+        return list(result.scalars().all())
     
     async def add_custody_event(
         self, 
@@ -277,46 +297,86 @@ class EvidenceRepositoryAsync(EvidenceRepository, BaseRepositoryAsync[Evidence,
         """
         Add a custody event to an evidence item's chain of custody.
         
+        Inserts one custody_events row chained to the item's latest event;
+        the earlier history is neither read nor rewritten. An append that
+        loses a race for the next sequence number is retried after it.
+        
         Args:
             evidence_id: The ID of the evidence
-            event: The custody event data
+            event: The custody event data; its 'action' key names the event
             user_id: The ID of the user making the change
             
         Returns:
-            bool: True if the event was added
+            bool: True if the event was added, False if there is no such evidence
         """
-        from sqlalchemy import select, update
-        
-        # Get the current chain of custody
-        query = select(Evidence).where(Evidence.id == evidence_id)
-        result = await self.db_session.execute(query)
-        evidence = result.scalar_one_or_none()
-        
-        if not evidence:
-            return False
+        from sqlalchemy import insert, select
+        from sqlalchemy.exc import IntegrityError
         
-        # Initialize chain of custody if it doesn't exist
-        if evidence.chain_of_custody is None:
-            evidence.chain_of_custody = []
+        details = dict(event)
+        action = str(details.pop('action', 'custody_event'))
         
-        # Add the new event with timestamp and user
-        event.update({
-            'timestamp': datetime.utcnow().isoformat(),
-            'user_id': user_id
-        })
+        for attempt in range(CUSTODY_APPEND_ATTEMPTS):
+            # Latest event of the item, from the (evidence_id, sequence) index
+            result = await self.db_session.execute(
+                select(CustodyEvent.sequence, CustodyEvent.hash)
+                .where(CustodyEvent.evidence_id == evidence_id)
+                .order_by(CustodyEvent.sequence.desc())
+                .limit(1)
+            )
+            latest = result.first()
+            
+            if latest is None:
+                result = await self.db_session.execute(
+                    select(Evidence.id).where(Evidence.id == evidence_id)
+                )
+                if result.scalar_one_or_none() is None:
+                    return False
+                sequence, previous_hash = 0, GENESIS_HASH
+            else:
+                sequence, previous_hash = latest.sequence + 1, latest.hash
+            
+            chained = {
+                'previous_hash': previous_hash,
+                'evidence_id': evidence_id,
+                'sequence': sequence,
+                'action': action,
+                'actor_id': user_id,
+                'occurred_at': datetime.utcnow(),
+                'details': details,
+            }
+            try:
+                async with self.db_session.begin_nested():
+                    await self.db_session.execute(
+                        insert(CustodyEvent).values(**chained, hash=custody_event_hash(**chained))
+                    )
+            except IntegrityError:
+                if attempt == CUSTODY_APPEND_ATTEMPTS - 1:
+                    raise
+                continue  # Another append took this sequence number
+            
+            await self._commit()
+            return True
+    
+    async def verify_chain_of_custody(self, evidence_id: str) -> Optional[int]:
+        """
+        Check an evidence item's custody events against their hash chain.
         
-        evidence.chain_of_custody.append(event)
+        Args:
+            evidence_id: The ID of the evidence
+            
+        Returns:
+            Optional[int]: Sequence of the first altered, missing or
+            reordered event; None if the chain is intact
+        """
+        from sqlalchemy import select
         
-        # Update the evidence record
-        stmt = (
-            update(Evidence)
-            .where(Evidence.id == evidence_id)
-            .values(chain_of_custody=evidence.chain_of_custody)
+        query = (
+            select(CustodyEvent)
+            .where(CustodyEvent.evidence_id == evidence_id)
+            .order_by(CustodyEvent.sequence)
         )
-        
-        await self.db_session.execute(stmt)
-        await self.db_session.commit()
-        return True
+        result = await self.db_session.execute(query)
+        return verify_custody_chain(result.scalars().all())
 
 
 class EvidenceRepositorySync(EvidenceRepository, BaseRepositorySync[Evidence, EvidenceCreate, EvidenceUpdate]):
@@ -9,6 +9,7 @@ from sqlalchemy import and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload, selectinload
 
+from ...pagination import Page
 from ....schemas.timeline import TimelineEventCreate, TimelineEventUpdate
 from ...models import TimelineEvent, TimelineEventType, Case, User, Evidence
 from .base import BaseRepository, BaseRepositoryAsync, BaseRepositorySync
@@ -19,51 +20,11 @@ class TimelineEventRepository(BaseRepository[TimelineEvent, TimelineEventCreate,
     Repository for TimelineEvent model with common CRUD operations.
     """
     
+    keyset_columns = ("event_date", "id")
+    
     def __init__(self, db_session: Union[Session, AsyncSession]):
         super().__init__(TimelineEvent, db_session)
     
-    async def search(
-        self,
-        query: str,
-        *,
-        skip: int = 0,
-        limit: int = 100,
-        **filters
-    ) -> List[TimelineEvent]:
-        """
-        Search timeline events by title or description.
-        
-        Args:
-            query: Search query string
-            skip: Number of records to skip
-            limit: Maximum number of records to return
-            **filters: Additional filter criteria
-            
-        Returns:
-            List[TimelineEvent]: List of matching timeline events
-        """
-        search_condition = or_(
-            TimelineEvent.title.ilike(f"%{query}%"),
-            TimelineEvent.description.ilike(f"%{query}%")
-        )
-        
-        query_obj = select(TimelineEvent).where(search_condition).offset(skip).limit(limit)
-        
-        # Apply additional filters
-        for key, value in filters.items():
-            if hasattr(TimelineEvent, key):
-                if isinstance(value, (list, tuple)):
-                    query_obj = query_obj.where(getattr(TimelineEvent, key).in_(value))
-                else:
-                    query_obj = query_obj.where(getattr(TimelineEvent, key) == value)
-        
-        if self.is_async:
-            result = await self.db_session.execute(query_obj)
-        else:
-            result = self.db_session.execute(query_obj)
-            
-        return result.scalars().all()
-    
     async def get_by_case(
         self, 
         case_id: str, 
@@ -231,7 +192,7 @@ class TimelineEventRepositoryAsync(TimelineEventRepository, BaseRepositoryAsync[
         )
         
         await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await self._commit()
         return True
     
     async def remove_evidence(
@@ -257,7 +218,7 @@ class TimelineEventRepositoryAsync(TimelineEventRepository, BaseRepositoryAsync[
         )
         
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await self._commit()
         return result.rowcount > 0
     
     async def get_timeline_for_case(
@@ -284,6 +245,50 @@ class TimelineEventRepositoryAsync(TimelineEventRepository, BaseRepositoryAsync[
         Returns:
             List[TimelineEvent]: List of timeline events matching the criteria
         """
+        query = self._timeline_query(case_id, start_date, end_date, event_types)
+            
+        # Order by date and apply pagination
+        query = query.order_by(TimelineEvent.event_date).offset(skip).limit(limit)
+        
+        # Execute the query
+        result = await self.db_session.execute(query)
+        return list(result.scalars().all())
+    
+    async def get_timeline_for_case_keyset(
+        self, 
+        case_id: str,
+        *, 
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        event_types: Optional[List[TimelineEventType]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Page[TimelineEvent]:
+        """
+        Keyset-paginated get_timeline_for_case, ordered by (event_date, id).
+        
+        Args:
+            case_id: The ID of the case
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            event_types: Optional list of event types to include
+            cursor: ``next_cursor`` of the previous page, None for the first page
+            limit: Maximum number of records to return
+            
+        Returns:
+            Page[TimelineEvent]: The timeline events and the cursor of the next page
+        """
+        query = self._timeline_query(case_id, start_date, end_date, event_types)
+        return await self._fetch_keyset_page(query, cursor, limit)
+    
+    def _timeline_query(
+        self,
+        case_id: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        event_types: Optional[List[TimelineEventType]]
+    ):
+        """Unordered SELECT of a case's timeline events matching the filters."""
         from sqlalchemy import select
         
         query = select(TimelineEvent).where(TimelineEvent.case_id == case_id)
@@ -297,13 +302,8 @@ class TimelineEventRepositoryAsync(TimelineEventRepository, BaseRepositoryAsync[
         # Apply event type filter
         if event_types:
             query = query.where(TimelineEvent.event_type.in_(event_types))
-            
-        # Order by date and apply pagination
-        query = query.order_by(TimelineEvent.event_date).offset(skip).limit(limit)
         
-        # Execute the query
-        result = await self.db_session.execute(query)
-        return list(result.scalars().all())
+        return query
 
 
 class TimelineEventRepositorySync(TimelineEventRepository, BaseRepositorySync[TimelineEvent, TimelineEventCreate, TimelineEventUpdate]):
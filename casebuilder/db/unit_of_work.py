@@ -0,0 +1,85 @@
+"""
+Unit of work: group repository writes into one transaction.
+
+Repository methods commit on their own by default. Inside a UnitOfWork on
+their session they flush instead, so a workflow such as "upload document,
+create evidence, add timeline event, append custody" is sent in a single
+transaction and committed once, atomically, when the block exits.
+
+    async with UnitOfWork(session):
+        document = await documents.create(document_in)
+        evidence = await evidence_repo.create(evidence_in, document_id=document.id)
+        await evidence_repo.add_custody_event(evidence.id, event, user_id)
+
+Units nest: an inner unit on the same session joins the outer one, and only
+the outermost commits or rolls back.
+"""
+from typing import Any, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Key in Session.info holding the nesting depth of open units
+_DEPTH_KEY = "unit_of_work_depth"
+
+
+def in_unit_of_work(session: Union[Session, AsyncSession]) -> bool:
+    """Whether writes on ``session`` belong to an open UnitOfWork."""
+    return session.info.get(_DEPTH_KEY, 0) > 0
+
+
+class UnitOfWork:
+    """
+    Context manager deferring repository commits to a single commit at exit.
+
+    Use ``async with`` for an AsyncSession and ``with`` for a Session. The
+    transaction is committed when the outermost block exits normally and
+    rolled back when it exits with an exception.
+
+    Args:
+        session: The session the repositories taking part share
+    """
+
+    def __init__(self, session: Union[Session, AsyncSession]):
+        self.session = session
+
+    def _enter(self) -> None:
+        """Open the unit, or join the one already open on the session."""
+        self.session.info[_DEPTH_KEY] = self.session.info.get(_DEPTH_KEY, 0) + 1
+
+    def _leave(self) -> bool:
+        """Close the unit; True if it was the outermost one."""
+        depth = self.session.info[_DEPTH_KEY] - 1
+        if depth:
+            self.session.info[_DEPTH_KEY] = depth
+        else:
+            del self.session.info[_DEPTH_KEY]
+        return depth == 0
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if not isinstance(self.session, AsyncSession):
+            raise RuntimeError("Use 'with' for sync sessions")
+        self._enter()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if not self._leave():
+            return
+        if exc_type is None:
+            await self.session.commit()
+        else:
+            await self.session.rollback()
+
+    def __enter__(self) -> "UnitOfWork":
+        if isinstance(self.session, AsyncSession):
+            raise RuntimeError("Use 'async with' for async sessions")
+        self._enter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if not self._leave():
+            return
+        if exc_type is None:
+            self.session.commit()
+        else:
+            self.session.rollback()
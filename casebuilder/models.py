@@ -1,6 +1,6 @@
 # casebuilder/models.py - Database models and API schemas
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.sql import func
 from pydantic import BaseModel
 from typing import Optional
@@ -13,6 +13,10 @@ from .database import Base
 # This defines the `evidence` table in our database
 class Evidence(Base):
     __tablename__ = "evidence"
+    __table_args__ = (
+        # Keyset pagination order within a case
+        Index("ix_evidence_case_created_at_id", "case_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, index=True)
@@ -0,0 +1,211 @@
+"""
+Keyset (cursor) pagination.
+
+Instead of ``OFFSET n``, which makes the database walk past every skipped
+row, a keyset page continues from the last row of the previous page:
+``WHERE (created_at, id) > (:last_created_at, :last_id) ORDER BY created_at,
+id LIMIT :n``. With an index on the key columns every page costs the same,
+however deep. The position is handed to clients as an opaque continuation
+token (see encode_cursor); the key columns must be unique together, which
+is why they end with the primary key.
+
+Offset pages that also report the total number of matches get it from the
+same statement: a ``count(*) OVER ()`` column carries the total on every
+row (see counted_select), instead of a second, separately filtered COUNT.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from operator import itemgetter
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import DateTime, String, func, literal, select, text, tuple_, type_coerce
+from sqlalchemy.exc import CompileError
+from sqlalchemy.sql import Select
+
+T = TypeVar("T")
+
+# Page size when a client asks for a page without giving one
+DEFAULT_PAGE_SIZE = 50
+
+# Largest page a client may ask for
+MAX_PAGE_SIZE = 500
+
+# Response header carrying the continuation token of list endpoints
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Estimated totals below this are counted exactly even when an estimate was asked for
+APPROXIMATE_COUNT_THRESHOLD = 10_000
+
+
+class InvalidCursor(ValueError):
+    """A continuation token that was not produced for this listing."""
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a listing."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None  # None on the last page (keyset pages)
+    total: Optional[int] = None  # Matches across all pages (counted pages)
+    total_is_estimate: bool = False  # total is a planner estimate, not a count
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque, URL-safe token for the key values of a page's last row."""
+    payload = []
+    for value in values:
+        if isinstance(value, datetime):
+            value = {"dt": value.isoformat()}
+        elif isinstance(value, date):
+            value = {"d": value.isoformat()}
+        payload.append(value)
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str, size: int) -> List[Any]:
+    """Key values from a token made by encode_cursor.
+
+    Raises:
+        InvalidCursor: If the token is malformed or has the wrong number of keys
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursor("Malformed pagination cursor") from e
+    if not isinstance(payload, list) or len(payload) != size:
+        raise InvalidCursor("Pagination cursor does not match this listing")
+    values = []
+    for value in payload:
+        if isinstance(value, dict):
+            try:
+                if "dt" in value:
+                    value = datetime.fromisoformat(value["dt"])
+                elif "d" in value:
+                    value = date.fromisoformat(value["d"])
+                else:
+                    raise InvalidCursor("Malformed pagination cursor")
+            except (TypeError, ValueError) as e:
+                raise InvalidCursor("Malformed pagination cursor") from e
+        values.append(value)
+    return values
+
+
+def _comparable(column: Any, dialect_name: str) -> Any:
+    # SQLite keeps datetimes as text, and not always in the format a bound
+    # datetime is rendered in (server defaults drop the microseconds), so
+    # compare and continue from the stored text itself: the same ordering
+    # ORDER BY uses.
+    if dialect_name == "sqlite" and isinstance(column.type, DateTime):
+        return type_coerce(column, String)
+    return column
+
+
+def keyset_select(
+    query: Select,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    limit: int,
+    dialect_name: str,
+    descending: bool = False
+) -> Select:
+    """Turn ``query`` into a keyset page query.
+
+    The key columns replace any existing ordering and are appended to the
+    selected columns (build_page strips them again); one row more than
+    ``limit`` is fetched to tell whether another page follows.
+
+    Args:
+        query: SELECT of the entity being listed, with its filters applied
+        columns: Key columns, unique together (e.g. created_at, id)
+        cursor: Token from the previous page, or None for the first page
+        limit: Page size
+        dialect_name: Database backend name
+        descending: Newest (largest keys) first
+
+    Raises:
+        InvalidCursor: If ``cursor`` does not belong to this listing
+    """
+    keys = [_comparable(column, dialect_name) for column in columns]
+    if cursor is not None:
+        values = decode_cursor(cursor, len(keys))
+        bound = tuple_(*(literal(value, key.type) for key, value in zip(keys, values)))
+        position = tuple_(*keys)
+        query = query.where(position < bound if descending else position > bound)
+    return (
+        query
+        .add_columns(*(key.label(f"_cursor_{i}") for i, key in enumerate(keys)))
+        .order_by(None)
+        .order_by(*(key.desc() if descending else key.asc() for key in keys))
+        .limit(limit + 1)
+    )
+
+
+def build_page(rows: Sequence[Any], limit: int) -> Page:
+    """Page from the rows of a keyset_select query."""
+    rows = list(rows)
+    items = [row[0] for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(tuple(rows[limit - 1])[1:])
+    return Page(items, next_cursor)
+
+
+def counted_select(query: Select, skip: int, limit: int) -> Select:
+    """Offset page of ``query`` with the total match count appended to every row.
+
+    The window is evaluated before OFFSET/LIMIT, so it counts every row the
+    filters match; build_counted_page takes it back off.
+    """
+    return query.add_columns(func.count().over().label("_total")).offset(skip).limit(limit)
+
+
+def count_select(query: Select) -> Select:
+    """SELECT count(*) of the rows ``query`` matches."""
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def build_counted_page(
+    rows: Sequence[Any],
+    skip: int,
+    item: Callable[[Any], Any] = itemgetter(0)
+) -> Page:
+    """Page from the rows of a counted_select query.
+
+    ``total`` is None when an offset past the end left no row to carry it;
+    run count_select for it then.
+    """
+    rows = list(rows)
+    if rows:
+        total = rows[0][-1]
+    else:
+        total = 0 if skip == 0 else None
+    return Page([item(row) for row in rows], total=total)
+
+
+def estimate_select(query: Select, dialect: Any) -> Optional[Any]:
+    """Statement returning the query planner's row estimate for ``query``.
+
+    Only PostgreSQL keeps statistics to estimate from (EXPLAIN, which does
+    not run the query); None for other backends, and for queries whose
+    parameters cannot be rendered inline.
+    """
+    if dialect.name != "postgresql":
+        return None
+    try:
+        sql = str(query.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    except (CompileError, NotImplementedError):
+        return None
+    # Colons in the rendered literals are not bind parameters
+    return text("EXPLAIN (FORMAT JSON) " + sql.replace(":", r"\:"))
+
+
+def parse_estimate(plan: Any) -> int:
+    """Estimated row count from the output of an estimate_select statement."""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,163 @@
+"""
+Content-Addressable Evidence Store
+
+Keeps every evidence blob exactly once, under its SHA-256, in a two-level
+fan-out (``objects/ab/abcdef...``). Organized layouts and uploads refer to
+blobs by hash, so the same file filed under several schemes or uploaded
+twice costs its bytes once. Blobs are made read-only: they are shared by
+every hardlinked view, and an in-place edit of one view would otherwise
+silently change all of them.
+"""
+
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Union
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+LINK_MODES = ("hardlink", "symlink", "copy")
+
+
+class StoredBlob(NamedTuple):
+    """Result of putting content into the store."""
+    file_hash: str
+    path: Path
+    size: int
+    created: bool  # False when the content was already stored
+
+
+class ContentStore:
+    """
+    SHA-256 keyed blob store on the local filesystem.
+
+    Writes go to a temporary file inside the store and are renamed into
+    place, so a blob is either complete or absent, and concurrent writers of
+    the same content simply race to an identical result.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding ``objects/`` and ``tmp/``
+        """
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.tmp = self.root / "tmp"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.tmp.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, file_hash: str) -> Path:
+        """Location of a blob (whether or not it exists)."""
+        return self.objects / file_hash[:2] / file_hash
+
+    def has(self, file_hash: str) -> bool:
+        """Whether content with this SHA-256 is already stored."""
+        return self.path_for(file_hash).exists()
+
+    def put_file(self, source: Union[str, Path], file_hash: str = "") -> StoredBlob:
+        """Store the content of a file.
+
+        Args:
+            source: File to store
+            file_hash: Its SHA-256, when already known. If a blob with that
+                hash is stored, the file is re-hashed (read, not written)
+                and the blob reused only when the hash still matches, so a
+                stale hash never puts old bytes behind a new file
+
+        Returns:
+            StoredBlob describing the stored content
+        """
+        if file_hash and self.has(file_hash):
+            actual = self._hash_file(source)
+            if actual == file_hash:
+                blob = self.path_for(file_hash)
+                return StoredBlob(file_hash, blob, blob.stat().st_size, False)
+            logger.warning(f"Stale hash {file_hash} for {source}; storing its current content")
+        with open(source, "rb") as f:
+            return self.put_stream(f)
+
+    def put_stream(self, stream: BinaryIO) -> StoredBlob:
+        """Store everything readable from a binary stream (e.g. an upload).
+
+        Returns:
+            StoredBlob describing the stored content
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=self.tmp)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            return self._commit(tmp_name, digest.hexdigest(), size)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    def link(self, file_hash: str, dest: Union[str, Path], mode: str = "hardlink") -> str:
+        """Materialize a stored blob at ``dest``.
+
+        Args:
+            file_hash: SHA-256 of a stored blob
+            dest: Path of the view to create (replaced if it exists)
+            mode: 'hardlink', 'symlink' or 'copy'. A hardlink across
+                filesystems falls back to a symlink.
+
+        Returns:
+            The mode actually used
+        """
+        if mode not in LINK_MODES:
+            raise ValueError(f"mode must be one of {LINK_MODES}, got {mode!r}")
+        blob = self.path_for(file_hash)
+        if not blob.exists():
+            raise FileNotFoundError(f"No stored content for {file_hash}")
+        dest = Path(dest)
+        if dest.is_symlink() or dest.exists():
+            dest.unlink()
+
+        if mode == "hardlink":
+            try:
+                os.link(blob, dest)
+                return "hardlink"
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+                mode = "symlink"
+        if mode == "symlink":
+            os.symlink(blob.resolve(), dest)
+            return "symlink"
+        shutil.copyfile(blob, dest)
+        return "copy"
+
+    @staticmethod
+    def _hash_file(source: Union[str, Path]) -> str:
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _commit(self, tmp_name: str, file_hash: str, size: int) -> StoredBlob:
+        blob = self.path_for(file_hash)
+        if blob.exists():
+            return StoredBlob(file_hash, blob, size, False)
+        blob.parent.mkdir(exist_ok=True)
+        os.chmod(tmp_name, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(tmp_name, blob)
+        logger.debug(f"Stored {size} bytes as {file_hash}")
+        return StoredBlob(file_hash, blob, size, True)
@@ -0,0 +1,329 @@
+"""
+Directory Watcher
+
+Linux inotify watch mode for FileBossIntegrator. A DirectoryWatcher
+reconciles a case folder once against the metadata index, then turns
+filesystem events into debounced, coalesced batches of work: changed files
+are processed through the integrator and recorded in the index, removed
+ones are marked deleted, and each change is announced on an event bus
+(e.g. the sigma_core EventBus) instead of rescanning the whole tree.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from casebuilder.services.fileboss_integration import (
+    EXCLUDED_DIRS, FileBossIntegrator, FileMetadata
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Events emitted on the event bus
+DOCUMENT_UPLOADED = "document_uploaded"
+DOCUMENT_DELETED = "document_deleted"
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Work item kinds, coalesced per path
+CHANGED = "changed"
+DELETED = "deleted"
+
+
+class Inotify:
+    """Minimal ctypes binding to the Linux inotify API."""
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def add_watch(self, path: str, mask: int = WATCH_MASK) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._rm_watch(self.fd, wd)
+
+    def read(self) -> List[tuple]:
+        """Drain pending events as (wd, mask, cookie, name) tuples."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                events.append((wd, mask, cookie, os.fsdecode(name)))
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class DirectoryWatcher:
+    """
+    Keep a FileBossIntegrator's metadata index in step with a directory tree.
+
+    ``run`` adds an inotify watch on every directory (skipping the
+    integrator's excluded directory names), reconciles the tree once with
+    iter_directory, then waits for events. Events for the same path are
+    coalesced and a batch is handled once the tree has been quiet for
+    ``debounce`` seconds (or ``max_delay`` after its first event, under
+    constant churn). Only a kernel queue overflow triggers another full
+    reconcile.
+    """
+
+    def __init__(
+        self,
+        integrator: FileBossIntegrator,
+        directory: Union[str, Path],
+        event_bus: Any = None,
+        case_id: Optional[str] = None,
+        evidence_id: Optional[str] = None,
+        file_types: Optional[List[str]] = None,
+        debounce: float = 0.5,
+        max_delay: float = 5.0
+    ):
+        """Initialize the watcher.
+
+        Args:
+            integrator: Integrator that processes files (ideally with a metadata index)
+            directory: Root of the tree to watch
+            event_bus: Object with ``emit_async(event_name, data)``, such as
+                the sigma_core EventBus; events are skipped when None
+            case_id: Optional case ID to associate with files
+            evidence_id: Optional evidence ID to associate with files
+            file_types: List of file types to include (e.g., ['document', 'image'])
+            debounce: Quiet period before a batch of events is handled
+            max_delay: Longest a pending event waits under continuous activity
+        """
+        self.integrator = integrator
+        self.directory = Path(os.path.abspath(directory))
+        self.event_bus = event_bus
+        self.case_id = case_id
+        self.evidence_id = evidence_id
+        self.file_types = file_types
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.ready = asyncio.Event()
+        self._extensions = integrator._wanted_extensions(file_types)
+        self._excluded_dirs = frozenset(integrator.config.get('excluded_dirs', EXCLUDED_DIRS))
+        self._inotify: Optional[Inotify] = None
+        self._watches: Dict[int, str] = {}
+        self._pending: Dict[str, str] = {}
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._overflowed = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    async def run(self) -> None:
+        """Watch until ``stop`` is called (or the task is cancelled)."""
+        loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._inotify = Inotify()
+        # Watches go in before the reconcile so nothing changing during it is missed
+        self._watch_tree(str(self.directory))
+        loop.add_reader(self._inotify.fd, self._on_readable)
+        try:
+            await self._reconcile()
+            self.ready.set()
+            while not self._stopping.is_set():
+                await self._wait_for_batch()
+                if self._overflowed:
+                    self._overflowed = False
+                    self._pending.clear()
+                    logger.warning(f"inotify queue overflowed; rescanning {self.directory}")
+                    await self._reconcile()
+                elif self._pending:
+                    await self._handle_batch()
+        finally:
+            loop.remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._watches.clear()
+
+    def stop(self) -> None:
+        """Ask ``run`` to return once the current batch is handled."""
+        if self._stopping is not None:
+            self._stopping.set()
+            self._wakeup.set()
+
+    async def _wait_for_batch(self) -> None:
+        """Sleep until pending events have settled, or until stopped."""
+        self._wakeup.clear()
+        if not self._pending and not self._overflowed:
+            await self._wakeup.wait()
+        while self._pending and not self._stopping.is_set() and not self._overflowed:
+            now = time.monotonic()
+            settle = min(self._last_event + self.debounce, self._first_event + self.max_delay)
+            if now >= settle:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settle - now)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _reconcile(self) -> None:
+        """Bring the index up to date with one pass over the whole tree."""
+        async for metadata in self.integrator.iter_directory(
+            self.directory, self.case_id, self.evidence_id,
+            file_types=self.file_types, changes_only=True
+        ):
+            await self._emit(DOCUMENT_UPLOADED, self._payload(metadata, "reconciled"))
+        if self.integrator.last_scan is not None:
+            for path in self.integrator.last_scan.deleted_paths:
+                await self._emit(DOCUMENT_DELETED, {"path": path, "case_id": self.case_id})
+
+    async def _handle_batch(self) -> None:
+        """Process the coalesced work items gathered since the last batch."""
+        pending, self._pending = self._pending, {}
+        changed = [path for path, kind in pending.items() if kind == CHANGED]
+        deleted = [path for path, kind in pending.items() if kind == DELETED]
+
+        for path in deleted:
+            removed = (self.integrator.index.mark_deleted(path)
+                       if self.integrator.index is not None else [path])
+            for removed_path in removed:
+                await self._emit(DOCUMENT_DELETED, {"path": removed_path, "case_id": self.case_id})
+
+        for metadata in await self.integrator.process_files(changed, self.case_id, self.evidence_id):
+            await self._emit(DOCUMENT_UPLOADED, self._payload(metadata, "changed"))
+
+    def _on_readable(self) -> None:
+        """Loop reader callback: fold raw inotify events into pending work items."""
+        now = time.monotonic()
+        for wd, mask, _cookie, name in self._inotify.read():
+            if mask & IN_Q_OVERFLOW:
+                self._overflowed = True
+                continue
+            directory = self._watches.get(wd)
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if directory is None or mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                continue
+            path = os.path.join(directory, name)
+
+            if mask & IN_ISDIR:
+                if name in self._excluded_dirs:
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files may land before the new watch exists, so queue what is there
+                    for file_path in self._watch_tree(path):
+                        self._queue(file_path, CHANGED, now)
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    self._queue(path, DELETED, now)
+                continue
+
+            if os.path.splitext(name)[1].lower() not in self._extensions:
+                continue
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                self._queue(path, DELETED, now)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE):
+                self._queue(path, CHANGED, now)
+
+        if self._pending or self._overflowed:
+            self._wakeup.set()
+
+    def _queue(self, path: str, kind: str, now: float) -> None:
+        if not self._pending:
+            self._first_event = now
+        self._last_event = now
+        # The latest event wins: delete-then-recreate is a change, write-then-delete a delete
+        self._pending.pop(path, None)
+        self._pending[path] = kind
+
+    def _watch_tree(self, root: str) -> List[str]:
+        """Watch ``root`` and every directory below it; return the files found."""
+        files = []
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                self._watches[self._inotify.add_watch(directory)] = directory
+            except OSError as e:
+                if e.errno == errno.ENOSPC:
+                    logger.error(f"inotify watch limit reached at {directory}; "
+                                 f"raise fs.inotify.max_user_watches")
+                else:
+                    logger.warning(f"Could not watch {directory}: {e}")
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self._excluded_dirs:
+                                stack.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in self._extensions:
+                            files.append(entry.path)
+            except OSError as e:
+                logger.warning(f"Could not scan directory {directory}: {e}")
+        return files
+
+    async def _emit(self, event_name: str, data: Dict[str, Any]) -> None:
+        if self.event_bus is None:
+            return
+        try:
+            await self.event_bus.emit_async(event_name, data)
+        except Exception as e:
+            logger.error(f"Error emitting {event_name} for {data.get('path')}: {e}")
+
+    def _payload(self, metadata: FileMetadata, change: str) -> Dict[str, Any]:
+        return {
+            "path": str(metadata.path),
+            "name": metadata.name,
+            "size": metadata.size,
+            "file_type": metadata.file_type.name.lower(),
+            "mime_type": metadata.mime_type,
+            "modified": metadata.modified,
+            "case_id": metadata.case_id,
+            "evidence_id": metadata.evidence_id,
+            "change": change
+        }
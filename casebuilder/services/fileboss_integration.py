@@ -6,12 +6,24 @@ functionality, allowing for unified file processing, organization, and analysis.
 """
 
 import os
+import sys
+import hashlib
 import logging
 import asyncio
+import mimetypes
+import multiprocessing
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Tuple
+from stat import S_ISREG
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+)
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from enum import Enum, auto
+from functools import cached_property
 import shutil
 import json
 from datetime import datetime
@@ -19,6 +31,83 @@ from datetime import datetime
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Default bound on files in flight in process_directory's concurrent mode
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Scan entries fetched per trip to the scanning thread in iter_directory
+SCAN_BATCH_SIZE = 256
+
+# Directory names never descended into when scanning (VCS metadata, virtualenvs, caches)
+EXCLUDED_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__',
+    '.venv', 'venv', '.tox', '.nox', '.mypy_cache', '.pytest_cache'
+})
+
+# Bytes read from each end of a file for its partial fingerprint
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024
+
+# Read size when computing a full SHA-256
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Scan dictionary keys already held as FileMetadata fields (not repeated in .metadata)
+_SCAN_FIELDS = frozenset({
+    'path', 'name', 'extension', 'size', 'created', 'modified', 'type', 'fingerprint'
+})
+
+# FileProcessor instance owned by each process-pool worker
+_worker_file_processor = None
+
+def _init_file_processor_worker(processor_cls: type, fs_config: Any) -> None:
+    """Process-pool initializer: build one FileProcessor per worker process."""
+    global _worker_file_processor
+    _worker_file_processor = processor_cls(fs_config)
+
+def _process_file_in_worker(path: Union[str, Path]) -> Dict[str, Any]:
+    """Run FileProcessor.process_file inside a process-pool worker."""
+    return _worker_file_processor.process_file(path)
+
+def _process_pool_context():
+    """forkserver where the platform has it, otherwise spawn.
+    
+    Never fork: by the time the pool starts, the event loop's worker
+    threads are running and a forked child could inherit a held lock.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+def file_fingerprint(path: Union[str, Path], size: int, modified: float,
+                     sample_size: int = FINGERPRINT_SAMPLE_SIZE) -> str:
+    """Cheap change detector: size, mtime and a SHA-256 of the first and last ``sample_size`` bytes.
+    
+    Reads at most ``2 * sample_size`` bytes whatever the file size, so it can be
+    recomputed on every scan of multi-gigabyte media. Equal fingerprints do not
+    prove equal content; use compute_sha256 for that.
+    """
+    digest = hashlib.sha256(f"{size}:{modified!r}:".encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(sample_size))
+        if size > sample_size:
+            f.seek(max(size - sample_size, sample_size))
+            digest.update(f.read(sample_size))
+    return digest.hexdigest()
+
+def compute_sha256(path: Union[str, Path]) -> str:
+    """Full SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+async def _as_async_iter(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    """Iterate a plain or async iterable with ``async for``."""
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
 class FileType(Enum):
     """Supported file types for processing."""
     DOCUMENT = auto()
@@ -30,9 +119,14 @@ class FileType(Enum):
     DATA = auto()
     OTHER = auto()
 
-@dataclass
+@dataclass(slots=True)
 class FileMetadata:
-    """Metadata for files being processed."""
+    """Metadata for files being processed.
+    
+    Slotted, so an instance carries no ``__dict__``. ``metadata`` holds what
+    the scan found beyond these fields (such as the inode) plus the
+    FileSystemMaster ``process_file`` output.
+    """
     path: Path
     name: str
     size: int
@@ -42,11 +136,124 @@ class FileMetadata:
     created: float
     modified: float
     hash: str = ""
+    fingerprint: str = ""
     case_id: Optional[str] = None
     evidence_id: Optional[str] = None
     tags: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+class FileMetadataBatch:
+    """
+    Columnar container for the metadata of many files.
+    
+    Sizes, times and type codes live in typed arrays, and extension and MIME
+    strings are stored once each and referenced by code, so a batch costs a
+    small fraction of the equivalent FileMetadata objects. It is meant for
+    bulk work over large scans (totals, counts, filtering) that does not
+    need per-file processing output; indexing a batch materializes a
+    FileMetadata on demand.
+    """
+    
+    _FILE_TYPES = list(FileType)
+    _TYPE_CODES = {file_type: code for code, file_type in enumerate(_FILE_TYPES)}
+    
+    def __init__(self):
+        self.paths: List[str] = []
+        self.sizes = array('q')
+        self.modified = array('d')
+        self.created = array('d')
+        self.type_codes = array('B')
+        self.extension_codes = array('H')
+        self.mime_codes = array('H')
+        self.extensions: List[str] = []
+        self.mime_types: List[str] = []
+        self._extension_codes: Dict[str, int] = {}
+        self._mime_codes: Dict[str, int] = {}
+    
+    @classmethod
+    def from_metadata(cls, files: Iterable[FileMetadata]) -> 'FileMetadataBatch':
+        """Build a batch from FileMetadata objects."""
+        batch = cls()
+        for metadata in files:
+            batch.append(
+                metadata.path, metadata.size, metadata.modified, metadata.created,
+                metadata.file_type, metadata.extension, metadata.mime_type
+            )
+        return batch
+    
+    def append(
+        self,
+        path: Union[str, Path],
+        size: int,
+        modified: float,
+        created: float,
+        file_type: FileType,
+        extension: str,
+        mime_type: str
+    ) -> None:
+        """Add one file to the batch."""
+        self.paths.append(str(path))
+        self.sizes.append(size)
+        self.modified.append(modified)
+        self.created.append(created)
+        self.type_codes.append(self._TYPE_CODES[file_type])
+        self.extension_codes.append(self._code(extension, self.extensions, self._extension_codes))
+        self.mime_codes.append(self._code(mime_type, self.mime_types, self._mime_codes))
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def __getitem__(self, i: int) -> FileMetadata:
+        path = Path(self.paths[i])
+        return FileMetadata(
+            path=path,
+            name=path.name,
+            size=self.sizes[i],
+            file_type=self._FILE_TYPES[self.type_codes[i]],
+            extension=self.extensions[self.extension_codes[i]],
+            mime_type=self.mime_types[self.mime_codes[i]],
+            created=self.created[i],
+            modified=self.modified[i]
+        )
+    
+    def __iter__(self) -> Iterator[FileMetadata]:
+        return (self[i] for i in range(len(self)))
+    
+    def total_size(self, file_type: Optional[FileType] = None) -> int:
+        """Total bytes, optionally of one file type only."""
+        if file_type is None:
+            return sum(self.sizes)
+        code = self._TYPE_CODES[file_type]
+        return sum(size for size, c in zip(self.sizes, self.type_codes) if c == code)
+    
+    def counts_by_type(self) -> Dict[FileType, int]:
+        """Number of files of each file type present."""
+        counts = [0] * len(self._FILE_TYPES)
+        for code in self.type_codes:
+            counts[code] += 1
+        return {ft: n for ft, n in zip(self._FILE_TYPES, counts) if n}
+    
+    def select(
+        self,
+        file_type: Optional[FileType] = None,
+        modified_after: Optional[float] = None
+    ) -> List[int]:
+        """Positions of the files matching every given criterion."""
+        code = None if file_type is None else self._TYPE_CODES[file_type]
+        return [
+            i for i in range(len(self))
+            if (code is None or self.type_codes[i] == code)
+            and (modified_after is None or self.modified[i] > modified_after)
+        ]
+    
+    @staticmethod
+    def _code(value: str, values: List[str], codes: Dict[str, int]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
 class FileBossIntegrator:
     """
     Integrates FileBoss/FileSystemMaster functionality with CaseBuilder.
@@ -62,6 +269,21 @@ class FileBossIntegrator:
             config: Configuration dictionary for the integrator
         """
         self.config = config or {}
+        # None: no hashing; 'fingerprint': partial fingerprint, full SHA-256 on demand;
+        # 'full': full SHA-256 of every processed file
+        self.hash_mode = self.config.get('hash_mode')
+        if self.hash_mode not in (None, 'fingerprint', 'full'):
+            raise ValueError(f"hash_mode must be None, 'fingerprint' or 'full', got {self.hash_mode!r}")
+        self._process_pool: Optional[Executor] = None
+        self.index = None
+        self.last_scan = None
+        if self.config.get('index_path'):
+            from casebuilder.services.metadata_index import FileMetadataIndex
+            self.index = FileMetadataIndex(self.config['index_path'])
+        self.content_store = None
+        if self.config.get('content_store_path'):
+            from casebuilder.services.content_store import ContentStore
+            self.content_store = ContentStore(self.config['content_store_path'])
         self._initialize_components()
     
     def _initialize_components(self) -> None:
@@ -100,7 +322,8 @@ class FileBossIntegrator:
         case_id: Optional[str] = None,
         evidence_id: Optional[str] = None,
         recursive: bool = True,
-        file_types: Optional[List[str]] = None
+        file_types: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None
     ) -> List[FileMetadata]:
         """Process all files in a directory and return metadata.
         
@@ -110,14 +333,30 @@ class FileBossIntegrator:
             evidence_id: Optional evidence ID to associate with files
             recursive: Whether to process subdirectories
             file_types: List of file types to include (e.g., ['document', 'image'])
+            max_concurrency: Files processed at once. Above 1 this collects
+                iter_directory, which scans in a thread and runs
+                ``process_file`` in a process pool, so the event loop is
+                never blocked. Defaults to ``config['max_concurrency']``,
+                or 1 (one file at a time, as before). With a metadata index
+                (``config['index_path']``) the files are always collected
+                from iter_directory so unchanged files come from the index.
             
         Returns:
-            List of FileMetadata objects for processed files
+            List of FileMetadata objects for processed files, in scan order
         """
         directory = Path(directory)
         if not directory.exists() or not directory.is_dir():
             raise NotADirectoryError(f"Directory not found: {directory}")
         
+        if max_concurrency is None:
+            max_concurrency = self.config.get('max_concurrency', 1)
+        if max_concurrency > 1 or self.index is not None:
+            return [
+                metadata async for metadata in self.iter_directory(
+                    directory, case_id, evidence_id, recursive, file_types, max_concurrency
+                )
+            ]
+        
         # Get list of files to process
         files = self._scan_directory(directory, recursive, file_types)
         
@@ -142,35 +381,334 @@ class FileBossIntegrator:
         
         return processed_files
     
+    async def iter_directory(
+        self,
+        directory: Union[str, Path],
+        case_id: Optional[str] = None,
+        evidence_id: Optional[str] = None,
+        recursive: bool = True,
+        file_types: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        changes_only: bool = False
+    ) -> AsyncIterator[FileMetadata]:
+        """Process a directory, yielding each file's metadata as soon as it is ready.
+        
+        Streaming counterpart of process_directory: the scan is consumed in
+        small batches on a worker thread, at most ``max_concurrency`` files
+        are processed at once (``process_file`` off the event loop, see
+        _run_process_file), and results are yielded in scan order. Memory
+        stays constant however large the tree is, and leaving the ``async
+        for`` early cancels the files still in flight.
+        
+        With a metadata index (``config['index_path']``) unchanged files are
+        yielded from the index without being processed again, and once the
+        whole directory has been read, indexed files no longer found in it
+        are marked deleted; the counts are left in ``self.last_scan``.
+        ``changes_only`` then yields only the files that were (re)processed.
+        
+        Args:
+            directory: Directory to process
+            case_id: Optional case ID to associate with files
+            evidence_id: Optional evidence ID to associate with files
+            recursive: Whether to process subdirectories
+            file_types: List of file types to include (e.g., ['document', 'image'])
+            max_concurrency: Files processed at once. Defaults to
+                ``config['max_concurrency']``, or DEFAULT_MAX_CONCURRENCY.
+            changes_only: Skip files served unchanged from the metadata index
+            
+        Yields:
+            FileMetadata for each processed file; failed files are logged and skipped
+        """
+        directory = Path(directory)
+        if not directory.exists() or not directory.is_dir():
+            raise NotADirectoryError(f"Directory not found: {directory}")
+        
+        if max_concurrency is None:
+            max_concurrency = self.config.get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
+        max_concurrency = max(1, max_concurrency)
+        
+        scan_id = None
+        if self.index is not None:
+            directory = Path(os.path.abspath(directory))
+            scan_id = await asyncio.to_thread(self.index.begin_scan, directory)
+        
+        scan = self._iter_scan_directory(directory, recursive, file_types)
+        in_flight: Deque[asyncio.Task] = deque()
+        pending_batch: Optional[asyncio.Task] = None
+        try:
+            while True:
+                # Shielded: cancelling us must not abandon the worker thread
+                # while it is still inside the scan generator
+                pending_batch = asyncio.ensure_future(
+                    asyncio.to_thread(list, islice(scan, SCAN_BATCH_SIZE))
+                )
+                batch = await asyncio.shield(pending_batch)
+                pending_batch = None
+                for file_info in batch:
+                    if len(in_flight) >= max_concurrency:
+                        metadata = await in_flight.popleft()
+                        if metadata is not None:
+                            yield metadata
+                    in_flight.append(asyncio.ensure_future(
+                        self._process_file_info(
+                            file_info, case_id, evidence_id, scan_id, changes_only
+                        )
+                    ))
+                if len(batch) < SCAN_BATCH_SIZE:
+                    break
+            
+            while in_flight:
+                metadata = await in_flight.popleft()
+                if metadata is not None:
+                    yield metadata
+            
+            if scan_id is not None:
+                self.last_scan = await asyncio.to_thread(
+                    self.index.finish_scan, scan_id, recursive, self._wanted_extensions(file_types)
+                )
+                scan_id = None
+        finally:
+            if scan_id is not None:
+                # The consumer stopped early (or we failed); the scan never finishes
+                self.index.discard_scan(scan_id)
+            for task in in_flight:
+                task.cancel()
+            if pending_batch is not None:
+                # Let the thread finish its batch before the generator is closed
+                await asyncio.wait({pending_batch})
+                if not pending_batch.cancelled():
+                    pending_batch.exception()
+            scan.close()
+    
+    async def _process_file_info(
+        self,
+        file_info: Dict,
+        case_id: Optional[str],
+        evidence_id: Optional[str],
+        scan_id: Optional[int] = None,
+        changes_only: bool = False
+    ) -> Optional[FileMetadata]:
+        """Enhance and process one scanned file off the event loop; None on error.
+        
+        With a ``scan_id`` the metadata index is consulted first and updated
+        with the result; ``changes_only`` returns None for unchanged files.
+        """
+        try:
+            if scan_id is not None:
+                metadata = await asyncio.to_thread(self._lookup_indexed, scan_id, file_info)
+                if metadata is not None:
+                    if changes_only:
+                        return None
+                    metadata.case_id = case_id
+                    metadata.evidence_id = evidence_id
+                    return metadata
+            
+            metadata = await self._enhance_metadata(file_info)
+            metadata.case_id = case_id
+            metadata.evidence_id = evidence_id
+            if scan_id is not None and self.hash_mode == 'fingerprint':
+                await self._carry_forward_hash(metadata)
+            
+            processed_data = await self._run_process_file(file_info['path'])
+            metadata.metadata.update(processed_data)
+            if scan_id is not None:
+                await asyncio.to_thread(
+                    self.index.record, scan_id, metadata, processed_data, file_info.get('inode')
+                )
+            return metadata
+            
+        except Exception as e:
+            logger.error(f"Error processing file {file_info['path']}: {e}")
+            if scan_id is not None:
+                # Keep the old row (it is retried next scan) rather than marking it deleted
+                await asyncio.to_thread(self.index.touch, scan_id, file_info['path'])
+            return None
+    
+    def _lookup_indexed(self, scan_id: int, file_info: Dict) -> Optional[FileMetadata]:
+        """Fingerprint (in 'fingerprint' mode) and look up a scanned file; runs off the loop."""
+        if self.hash_mode == 'fingerprint':
+            # Catches edits that keep size and mtime, for 128 KiB of reading
+            file_info['fingerprint'] = file_fingerprint(
+                file_info['path'], file_info['size'], file_info['modified']
+            )
+        return self.index.lookup(scan_id, file_info)
+    
+    async def process_files(
+        self,
+        paths: Iterable[Union[str, Path]],
+        case_id: Optional[str] = None,
+        evidence_id: Optional[str] = None,
+        max_concurrency: Optional[int] = None
+    ) -> List[FileMetadata]:
+        """Process specific files, e.g. those a DirectoryWatcher saw change.
+        
+        Paths that no longer exist or have an unsupported extension are
+        skipped. With a metadata index the processed files are recorded in it
+        (nothing is marked deleted) and ``self.last_scan`` covers this batch.
+        
+        Args:
+            paths: Files to process
+            case_id: Optional case ID to associate with files
+            evidence_id: Optional evidence ID to associate with files
+            max_concurrency: Files processed at once (see iter_directory)
+            
+        Returns:
+            List of FileMetadata objects for processed files, in input order
+        """
+        file_infos = [info for info in map(self._stat_file_info, paths) if info is not None]
+        if not file_infos:
+            return []
+        if max_concurrency is None:
+            max_concurrency = self.config.get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        scan_id = None
+        if self.index is not None:
+            scan_id = await asyncio.to_thread(
+                self.index.begin_scan,
+                os.path.commonpath([os.path.dirname(str(info['path'])) for info in file_infos])
+            )
+        
+        async def process_one(file_info: Dict) -> Optional[FileMetadata]:
+            async with semaphore:
+                return await self._process_file_info(file_info, case_id, evidence_id, scan_id)
+        
+        try:
+            results = await asyncio.gather(*(process_one(info) for info in file_infos))
+        except BaseException:
+            if scan_id is not None:
+                self.index.discard_scan(scan_id)
+            raise
+        if scan_id is not None:
+            self.last_scan = await asyncio.to_thread(
+                self.index.finish_scan, scan_id, mark_missing=False
+            )
+        return [metadata for metadata in results if metadata is not None]
+    
+    async def _run_process_file(self, path: Union[str, Path]) -> Dict[str, Any]:
+        """Run the synchronous FileProcessor.process_file off the event loop.
+        
+        Uses a process pool of ``config['process_workers']`` workers (default:
+        CPU count), each with its own FileProcessor. ``process_workers: 0``
+        runs it on the default thread pool with this integrator's processor.
+        The pool is kept for later calls until close() (or the end of an
+        ``async with`` block on the integrator).
+        """
+        loop = asyncio.get_running_loop()
+        if self.config.get('process_workers') == 0:
+            return await loop.run_in_executor(None, self.file_processor.process_file, path)
+        
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.config.get('process_workers') or os.cpu_count(),
+                mp_context=_process_pool_context(),
+                initializer=_init_file_processor_worker,
+                initargs=(type(self.file_processor), self.fs_config)
+            )
+        return await loop.run_in_executor(self._process_pool, _process_file_in_worker, path)
+    
+    async def ensure_hash(self, metadata: FileMetadata) -> str:
+        """Return the file's full SHA-256, computing it now if it is not known.
+        
+        In 'fingerprint' mode this is where the full hash is paid for: call
+        it when a custody record (or anything else) needs the exact digest.
+        The result is kept on ``metadata`` and in the metadata index.
+        """
+        if not metadata.hash:
+            metadata.hash = await asyncio.to_thread(compute_sha256, metadata.path)
+            if self.index is not None:
+                await asyncio.to_thread(
+                    self.index.set_hash, metadata.path, metadata.hash, metadata.fingerprint
+                )
+        return metadata.hash
+    
+    async def _carry_forward_hash(self, metadata: FileMetadata) -> None:
+        """Reuse or refresh the indexed full hash of a file being reprocessed.
+        
+        An unchanged fingerprint keeps the known hash. A changed one means a
+        hash somebody relied on is stale, so it is recomputed right away;
+        files never hashed stay unhashed until ensure_hash is called.
+        """
+        metadata.hash = await asyncio.to_thread(self._known_or_fresh_hash, metadata)
+    
+    def _known_or_fresh_hash(self, metadata: FileMetadata) -> str:
+        """The indexed hash if the fingerprint still matches, else a fresh one; runs off the loop."""
+        fingerprint, file_hash = self.index.known_hash(metadata.path)
+        if not file_hash or fingerprint == metadata.fingerprint:
+            return file_hash or ""
+        return compute_sha256(metadata.path)
+    
+    def close(self) -> None:
+        """Shut down the process pool and close the metadata index, if any."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+    
+    async def aclose(self) -> None:
+        """close() without blocking the event loop while the pool drains."""
+        await asyncio.to_thread(self.close)
+    
+    async def __aenter__(self) -> 'FileBossIntegrator':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+    
+    def __enter__(self) -> 'FileBossIntegrator':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
     async def organize_files(
         self,
-        files: List[Union[FileMetadata, Dict]],
+        files: Union[Iterable[Union[FileMetadata, Dict]], AsyncIterable[Union[FileMetadata, Dict]]],
         output_dir: Union[str, Path],
-        organization_scheme: str = "type_date"
+        organization_scheme: str = "type_date",
+        link_mode: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """Organize files according to the specified scheme.
         
         Args:
-            files: List of files to organize (FileMetadata objects or dictionaries)
+            files: Files to organize (FileMetadata objects or dictionaries), as a
+                list or as a stream such as iter_directory(), in which case
+                each file is organized as soon as it arrives
             output_dir: Base directory for organized files
             organization_scheme: Scheme to use for organization
                 - 'type_date': Organize by file type and date
                 - 'type': Organize by file type only
                 - 'date': Organize by date only
                 - 'flat': All files in a single directory
+            link_mode: With a content store (``config['content_store_path']``)
+                each file's bytes are stored once under their SHA-256 and the
+                layout is made of 'hardlink' (default) or 'symlink' views into
+                the store, so organizing the same evidence under several
+                schemes costs no extra copies. 'copy' (the default without a
+                store) copies every file as before.
                 
         Returns:
-            List of dictionaries with original and new file paths
+            List of dictionaries with original and new file paths (and the
+            file hash when a content store is used)
         """
+        if link_mode is None:
+            link_mode = self.config.get('link_mode', 'hardlink' if self.content_store else 'copy')
+        if link_mode != 'copy' and self.content_store is None:
+            raise ValueError(f"link_mode {link_mode!r} needs config['content_store_path']")
+
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
         results = []
         
-        for file_info in files:
+        async for file_info in _as_async_iter(files):
             try:
+                file_hash = ''
                 if isinstance(file_info, FileMetadata):
                     src_path = file_info.path
+                    file_hash = file_info.hash
                     file_type = file_info.file_type.name.lower()
                     modified_date = datetime.fromtimestamp(file_info.modified).strftime('%Y-%m-%d')
                 else:
@@ -193,19 +731,35 @@ class FileBossIntegrator:
                 # Create destination directory if it doesn't exist
                 dest_dir.mkdir(parents=True, exist_ok=True)
                 
-                # Copy file to new location
                 dest_path = dest_dir / src_path.name
-                shutil.copy2(src_path, dest_path)
-                
-                results.append({
+                result = {
                     'original_path': str(src_path),
                     'new_path': str(dest_path),
                     'file_type': file_type,
                     'organization_scheme': organization_scheme
-                })
+                }
+                
+                if link_mode == 'copy':
+                    # Copy file to new location
+                    shutil.copy2(src_path, dest_path)
+                else:
+                    # Store the bytes once, then add a view of them to the layout
+                    blob = await asyncio.to_thread(
+                        self.content_store.put_file, src_path, file_hash
+                    )
+                    if isinstance(file_info, FileMetadata):
+                        file_info.hash = blob.file_hash
+                    result['file_hash'] = blob.file_hash
+                    result['link_mode'] = self.content_store.link(
+                        blob.file_hash, dest_path, link_mode
+                    )
+                
+                results.append(result)
                 
             except Exception as e:
-                logger.error(f"Error organizing file {file_info.get('path', 'unknown')}: {e}")
+                path = (file_info.path if isinstance(file_info, FileMetadata)
+                        else file_info.get('path', 'unknown'))
+                logger.error(f"Error organizing file {path}: {e}")
                 continue
         
         return results
@@ -276,41 +830,116 @@ class FileBossIntegrator:
         Returns:
             List of file information dictionaries
         """
-        files = []
+        return list(self._iter_scan_directory(directory, recursive, file_types))
+    
+    def _iter_scan_directory(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        file_types: Optional[List[str]] = None
+    ) -> Iterator[Dict]:
+        """Lazily yield the file information dictionaries of _scan_directory.
+        
+        Walks the tree with os.scandir: the extension is checked on the entry
+        name before anything is stat'ed, the size and times come from the
+        entry's own stat, and directories named in ``config['excluded_dirs']``
+        (default EXCLUDED_DIRS) are never entered.
+        """
+        extension_index = self.extension_index
+        extensions = self._wanted_extensions(file_types)
+        excluded_dirs = frozenset(self.config.get('excluded_dirs', EXCLUDED_DIRS))
+        
+        # Depth-first, files of a directory before its subdirectories
+        pending = [str(directory)]
+        while pending:
+            subdirs = []
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                # Like Path.glob('**'), symlinked directories are not entered
+                                if (recursive and entry.name not in excluded_dirs
+                                        and not entry.is_symlink()):
+                                    subdirs.append(entry.path)
+                                continue
+                            extension = os.path.splitext(entry.name)[1].lower()
+                            if extension not in extensions or not entry.is_file():
+                                continue
+                            stat = entry.stat()
+                        except OSError as e:
+                            logger.warning(f"Could not access file {entry.path}: {e}")
+                            continue
+                        yield {
+                            'path': Path(entry.path),
+                            'name': entry.name,
+                            'extension': extension,
+                            'size': stat.st_size,
+                            'created': stat.st_ctime,
+                            'modified': stat.st_mtime,
+                            'inode': entry.inode(),
+                            'type': extension_index[extension]
+                        }
+            except OSError as e:
+                logger.warning(f"Could not scan directory: {e}")
+                continue
+            pending.extend(reversed(subdirs))
+    
+    def scan_batch(
+        self,
+        directory: Union[str, Path],
+        recursive: bool = True,
+        file_types: Optional[List[str]] = None
+    ) -> FileMetadataBatch:
+        """Scan a directory into a FileMetadataBatch, without processing any file.
         
-        # If no file types specified, include all supported types
+        Args:
+            directory: Directory to scan
+            recursive: Whether to scan subdirectories
+            file_types: List of file types to include (e.g., ['document', 'image'])
+            
+        Returns:
+            FileMetadataBatch of the files found, in scan order
+        """
+        batch = FileMetadataBatch()
+        for file_info in self._iter_scan_directory(Path(directory), recursive, file_types):
+            mime_type, _ = mimetypes.guess_type(file_info['name'])
+            batch.append(
+                file_info['path'], file_info['size'], file_info['modified'],
+                file_info['created'], file_info['type'], file_info['extension'],
+                mime_type or 'application/octet-stream'
+            )
+        return batch
+    
+    def _stat_file_info(self, path: Union[str, Path]) -> Optional[Dict]:
+        """Scan dictionary for a single file, or None if it is gone or unsupported."""
+        path = Path(os.path.abspath(path))
+        extension = path.suffix.lower()
+        if extension not in self.extension_index:
+            return None
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if not S_ISREG(st.st_mode):
+            return None
+        return {
+            'path': path,
+            'name': path.name,
+            'extension': extension,
+            'size': st.st_size,
+            'created': st.st_ctime,
+            'modified': st.st_mtime,
+            'inode': st.st_ino,
+            'type': self.extension_index[extension]
+        }
+    
+    def _wanted_extensions(self, file_types: Optional[List[str]] = None) -> set:
+        """Extensions included by a scan for ``file_types`` (all supported if empty)."""
         if not file_types:
-            file_types = list(self.supported_extensions.keys())
-        
-        # Get all extensions for the specified file types
-        extensions = []
-        for ft in file_types:
-            if ft in self.supported_extensions:
-                extensions.extend(self.supported_extensions[ft])
-        
-        # Convert to set for faster lookups
-        extensions = set(extensions)
-        
-        # Scan directory
-        glob_pattern = '**/*' if recursive else '*'
-        for file_path in directory.glob(glob_pattern):
-            if file_path.is_file() and file_path.suffix.lower() in extensions:
-                try:
-                    stat = file_path.stat()
-                    files.append({
-                        'path': file_path,
-                        'name': file_path.name,
-                        'extension': file_path.suffix.lower(),
-                        'size': stat.st_size,
-                        'created': stat.st_ctime,
-                        'modified': stat.st_mtime,
-                        'type': self._get_file_type(file_path.suffix.lower())
-                    })
-                except OSError as e:
-                    logger.warning(f"Could not access file {file_path}: {e}")
-                    continue
-        
-        return files
+            return set(self.extension_index)
+        wanted = {FileType[ft.upper()] for ft in file_types if ft in self.supported_extensions}
+        return {ext for ext, ft in self.extension_index.items() if ft in wanted}
     
     async def _enhance_metadata(self, file_info: Dict) -> FileMetadata:
         """Enhance file metadata with additional information.
@@ -324,20 +953,30 @@ class FileBossIntegrator:
         file_path = Path(file_info['path'])
         
         # Get MIME type
-        import mimetypes
         mime_type, _ = mimetypes.guess_type(file_path)
         
+        fingerprint = file_hash = ''
+        if self.hash_mode == 'fingerprint':
+            fingerprint = file_info.get('fingerprint') or await asyncio.to_thread(
+                file_fingerprint, file_path, file_info['size'], file_info['modified']
+            )
+        elif self.hash_mode == 'full':
+            file_hash = await asyncio.to_thread(compute_sha256, file_path)
+        
         # Create FileMetadata object
         metadata = FileMetadata(
             path=file_path,
             name=file_info['name'],
             size=file_info['size'],
             file_type=file_info['type'],
-            extension=file_info['extension'],
+            extension=sys.intern(file_info['extension']),
             mime_type=mime_type or 'application/octet-stream',
             created=file_info['created'],
             modified=file_info['modified'],
-            metadata=file_info  # Include original file info
+            hash=file_hash,
+            fingerprint=fingerprint,
+            # Scan details not already held in the fields above (e.g. the inode)
+            metadata={k: v for k, v in file_info.items() if k not in _SCAN_FIELDS}
         )
         
         return metadata
@@ -351,13 +990,17 @@ class FileBossIntegrator:
         Returns:
             FileType enum value
         """
-        extension = extension.lower()
-        
+        return self.extension_index.get(extension.lower(), FileType.OTHER)
+    
+    @cached_property
+    def extension_index(self) -> Dict[str, FileType]:
+        """Extension -> FileType, built once from ``supported_extensions``."""
+        index: Dict[str, FileType] = {}
         for file_type, extensions in self.supported_extensions.items():
-            if extension in extensions:
-                return FileType[file_type.upper()]
-        
-        return FileType.OTHER
+            for extension in extensions:
+                # First listed type wins, as in the old linear search
+                index.setdefault(extension, FileType[file_type.upper()])
+        return index
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,388 @@
+"""
+File Metadata Index
+
+On-disk SQLite index of the files FileBossIntegrator has processed. Each row
+keeps the stat identity of a file (size, mtime, inode), its FileMetadata
+fields and the FileSystemMaster ``process_file`` output, so a rescan only
+processes files that are new or have changed and marks vanished ones deleted.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from casebuilder.services.fileboss_integration import FileMetadata, FileType
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed_files (
+    path TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    name TEXT NOT NULL,
+    extension TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    modified REAL NOT NULL,
+    created REAL NOT NULL,
+    inode INTEGER,
+    file_type TEXT NOT NULL,
+    mime_type TEXT NOT NULL,
+    hash TEXT NOT NULL DEFAULT '',
+    fingerprint TEXT NOT NULL DEFAULT '',
+    case_id TEXT,
+    evidence_id TEXT,
+    tags TEXT NOT NULL DEFAULT '[]',
+    processed TEXT NOT NULL DEFAULT '{}',
+    last_seen_scan INTEGER NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_indexed_files_parent ON indexed_files (parent);
+CREATE TABLE IF NOT EXISTS index_scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    root TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    added INTEGER NOT NULL DEFAULT 0,
+    modified INTEGER NOT NULL DEFAULT 0,
+    unchanged INTEGER NOT NULL DEFAULT 0,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_UPSERT_SQL = """
+INSERT INTO indexed_files (
+    path, parent, name, extension, size, modified, created, inode, file_type, mime_type,
+    hash, fingerprint, case_id, evidence_id, tags, processed, last_seen_scan, deleted, indexed_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+ON CONFLICT (path) DO UPDATE SET
+    parent = excluded.parent, name = excluded.name, extension = excluded.extension,
+    size = excluded.size, modified = excluded.modified, created = excluded.created,
+    inode = excluded.inode, file_type = excluded.file_type, mime_type = excluded.mime_type,
+    hash = excluded.hash, fingerprint = excluded.fingerprint, case_id = excluded.case_id, evidence_id = excluded.evidence_id,
+    tags = excluded.tags, processed = excluded.processed,
+    last_seen_scan = excluded.last_seen_scan, deleted = 0, indexed_at = excluded.indexed_at
+"""
+
+_TOUCH_SQL = "UPDATE indexed_files SET last_seen_scan = ? WHERE path = ?"
+
+_LOOKUP_SQL = """
+SELECT path, name, extension, size, modified, created, inode, file_type, mime_type,
+       hash, case_id, evidence_id, tags, processed, fingerprint
+FROM indexed_files WHERE path = ? AND deleted = 0
+"""
+
+# Columns added after the first release of the schema, as (name, definition)
+_ADDED_COLUMNS = [
+    ("fingerprint", "TEXT NOT NULL DEFAULT ''"),
+]
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the Path/FileType values found in process_file output."""
+    if isinstance(value, FileType):
+        return value.name
+    if isinstance(value, Path):
+        return str(value)
+    return str(value)
+
+
+@dataclass
+class ScanSummary:
+    """What changed in one indexed scan of a directory."""
+    scan_id: int
+    root: str
+    added: int = 0
+    modified: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    deleted_paths: List[str] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        """Files that had to go through process_file."""
+        return self.added + self.modified
+
+
+class FileMetadataIndex:
+    """
+    SQLite-backed index of processed files, keyed by absolute path.
+
+    A file is unchanged when its size, mtime and inode (and, when the scan
+    supplies one, its partial fingerprint) match the indexed row; its stored
+    FileMetadata is then returned without processing the file again.
+    Writes are buffered and committed in batches. The connection is shared
+    between threads behind a lock, so the index can be used from the event
+    loop and from worker threads alike.
+    """
+
+    def __init__(self, db_path: Union[str, Path], batch_size: int = 500):
+        """Open (and create if needed) the index database.
+
+        Args:
+            db_path: Path of the SQLite database file
+            batch_size: Buffered writes committed together
+        """
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(indexed_files)")}
+        for name, definition in _ADDED_COLUMNS:
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE indexed_files ADD COLUMN {name} {definition}")
+        self._conn.commit()
+        self._upserts: List[Tuple] = []
+        self._touches: List[Tuple[int, str]] = []
+        self._summaries: Dict[int, ScanSummary] = {}
+
+    def begin_scan(self, root: Union[str, Path]) -> int:
+        """Start a scan of ``root`` and return its id."""
+        root = os.path.abspath(root)
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO index_scans (root, started_at) VALUES (?, ?)", (root, time.time())
+            )
+            self._conn.commit()
+            scan_id = cursor.lastrowid
+            self._summaries[scan_id] = ScanSummary(scan_id, root)
+        return scan_id
+
+    def lookup(self, scan_id: int, file_info: Dict) -> Optional[FileMetadata]:
+        """Return the indexed metadata of a scanned file if it is unchanged.
+
+        Args:
+            scan_id: Scan the file was found in (see begin_scan)
+            file_info: Scan dictionary with 'path', 'size', 'modified', 'inode'
+                and optionally 'fingerprint'
+
+        Returns:
+            The stored FileMetadata, or None when the file is new or changed
+        """
+        path = str(file_info['path'])
+        with self._lock:
+            row = self._conn.execute(_LOOKUP_SQL, (path,)).fetchone()
+            summary = self._summaries[scan_id]
+            if row is None:
+                summary.added += 1
+                return None
+            if (row[3] != file_info['size'] or row[4] != file_info['modified']
+                    or (file_info.get('inode') and row[6] != file_info['inode'])
+                    or (file_info.get('fingerprint') and row[14]
+                        and row[14] != file_info['fingerprint'])):
+                summary.modified += 1
+                return None
+            summary.unchanged += 1
+
+        self._buffer(self._touches, (scan_id, path))
+        return self._row_to_metadata(row)
+
+    def record(self, scan_id: int, metadata: FileMetadata, processed: Dict[str, Any],
+               inode: Optional[int] = None) -> None:
+        """Store a freshly processed file.
+
+        Args:
+            scan_id: Scan the file was processed in
+            metadata: FileMetadata produced for the file
+            processed: Output of FileProcessor.process_file
+            inode: Inode number from the scan, if known
+        """
+        path = str(metadata.path)
+        self._buffer(self._upserts, (
+            path, os.path.dirname(path), metadata.name, metadata.extension, metadata.size,
+            metadata.modified, metadata.created, inode, metadata.file_type.name,
+            metadata.mime_type, metadata.hash, metadata.fingerprint,
+            metadata.case_id, metadata.evidence_id,
+            json.dumps(metadata.tags), json.dumps(processed, default=_json_default),
+            scan_id, time.time()
+        ))
+
+    def known_hash(self, path: Union[str, Path]) -> Tuple[str, str]:
+        """(fingerprint, full hash) last indexed for a path; empty strings if none."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, hash FROM indexed_files WHERE path = ?", (str(path),)
+            ).fetchone()
+        return (row[0], row[1]) if row else ('', '')
+
+    def set_hash(self, path: Union[str, Path], file_hash: str, fingerprint: str = '') -> None:
+        """Store a lazily computed full hash, if the file still has ``fingerprint``."""
+        with self._lock:
+            self._flush_locked()
+            self._conn.execute(
+                "UPDATE indexed_files SET hash = ? WHERE path = ? AND fingerprint = ?",
+                (file_hash, str(path), fingerprint)
+            )
+            self._conn.commit()
+
+    def touch(self, scan_id: int, path: Union[str, Path]) -> None:
+        """Mark an indexed file as still present without changing its row."""
+        self._buffer(self._touches, (scan_id, str(path)))
+
+    def finish_scan(
+        self,
+        scan_id: int,
+        recursive: bool = True,
+        extensions: Optional[Iterable[str]] = None,
+        mark_missing: bool = True
+    ) -> ScanSummary:
+        """Close a scan, marking files it no longer found as deleted.
+
+        Only rows inside the scan's scope are considered: below its root (or
+        directly in it when not ``recursive``) and, when given, with one of
+        ``extensions``. Pass ``mark_missing=False`` for scans that did not
+        list the whole scope (e.g. a batch of watched paths).
+
+        Returns:
+            ScanSummary with the added/modified/unchanged/deleted counts
+        """
+        with self._lock:
+            summary = self._summaries.pop(scan_id)
+        if not mark_missing:
+            with self._lock:
+                self._flush_locked()
+                self._record_summary_locked(summary)
+            return summary
+        
+        root = summary.root.rstrip(os.sep) + os.sep
+        if recursive:
+            # Primary-key range covering every path that starts with root
+            where = "path >= ? AND path < ?"
+            params: List[Any] = [root, root[:-1] + chr(ord(os.sep) + 1)]
+        else:
+            where = "parent = ?"
+            params = [summary.root]
+        if extensions is not None:
+            extensions = sorted(extensions)
+            where += f" AND extension IN ({', '.join('?' * len(extensions))})"
+            params.extend(extensions)
+
+        with self._lock:
+            self._flush_locked()
+            missing = f"{where} AND deleted = 0 AND last_seen_scan != ?"
+            summary.deleted_paths = [
+                row[0] for row in self._conn.execute(
+                    f"SELECT path FROM indexed_files WHERE {missing} ORDER BY path",
+                    (*params, scan_id)
+                )
+            ]
+            self._conn.execute(
+                f"UPDATE indexed_files SET deleted = 1 WHERE {missing}", (*params, scan_id)
+            )
+            summary.deleted = len(summary.deleted_paths)
+            self._record_summary_locked(summary)
+
+        logger.info(
+            f"Indexed scan of {summary.root}: {summary.added} added, {summary.modified} modified, "
+            f"{summary.unchanged} unchanged, {summary.deleted} deleted"
+        )
+        return summary
+
+    def discard_scan(self, scan_id: int) -> None:
+        """Drop a scan that will not be finished (e.g. its caller stopped early).
+
+        Nothing is marked deleted; files it already recorded stay indexed.
+        Does nothing if the scan was already finished or discarded.
+        """
+        with self._lock:
+            self._summaries.pop(scan_id, None)
+
+    def mark_deleted(self, path: Union[str, Path]) -> List[str]:
+        """Mark a removed file, or every indexed file below a removed directory, deleted.
+
+        Returns:
+            The indexed paths that were marked
+        """
+        path = os.path.abspath(path)
+        prefix = path.rstrip(os.sep) + os.sep
+        where = "(path = ? OR (path >= ? AND path < ?)) AND deleted = 0"
+        params = (path, prefix, prefix[:-1] + chr(ord(os.sep) + 1))
+        with self._lock:
+            self._flush_locked()
+            paths = [row[0] for row in self._conn.execute(
+                f"SELECT path FROM indexed_files WHERE {where} ORDER BY path", params
+            )]
+            self._conn.execute(f"UPDATE indexed_files SET deleted = 1 WHERE {where}", params)
+            self._conn.commit()
+        return paths
+
+    def deleted_paths(self, root: Union[str, Path]) -> List[str]:
+        """Paths under ``root`` that a scan found missing."""
+        root = os.path.abspath(root).rstrip(os.sep) + os.sep
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM indexed_files WHERE path >= ? AND path < ? AND deleted = 1 "
+                "ORDER BY path",
+                (root, root[:-1] + chr(ord(os.sep) + 1))
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def flush(self) -> None:
+        """Commit buffered writes."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Commit buffered writes and close the database."""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def _record_summary_locked(self, summary: ScanSummary) -> None:
+        self._conn.execute(
+            "UPDATE index_scans SET finished_at = ?, added = ?, modified = ?, "
+            "unchanged = ?, deleted = ? WHERE id = ?",
+            (time.time(), summary.added, summary.modified, summary.unchanged,
+             summary.deleted, summary.scan_id)
+        )
+        self._conn.commit()
+
+    def _buffer(self, pending: List[Tuple], params: Tuple) -> None:
+        with self._lock:
+            pending.append(params)
+            if len(self._upserts) + len(self._touches) >= self.batch_size:
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._upserts:
+            self._conn.executemany(_UPSERT_SQL, self._upserts)
+            self._upserts = []
+        if self._touches:
+            self._conn.executemany(_TOUCH_SQL, self._touches)
+            self._touches = []
+        self._conn.commit()
+
+    @staticmethod
+    def _row_to_metadata(row: Tuple) -> FileMetadata:
+        (path, name, extension, size, modified, created, inode, file_type, mime_type,
+         file_hash, case_id, evidence_id, tags, processed, fingerprint) = row
+        file_type = FileType[file_type]
+        # Same shape as a fresh scan: extra scan details plus process_file output
+        metadata = {'inode': inode}
+        metadata.update(json.loads(processed))
+        return FileMetadata(
+            path=Path(path),
+            name=name,
+            size=size,
+            file_type=file_type,
+            extension=extension,
+            mime_type=mime_type,
+            created=created,
+            modified=modified,
+            hash=file_hash,
+            fingerprint=fingerprint,
+            case_id=case_id,
+            evidence_id=evidence_id,
+            tags=json.loads(tags),
+            metadata=metadata
+        )
@@ -11,18 +11,39 @@ for February 19, 2025 hearing and July 28-29, 2025 trial prep.
 Usage:
   python dropbox_organizer_case_1009.py --dry-run  # Test mode
   python dropbox_organizer_case_1009.py            # Live execution
+  python dropbox_organizer_case_1009.py --workers=8  # Parallel copy workers
+  python dropbox_organizer_case_1009.py --scan-workers=16  # Concurrent directory listings
+  python dropbox_organizer_case_1009.py --incremental  # Skip already-organized files
+  python dropbox_organizer_case_1009.py --no-dedup     # Copy identical files as _copyN
+  python dropbox_organizer_case_1009.py --copy-mode=auto  # Hardlink / in-kernel copy (or =move)
+  python dropbox_organizer_case_1009.py --content      # Classify unplaced PDF/DOCX by first page
 """
 
 import os
 import re
+import time
+import atexit
 import json
 import hashlib
 import shutil
 import sqlite3
+import queue
+import multiprocessing
+import heapq
+import threading
+import html
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
-from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Optional, Union
+from collections import defaultdict, deque
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # content classification of PDFs needs: pip install pypdf
+    PdfReader = None
 
 # ═══════════════════════════════════════════════════════════════
 # 🔥 CONFIGURATION
@@ -227,59 +248,160 @@ CLASSIFICATION_RULES = [
 # 🧠 INTELLIGENT CLASSIFICATION ENGINE
 # ═══════════════════════════════════════════════════════════════
 
-def get_file_year(filepath: str) -> str:
-    """Extract year from filename or metadata"""
-    year_match = re.search(r'(202[3-5])', filepath)
+_YEAR_RE = re.compile(r'(202[3-5])')
+
+_DATE_PATTERNS = [
+    re.compile(r"(\d{4})[-._](\d{2})[-._](\d{2})"),
+    re.compile(r"(\d{2})[-._](\d{2})[-._](\d{4})"),
+    re.compile(r"Filed[:\s]+(\d{1,2})[-._/](\d{1,2})[-._/](\d{2,4})")
+]
+
+_TYPE_MAPPING = [
+    (re.compile(r"Motion", re.IGNORECASE), "MOTION"),
+    (re.compile(r"Order|ORDER", re.IGNORECASE), "ORDER"),
+    (re.compile(r"Exhibit", re.IGNORECASE), "EXHIBIT"),
+    (re.compile(r"Subpoena", re.IGNORECASE), "SUBPOENA"),
+    (re.compile(r"Notice", re.IGNORECASE), "NOTICE"),
+    (re.compile(r"Asset.*Debt", re.IGNORECASE), "ASSET_DEBT"),
+    (re.compile(r"Report", re.IGNORECASE), "REPORT"),
+    (re.compile(r"Strategy", re.IGNORECASE), "STRATEGY")
+]
+
+_DOCKET_RE = re.compile(r"[Dd]kt[\.#]?\s*(\d+)")
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class CompiledClassifier:
+    """Single-pass rule engine built once from CLASSIFICATION_RULES.
+
+    Every rule becomes one branch of an anchored alternation of lookaheads,
+    so a single ``match`` call walks the rules in order and stops at the
+    first one that matches anywhere in the text. First-match-wins ordering
+    and the subfolder post-rules are identical to the original rule loop.
+    """
+
+    def __init__(self, rules: List[Tuple[str, str, Optional[str]]] = None):
+        self.rules = list(rules if rules is not None else CLASSIFICATION_RULES)
+
+        branches = []
+        for index, (pattern, _, _) in enumerate(self.rules):
+            # (?s:.*?) lets the lookahead search the whole text without
+            # changing how "." behaves inside the rule's own pattern
+            branches.append(f"(?=(?s:.*?)(?:{pattern}))(?P<r{index}>)")
+        self._pattern = re.compile("^(?:" + "|".join(branches) + ")", re.IGNORECASE)
+
+        # lastindex points at the empty marker group closing each branch
+        self._group_to_rule = {
+            self._pattern.groupindex[f"r{index}"]: index
+            for index in range(len(self.rules))
+        }
+        self._no_match = len(self.rules)
+
+    def match_rule(self, filename: str, description: str = "",
+                   content: str = "") -> Optional[int]:
+        """Return the index of the first rule matching filename, description or content"""
+        best = self._no_match
+        match = self._pattern.match(filename)
+        if match:
+            best = self._group_to_rule[match.lastindex]
+        for text in (description, content):
+            if text and best:
+                match = self._pattern.match(text)
+                if match:
+                    best = min(best, self._group_to_rule[match.lastindex])
+        return best if best < self._no_match else None
+
+    def classify(self, filename: str, description: str = "",
+                 content: str = "", mtime: Optional[float] = None) -> Tuple[str, str]:
+        """Classify file and return (destination, suggested_name)
+
+        ``content`` (e.g. extracted first-page text) takes part in rule
+        matching only; the suggested name is still built from the filename
+        and description. ``mtime``, when the caller already has it, dates
+        files whose name carries no year.
+        """
+        index = self.match_rule(filename, description, content)
+        if index is None:
+            return "10_ARCHIVE/10c_Unclassified", filename
+
+        _, destination, subfolder_rule = self.rules[index]
+        if subfolder_rule:
+            full_text = f"{filename} {description} {content}".lower()
+            destination = _apply_subfolder_rule(destination, subfolder_rule, filename, full_text,
+                                                mtime)
+
+        new_name = generate_smart_filename(filename, description)
+        return destination, new_name
+
+    def classify_many(self, items: Iterable[Union[str, Tuple[str, str]]]) -> List[Tuple[str, str]]:
+        """Classify a batch of filenames or (filename, description) pairs"""
+        classify = self.classify
+        results = []
+        for item in items:
+            if isinstance(item, str):
+                results.append(classify(item))
+            else:
+                results.append(classify(*item))
+        return results
+
+
+def get_file_year(filepath: str, mtime: Optional[float] = None) -> str:
+    """Extract year from filename or metadata
+
+    Pass ``mtime`` when a stat result is already at hand (e.g. from a
+    DirEntry) to avoid statting the file again.
+    """
+    year_match = _YEAR_RE.search(filepath)
     if year_match:
         return year_match.group(1)
     try:
-        stat = os.stat(filepath)
-        mod_time = datetime.fromtimestamp(stat.st_mtime)
+        if mtime is None:
+            mtime = os.stat(filepath).st_mtime
+        mod_time = datetime.fromtimestamp(mtime)
         return str(mod_time.year)
     except:
         return "2024"
 
-def classify_file(filename: str, description: str = "") -> Tuple[str, str]:
+def _apply_subfolder_rule(destination: str, subfolder_rule: str,
+                          filename: str, full_text: str,
+                          mtime: Optional[float] = None) -> str:
+    """Resolve year_subfolder / order_type / subpoena_type post-rules"""
+    if subfolder_rule == "year_subfolder":
+        year = get_file_year(filename, mtime)
+        return f"{destination}/{year}"
+    if subfolder_rule == "order_type":
+        if "scheduling" in full_text:
+            return f"{destination}/Scheduling_Orders"
+        if "protective" in full_text or "tro" in full_text:
+            return f"{destination}/Protective_Orders"
+        return f"{destination}/Other_Orders"
+    if subfolder_rule == "subpoena_type":
+        if "school" in full_text:
+            return f"{destination}/School_Subpoenas"
+        if "medical" in full_text or "doctor" in full_text:
+            return f"{destination}/Medical_Subpoenas"
+        return f"{destination}/Other_Subpoenas"
+    return destination
+
+_CLASSIFIER = CompiledClassifier()
+
+def classify_file(filename: str, description: str = "", content: str = "",
+                  mtime: Optional[float] = None) -> Tuple[str, str]:
     """Classify file and return (destination, suggested_name)"""
-    full_text = f"{filename} {description}".lower()
-    
-    for pattern, destination, subfolder_rule in CLASSIFICATION_RULES:
-        if re.search(pattern, filename, re.IGNORECASE) or re.search(pattern, description, re.IGNORECASE):
-            # Apply subfolder rules
-            if subfolder_rule == "year_subfolder":
-                year = get_file_year(filename)
-                destination = f"{destination}/{year}"
-            elif subfolder_rule == "order_type":
-                if "scheduling" in full_text:
-                    destination = f"{destination}/Scheduling_Orders"
-                elif "protective" in full_text or "tro" in full_text:
-                    destination = f"{destination}/Protective_Orders"
-                else:
-                    destination = f"{destination}/Other_Orders"
-            elif subfolder_rule == "subpoena_type":
-                if "school" in full_text:
-                    destination = f"{destination}/School_Subpoenas"
-                elif "medical" in full_text or "doctor" in full_text:
-                    destination = f"{destination}/Medical_Subpoenas"
-                else:
-                    destination = f"{destination}/Other_Subpoenas"
-            
-            new_name = generate_smart_filename(filename, description)
-            return destination, new_name
-    
-    return "10_ARCHIVE/10c_Unclassified", filename
+    return _CLASSIFIER.classify(filename, description, content, mtime)
+
+def classify_files(items: Iterable[Union[str, Tuple[str, str]]]) -> List[Tuple[str, str]]:
+    """Classify many files in one call; items are filenames or (filename, description)"""
+    return _CLASSIFIER.classify_many(items)
 
 def generate_smart_filename(original: str, description: str = "") -> str:
     """Generate descriptive filename: [YYYYMMDD]_[DocType]_[Dkt###]_[ShortDesc].[ext]"""
     date_str = "UNDATED"
-    date_patterns = [
-        r"(\d{4})[-._](\d{2})[-._](\d{2})",
-        r"(\d{2})[-._](\d{2})[-._](\d{4})",
-        r"Filed[:\s]+(\d{1,2})[-._/](\d{1,2})[-._/](\d{2,4})"
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, f"{original} {description}")
+    combined = f"{original} {description}"
+    
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(combined)
         if match:
             groups = match.groups()
             if len(groups[0]) == 4:
@@ -290,40 +412,207 @@ def generate_smart_filename(original: str, description: str = "") -> str:
             break
     
     doc_type = "DOC"
-    type_mapping = {
-        r"Motion": "MOTION",
-        r"Order|ORDER": "ORDER",
-        r"Exhibit": "EXHIBIT",
-        r"Subpoena": "SUBPOENA",
-        r"Notice": "NOTICE",
-        r"Asset.*Debt": "ASSET_DEBT",
-        r"Report": "REPORT",
-        r"Strategy": "STRATEGY"
-    }
-    
-    for pattern, dtype in type_mapping.items():
-        if re.search(pattern, original, re.IGNORECASE):
+    for pattern, dtype in _TYPE_MAPPING:
+        if pattern.search(original):
             doc_type = dtype
             break
     
     docket = ""
-    docket_match = re.search(r"[Dd]kt[\.#]?\s*(\d+)", f"{original} {description}")
+    docket_match = _DOCKET_RE.search(combined)
     if docket_match:
         docket = f"_Dkt{docket_match.group(1)}"
     
     desc = description if description else original
-    desc = re.sub(r'[^\w\s-]', '', desc)
-    desc = re.sub(r'\s+', '_', desc)[:50]
+    desc = _UNSAFE_CHARS_RE.sub('', desc)
+    desc = _WHITESPACE_RE.sub('_', desc)[:50]
     
     ext = Path(original).suffix or ".pdf"
     return f"{date_str}_{doc_type}{docket}_{desc}{ext}"
 
+# ═══════════════════════════════════════════════════════════════
+# 📄 CONTENT EXTRACTION
+# ═══════════════════════════════════════════════════════════════
+
+UNCLASSIFIED_DESTINATION = "10_ARCHIVE/10c_Unclassified"
+CONTENT_EXTENSIONS = {".pdf", ".docx"}
+CONTENT_TEXT_LIMIT = 4000
+
+_DOCX_PAGE_BREAK_RE = re.compile(r'<w:br [^>]*w:type="page"|<w:lastRenderedPageBreak')
+_DOCX_PARAGRAPH_RE = re.compile(r'</w:p>')
+_DOCX_TEXT_RE = re.compile(r'<w:t(?:\s[^>]*)?>([^<]*)</w:t>')
+
+def _first_page_docx(path: str) -> str:
+    with zipfile.ZipFile(path) as docx:
+        xml = docx.read("word/document.xml").decode("utf-8", errors="ignore")
+    page_break = _DOCX_PAGE_BREAK_RE.search(xml)
+    if page_break:
+        xml = xml[:page_break.start()]
+    paragraphs = _DOCX_PARAGRAPH_RE.split(xml)
+    lines = ("".join(_DOCX_TEXT_RE.findall(p)) for p in paragraphs)
+    return html.unescape("\n".join(line for line in lines if line))
+
+def _first_page_pdf(path: str) -> str:
+    if PdfReader is None:
+        return ""
+    reader = PdfReader(path)
+    if not reader.pages:
+        return ""
+    return reader.pages[0].extract_text() or ""
+
+def extract_first_page_text(path: str) -> str:
+    """First-page text of a PDF or DOCX, truncated to CONTENT_TEXT_LIMIT.
+
+    Runs inside the content process pool, so it never raises; unreadable or
+    unsupported files give an empty string.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext == ".docx":
+            text = _first_page_docx(path)
+        elif ext == ".pdf":
+            text = _first_page_pdf(path)
+        else:
+            return ""
+    except Exception:
+        return ""
+    return text[:CONTENT_TEXT_LIMIT]
+
 # ═══════════════════════════════════════════════════════════════
 # 🗄️ SQLITE TRACKING DATABASE
 # ═══════════════════════════════════════════════════════════════
 
-def init_tracking_db(db_path: str):
-    """Initialize SQLite database for tracking"""
+_INSERT_OPERATION_SQL = """
+    INSERT INTO file_operations 
+    (original_path, original_filename, new_path, new_filename, 
+     file_hash, file_size, source_mtime, classification, success, error_message,
+     duplicate_of)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_TOUCH_OPERATION_SQL = "UPDATE file_operations SET source_mtime = ? WHERE id = ?"
+
+class TrackingWriter:
+    """Long-lived, batched writer for the tracking database.
+
+    Statements are queued from any thread and written by one background
+    thread with ``executemany``, committing once per batch instead of once
+    per file. A batch is flushed when it reaches ``batch_size`` rows or has
+    been pending for ``flush_interval`` seconds. ``close`` (also registered
+    with atexit) flushes whatever is left.
+
+    A batch that fails is rolled back and kept in ``failed_rows``; later
+    batches are still written, and ``flush``/``close`` raise RuntimeError
+    for the first failure so the run does not end as if it were tracked.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path: str, batch_size: int = 500, flush_interval: float = 1.0):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.batches_written = 0
+        self.write_seconds = 0.0
+        self.failed_rows: List[Tuple[str, Tuple]] = []
+        self._error: Optional[sqlite3.Error] = None
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._thread = threading.Thread(target=self._run, name="organizer-tracking", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, sql: str, params: Tuple):
+        """Queue one statement; it is written with the next batch"""
+        if self._closed:
+            raise RuntimeError("TrackingWriter is closed")
+        self._queue.put((sql, params))
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until everything submitted so far is committed"""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+        self._raise_failure()
+
+    def close(self):
+        """Flush pending rows, stop the writer thread and close the connection"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._conn.close()
+        atexit.unregister(self.close)
+        self._raise_failure()
+
+    def _raise_failure(self):
+        if self._error is not None:
+            raise RuntimeError(f"Tracking write failed for {len(self.failed_rows)} rows: "
+                               f"{self._error}") from self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _run(self):
+        pending: List[Tuple[str, Tuple]] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is self._STOP:
+                self._write(pending)
+                return
+            if isinstance(item, threading.Event):
+                self._write(pending)
+                pending = []
+                item.set()
+                continue
+            if item is not None:
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(item)
+            
+            if pending and (len(pending) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(pending)
+                pending = []
+
+    def _write(self, pending: List[Tuple[str, Tuple]]):
+        if not pending:
+            return
+        started = time.perf_counter()
+        try:
+            # executemany needs one statement per call; group consecutive runs
+            start = 0
+            for i in range(1, len(pending) + 1):
+                if i == len(pending) or pending[i][0] != pending[start][0]:
+                    self._conn.executemany(pending[start][0], [p for _, p in pending[start:i]])
+                    start = i
+            self._conn.commit()
+            self.rows_written += len(pending)
+            self.batches_written += 1
+        except sqlite3.Error as e:
+            self._conn.rollback()
+            self.failed_rows.extend(pending)
+            if self._error is None:
+                self._error = e
+            print(f"✗ Tracking write failed ({len(pending)} rows): {e}")
+        finally:
+            self.write_seconds += time.perf_counter() - started
+
+def init_tracking_db(db_path: str, batch_size: int = 500,
+                     flush_interval: float = 1.0) -> TrackingWriter:
+    """Initialize SQLite database for tracking and return its batched writer"""
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
@@ -336,51 +625,740 @@ def init_tracking_db(db_path: str):
             new_filename TEXT NOT NULL,
             file_hash TEXT,
             file_size INTEGER,
+            source_mtime REAL,
             classification TEXT,
             operation_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
             success BOOLEAN,
-            error_message TEXT
+            error_message TEXT,
+            duplicate_of TEXT
+        )
+    """)
+    
+    # Bring tracking databases from earlier versions up to date
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(file_operations)")}
+    if "source_mtime" not in columns:
+        cursor.execute("ALTER TABLE file_operations ADD COLUMN source_mtime REAL")
+    if "duplicate_of" not in columns:
+        cursor.execute("ALTER TABLE file_operations ADD COLUMN duplicate_of TEXT")
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_file_operations_original_path
+        ON file_operations (original_path)
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS organizer_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_dir TEXT NOT NULL,
+            target_root TEXT NOT NULL,
+            started_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            finished_at DATETIME,
+            status TEXT NOT NULL DEFAULT 'running'
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS extracted_text (
+            file_hash TEXT PRIMARY KEY,
+            text TEXT NOT NULL,
+            extracted_at DATETIME DEFAULT CURRENT_TIMESTAMP
         )
     """)
     
     conn.commit()
     conn.close()
     print(f"✓ Tracking database initialized\n")
+    return TrackingWriter(db_path, batch_size=batch_size, flush_interval=flush_interval)
 
-def log_file_operation(db_path: str, original_path: str, new_path: str, 
-                       classification: str, success: bool, error: str = None):
-    """Log file operation to database"""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    try:
-        with open(original_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
-        file_size = os.path.getsize(original_path)
-    except:
-        file_hash = None
-        file_size = None
+def log_file_operation(db: Union[str, TrackingWriter], original_path: str, new_path: str, 
+                       classification: str, success: bool, error: str = None,
+                       file_hash: Optional[str] = None, file_size: Optional[int] = None,
+                       source_mtime: Optional[float] = None, duplicate_of: Optional[str] = None):
+    """Log file operation to database
+
+    ``db`` is either the TrackingWriter returned by init_tracking_db (the row
+    is batched) or a database path (one connection and commit per call).
+    Pass ``file_hash``/``file_size`` when they are already known (e.g. from
+    copy_and_hash) so the source is not read again.
+    """
+    if file_hash is None:
+        try:
+            file_hash, file_size = hash_file(original_path)
+        except OSError:
+            file_hash = None
+            file_size = None
     
-    cursor.execute("""
-        INSERT INTO file_operations 
-        (original_path, original_filename, new_path, new_filename, 
-         file_hash, file_size, classification, success, error_message)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+    params = (
         original_path,
         os.path.basename(original_path),
         new_path,
         os.path.basename(new_path),
         file_hash,
         file_size,
+        source_mtime,
         classification,
         success,
-        error
-    ))
+        error,
+        duplicate_of
+    )
     
+    if isinstance(db, TrackingWriter):
+        db.submit(_INSERT_OPERATION_SQL, params)
+        return
+    
+    conn = sqlite3.connect(db)
+    conn.execute(_INSERT_OPERATION_SQL, params)
     conn.commit()
     conn.close()
 
+class OrganizedRecord(NamedTuple):
+    """Latest successful tracking row for a source path"""
+    row_id: int
+    new_path: str
+    file_hash: Optional[str]
+    file_size: Optional[int]
+    source_mtime: Optional[float]
+    classification: str
+    duplicate_of: Optional[str] = None
+
+def load_organized_index(db_path: str, target_root: str) -> Dict[str, OrganizedRecord]:
+    """Map each source path to its most recent successful operation into target_root
+
+    One tracking database can serve runs into several targets; a file
+    organized into another target does not count as organized here.
+    """
+    if not os.path.exists(db_path):
+        return {}
+    # new_path is always target_root joined with the destination
+    prefix = os.path.join(target_root, "")
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("""
+            SELECT id, original_path, new_path, file_hash, file_size, source_mtime, classification,
+                   duplicate_of
+            FROM file_operations
+            WHERE success AND substr(new_path, 1, ?) = ?
+            ORDER BY id
+        """, (len(prefix), prefix)).fetchall()
+    except sqlite3.OperationalError:
+        # Tracking database from before incremental runs
+        return {}
+    finally:
+        conn.close()
+    return {row[1]: OrganizedRecord(row[0], *row[2:]) for row in rows}
+
+def start_run(db_path: str, source_dir: str, target_root: str) -> int:
+    """Record the start of a run, reporting a previous run that never finished"""
+    conn = sqlite3.connect(db_path)
+    try:
+        previous = conn.execute("""
+            SELECT id, started_at FROM organizer_runs
+            WHERE source_dir = ? AND target_root = ? AND status = 'running'
+            ORDER BY id DESC LIMIT 1
+        """, (source_dir, target_root)).fetchone()
+        if previous:
+            print(f"↻ Resuming after interrupted run #{previous[0]} (started {previous[1]})\n")
+            conn.execute("UPDATE organizer_runs SET status = 'interrupted' WHERE id = ?",
+                         (previous[0],))
+        cursor = conn.execute("INSERT INTO organizer_runs (source_dir, target_root) VALUES (?, ?)",
+                              (source_dir, target_root))
+        conn.commit()
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
+_INSERT_TEXT_SQL = "INSERT OR REPLACE INTO extracted_text (file_hash, text) VALUES (?, ?)"
+
+def _content_mp_context():
+    """forkserver where the platform has it, otherwise spawn"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+class ContentExtractor:
+    """First-page text extraction in a bounded process pool, cached by SHA-256
+
+    The cache lives in the ``extracted_text`` table of the tracking database,
+    so a document is parsed once no matter how often it is renamed, copied
+    or re-scanned. New entries go through the run's TrackingWriter.
+    """
+
+    def __init__(self, db_path: str, tracker: Optional[TrackingWriter] = None,
+                 workers: int = 2):
+        self.db_path = db_path
+        self.tracker = tracker
+        self.workers = max(1, workers)
+        self.hits = 0
+        self.extracted = 0
+        self._memo: Dict[str, str] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _cached(self, file_hash: str) -> Optional[str]:
+        if file_hash in self._memo:
+            return self._memo[file_hash]
+        if self._conn is None:
+            # Opened on first use and kept, so the database is not created early
+            if not os.path.exists(self.db_path):
+                return None
+            self._conn = sqlite3.connect(self.db_path)
+        try:
+            row = self._conn.execute("SELECT text FROM extracted_text WHERE file_hash = ?",
+                                     (file_hash,)).fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        return row[0] if row else None
+
+    def submit(self, path: str, file_hash: str) -> Future:
+        """Future resolving to the first-page text of ``path``"""
+        text = self._cached(file_hash)
+        if text is not None:
+            self.hits += 1
+            future = Future()
+            future.set_result(text)
+            return future
+        if self._pool is None:
+            # Not fork: the copy and tracking threads may hold locks at fork time
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=_content_mp_context())
+        self.extracted += 1
+        future = self._pool.submit(extract_first_page_text, path)
+        future.add_done_callback(lambda done: self._store(file_hash, done))
+        return future
+
+    def _store(self, file_hash: str, future: Future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        text = future.result()
+        self._memo[file_hash] = text
+        # Without a tracker (dry runs) the text is only kept for this run
+        if self.tracker is not None:
+            self.tracker.submit(_INSERT_TEXT_SQL, (file_hash, text))
+
+    def close(self, cancel: bool = False):
+        if self._pool is not None:
+            self._pool.shutdown(wait=not cancel, cancel_futures=cancel)
+            self._pool = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(cancel=exc_type is not None)
+
+def needs_content(filename: str, destination: str) -> bool:
+    """Whether a file is worth opening: a PDF/DOCX its name could not place
+
+    PDFs are left alone without pypdf, so no empty text is cached for them.
+    """
+    if destination != UNCLASSIFIED_DESTINATION:
+        return False
+    ext = os.path.splitext(filename)[1].lower()
+    return ext in CONTENT_EXTENSIONS and (ext != ".pdf" or PdfReader is not None)
+
+# ═══════════════════════════════════════════════════════════════
+# 📦 STREAMING COPY + HASH
+# ═══════════════════════════════════════════════════════════════
+
+COPY_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+_copy_buffers = threading.local()
+
+def _chunk_buffer() -> memoryview:
+    """Per-thread reusable read buffer, so copy workers never share one"""
+    buffer = getattr(_copy_buffers, "buffer", None)
+    if buffer is None:
+        buffer = memoryview(bytearray(COPY_CHUNK_SIZE))
+        _copy_buffers.buffer = buffer
+    return buffer
+
+def hash_file(path: str) -> Tuple[str, int]:
+    """SHA-256 and size of a file, read in fixed-size chunks"""
+    digest = hashlib.sha256()
+    buffer = _chunk_buffer()
+    size = 0
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(buffer[:n])
+            size += n
+    return digest.hexdigest(), size
+
+def _write_all(dst, chunk: memoryview):
+    """Write all of chunk to an unbuffered file, which may accept only part of it per call"""
+    while chunk:
+        written = dst.write(chunk)
+        if not written:
+            raise OSError(f"short write to {dst.name}")
+        chunk = chunk[written:]
+
+def copy_and_hash(source_path: str, dest_path: str) -> Tuple[str, int]:
+    """Copy a file like shutil.copy2 while hashing it in the same pass.
+
+    Each chunk is read once into a reused buffer, fed to SHA-256 and written
+    to the destination, so peak memory is one chunk regardless of file size.
+    Returns (sha256 hexdigest, size in bytes).
+    """
+    digest = hashlib.sha256()
+    buffer = _chunk_buffer()
+    size = 0
+    _remove_existing(dest_path)
+    with open(source_path, 'rb', buffering=0) as src, open(dest_path, 'wb', buffering=0) as dst:
+        while True:
+            n = src.readinto(buffer)
+            if not n:
+                break
+            chunk = buffer[:n]
+            digest.update(chunk)
+            _write_all(dst, chunk)
+            size += n
+    shutil.copystat(source_path, dest_path)
+    return digest.hexdigest(), size
+
+# ═══════════════════════════════════════════════════════════════
+# ⚡ COPY STRATEGIES
+# ═══════════════════════════════════════════════════════════════
+
+# copy: stream through copy_and_hash (one userspace pass, source read once)
+# auto: hardlink on the same filesystem, in-kernel copy elsewhere
+# move: os.rename on the same filesystem, in-kernel copy + unlink elsewhere
+COPY_MODES = ("copy", "auto", "move")
+
+def _remove_existing(dest_path: str):
+    """Replace rather than truncate, so a hardlinked file never changes underneath"""
+    try:
+        os.unlink(dest_path)
+    except FileNotFoundError:
+        pass
+
+def same_filesystem(source_path: str, dest_dir: str) -> bool:
+    """True when a hardlink or rename from source_path into dest_dir can work"""
+    try:
+        return os.stat(source_path).st_dev == os.stat(dest_dir).st_dev
+    except OSError:
+        return False
+
+def kernel_copy(source_path: str, dest_path: str) -> str:
+    """Copy file data without passing it through userspace; returns the primitive used.
+
+    Tries os.copy_file_range (which can reflink on btrfs/XFS), then
+    os.sendfile, and raises OSError if neither is usable so the caller can
+    fall back to shutil.copy2. Metadata is copied as shutil.copy2 does.
+    """
+    with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+        size = os.fstat(src.fileno()).st_size
+        strategy = None
+        if hasattr(os, "copy_file_range"):
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.copy_file_range(src.fileno(), dst.fileno(), size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                strategy = "copy_file_range"
+            except OSError:
+                # EXDEV on older kernels, ENOSYS/EINVAL on some filesystems
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        if strategy is None:
+            if not hasattr(os, "sendfile"):
+                raise OSError("no in-kernel copy primitive available")
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            strategy = "sendfile"
+    shutil.copystat(source_path, dest_path)
+    return strategy
+
+def transfer_file(source_path: str, dest_path: str, mode: str = "copy",
+                  file_hash: Optional[str] = None) -> Tuple[str, int, str]:
+    """Place source_path at dest_path with the cheapest safe primitive.
+
+    Returns (sha256 hexdigest, size, strategy). Every strategy preserves the
+    same metadata as shutil.copy2 (hardlinks and renames share the inode).
+
+    Only "copy" hashes while it copies; hardlink, rename and the kernel
+    copies never see the data, so they read the file once more to hash it
+    for the tracking database. Pass ``file_hash`` when the source has
+    already been hashed (by dedup or content extraction) to skip that read.
+    A move across filesystems hashes the copy too and only unlinks the
+    source when both digests match.
+    """
+    if mode not in COPY_MODES:
+        raise ValueError(f"Unknown copy mode: {mode}")
+    if mode == "copy":
+        digest, size = copy_and_hash(source_path, dest_path)
+        return digest, size, "stream"
+    
+    _remove_existing(dest_path)
+    if same_filesystem(source_path, os.path.dirname(dest_path)):
+        try:
+            if mode == "move":
+                os.rename(source_path, dest_path)
+                strategy = "rename"
+            else:
+                os.link(source_path, dest_path)
+                strategy = "hardlink"
+            if file_hash is not None:
+                return file_hash, os.stat(dest_path).st_size, strategy
+            digest, size = hash_file(dest_path)
+            return digest, size, strategy
+        except OSError:
+            # e.g. a filesystem without hardlink support; copy instead
+            pass
+    
+    try:
+        strategy = kernel_copy(source_path, dest_path)
+    except OSError:
+        shutil.copy2(source_path, dest_path)
+        strategy = "copy2"
+    if mode == "move":
+        # The source is about to go, so check the copy before it does
+        digest = file_hash or hash_file(source_path)[0]
+        copied, size = hash_file(dest_path)
+        if copied != digest:
+            _remove_existing(dest_path)
+            raise OSError(f"copy of {source_path} does not match the source; source kept")
+        os.unlink(source_path)
+        return digest, size, strategy
+    if file_hash is not None:
+        return file_hash, os.stat(dest_path).st_size, strategy
+    digest, size = hash_file(source_path)
+    return digest, size, strategy
+
+# ═══════════════════════════════════════════════════════════════
+# 🧬 CONTENT DEDUPLICATION
+# ═══════════════════════════════════════════════════════════════
+
+PARTIAL_HASH_BYTES = 64 * 1024
+
+def partial_hash(path: str, size: int) -> str:
+    """SHA-256 of the first and last PARTIAL_HASH_BYTES of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        digest.update(f.read(PARTIAL_HASH_BYTES))
+        if size > PARTIAL_HASH_BYTES:
+            f.seek(max(PARTIAL_HASH_BYTES, size - PARTIAL_HASH_BYTES))
+            digest.update(f.read(PARTIAL_HASH_BYTES))
+    return digest.hexdigest()
+
+class DedupEntry:
+    """A file taking part in deduplication, hashing itself only on demand"""
+
+    __slots__ = ("path", "size", "organized_path", "_partial", "_full")
+
+    def __init__(self, path: str, size: int, organized_path: Optional[str] = None):
+        self.path = path
+        self.size = size
+        self.organized_path = organized_path
+        self._partial = None
+        self._full = None
+
+    def _readable_path(self) -> str:
+        # In move mode the source may already have been renamed into place
+        if self.organized_path and not os.path.exists(self.path):
+            return self.organized_path
+        return self.path
+
+    def partial(self) -> str:
+        if self._partial is None:
+            self._partial = partial_hash(self._readable_path(), self.size)
+        return self._partial
+
+    def known_full(self) -> Optional[str]:
+        """The full hash if something has needed it already, without reading the file"""
+        return self._full
+
+    def full(self) -> str:
+        if self._full is None:
+            self._full = hash_file(self._readable_path())[0]
+        return self._full
+
+    def same_content(self, other: "DedupEntry") -> bool:
+        """Size, then partial hash, then full hash"""
+        return (self.size == other.size
+                and self.partial() == other.partial()
+                and self.full() == other.full())
+
+class DuplicateFinder:
+    """Content index of the files organized so far in a run.
+
+    Candidates are bucketed by size, so a file with a unique size is never
+    read; same-size files are compared by partial hash before any full hash.
+    """
+
+    def __init__(self):
+        self._by_size: Dict[int, List[DedupEntry]] = defaultdict(list)
+
+    def add(self, source_path: str, size: int, organized_path: str):
+        self._by_size[size].append(DedupEntry(source_path, size, organized_path))
+
+    def find(self, probe: DedupEntry) -> Optional[DedupEntry]:
+        """Earlier entry with content identical to probe, if any"""
+        for entry in self._by_size.get(probe.size, ()):
+            if probe.same_content(entry):
+                return entry
+        return None
+
+def find_identical_occupant(dest_dir: str, new_filename: str, probe: DedupEntry,
+                            pending: set) -> Optional[DedupEntry]:
+    """Check the files already sitting on new_filename and its _copyN names.
+
+    Only files present on disk before this run are compared; paths that
+    are being written by this run are covered by DuplicateFinder instead.
+    """
+    base, ext = os.path.splitext(new_filename)
+    counter = 0
+    path = os.path.join(dest_dir, new_filename)
+    while os.path.exists(path):
+        if path not in pending:
+            try:
+                occupant = DedupEntry(path, os.path.getsize(path), path)
+                if probe.same_content(occupant):
+                    return occupant
+            except OSError:
+                pass
+        counter += 1
+        path = os.path.join(dest_dir, f"{base}_copy{counter}{ext}")
+    return None
+
+class DuplicateTask(NamedTuple):
+    """A file whose content is already organized elsewhere in the target"""
+    seq: int
+    filename: str
+    source_path: str
+    link_path: str
+    destination: str
+    original_path: str
+    size: int
+    file_hash: str
+    source_mtime: Optional[float]
+
+def link_duplicate(task: DuplicateTask, tracker: Union[str, TrackingWriter],
+                   remove_source: bool = False) -> Tuple[int, Optional[str]]:
+    """Hardlink a duplicate to its organized original; returns (bytes reclaimed, error).
+
+    When the link path is the original itself nothing is written. If the
+    hardlink cannot be made (missing original, cross-device, unsupported)
+    the duplicate's own source is copied instead. ``remove_source`` deletes
+    the duplicate's source afterwards, as the move copy mode does.
+    """
+    reclaimed = task.size
+    try:
+        if task.link_path != task.original_path:
+            os.makedirs(os.path.dirname(task.link_path), exist_ok=True)
+            try:
+                os.link(task.original_path, task.link_path)
+            except OSError:
+                copy_and_hash(task.source_path, task.link_path)
+                reclaimed = 0
+        if remove_source:
+            os.unlink(task.source_path)
+        log_file_operation(tracker, task.source_path, task.link_path, task.destination, True,
+                           file_hash=task.file_hash, file_size=task.size,
+                           source_mtime=task.source_mtime, duplicate_of=task.original_path)
+        print(f"≡ {task.filename} duplicate of {os.path.basename(task.original_path)}")
+        return reclaimed, None
+    except Exception as e:
+        print(f"✗ Error: {task.filename}: {str(e)}")
+        log_file_operation(tracker, task.source_path, "", task.destination, False, str(e))
+        return 0, str(e)
+
+# ═══════════════════════════════════════════════════════════════
+# 📂 DIRECTORY TRAVERSAL
+# ═══════════════════════════════════════════════════════════════
+
+def _list_directory(path: str) -> Tuple[List[os.DirEntry], List[str]]:
+    """One scandir pass: files (stat cached on the entry) and subdirectories"""
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Like os.walk, symlinked directories are not followed
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+                try:
+                    entry.stat()
+                except OSError:
+                    pass  # the caller's entry.stat() raises it again
+                files.append(entry)
+    except OSError:
+        pass  # unreadable directory: skipped, as os.walk does
+    return files, subdirs
+
+# Directory listings scan_tree keeps in flight per worker thread
+SCAN_PREFETCH_PER_WORKER = 4
+
+def scan_tree(source_dir: str, workers: int = 4) -> Iterable[os.DirEntry]:
+    """Yield every file under ``source_dir`` in os.walk order
+
+    Directory listings (and the stat of each file) are prefetched on
+    ``workers`` threads, so slow synced folders are read concurrently,
+    while entries are still yielded one directory at a time in a
+    deterministic order. At most ``SCAN_PREFETCH_PER_WORKER * workers``
+    listings are in flight or waiting to be consumed, always the ones the
+    walk reaches next, so a very wide tree does not queue a listing for
+    every directory at once. Call ``entry.stat()`` on the yielded entries;
+    the result is cached from the listing.
+    """
+    if workers <= 1:
+        stack = [source_dir]
+        while stack:
+            files, subdirs = _list_directory(stack.pop())
+            yield from files
+            stack.extend(reversed(subdirs))
+        return
+    
+    limit = SCAN_PREFETCH_PER_WORKER * workers
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan")
+    # [path, listing future or None], the next directory to walk on top
+    stack: List[list] = [[source_dir, None]]
+    outstanding = 0
+    
+    def prefetch():
+        # From the top down; only entries already submitted are skipped,
+        # so this looks at no more than 2 * limit entries
+        nonlocal outstanding
+        i = len(stack) - 1
+        while outstanding < limit and i >= 0:
+            if stack[i][1] is None:
+                stack[i][1] = executor.submit(_list_directory, stack[i][0])
+                outstanding += 1
+            i -= 1
+    
+    try:
+        prefetch()
+        while stack:
+            files, subdirs = stack.pop()[1].result()
+            outstanding -= 1
+            stack.extend([d, None] for d in reversed(subdirs))
+            prefetch()
+            yield from files
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+# ═══════════════════════════════════════════════════════════════
+# ⏱️ RUN INSTRUMENTATION
+# ═══════════════════════════════════════════════════════════════
+
+class StageStats:
+    """Time, item and byte counts for one pipeline stage"""
+
+    __slots__ = ("seconds", "items", "bytes", "samples", "slowest")
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.items = 0
+        self.bytes = 0
+        self.samples: List[float] = []
+        self.slowest: List[Tuple[float, str]] = []  # min-heap of the slowest files
+
+def _percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(-(-pct * len(sorted_samples) // 100)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+class RunMetrics:
+    """Per-stage timers and counters for one organize_dropbox run
+
+    Stages are timed on the thread that drives the run; per-file copy
+    timings measured on worker threads come back in CopyResult and are
+    recorded here in scan order, so no locking is needed.
+    """
+
+    def __init__(self, slowest: int = 10):
+        self.slowest_kept = slowest
+        self.stages: Dict[str, StageStats] = defaultdict(StageStats)
+        self.started = time.perf_counter()
+
+    def add(self, stage: str, seconds: float, nbytes: int = 0, path: Optional[str] = None):
+        """Record one item; items with a ``path`` also feed latency percentiles"""
+        stats = self.stages[stage]
+        stats.seconds += seconds
+        stats.items += 1
+        stats.bytes += nbytes
+        if path is not None:
+            stats.samples.append(seconds)
+            if len(stats.slowest) < self.slowest_kept:
+                heapq.heappush(stats.slowest, (seconds, path))
+            elif seconds > stats.slowest[0][0]:
+                heapq.heapreplace(stats.slowest, (seconds, path))
+
+    def add_time(self, stage: str, seconds: float, items: int = 0):
+        """Record time spent in a stage that is not per-file (e.g. batched writes)"""
+        stats = self.stages[stage]
+        stats.seconds += seconds
+        stats.items += items
+
+    @contextmanager
+    def timed(self, stage: str, nbytes: int = 0, path: Optional[str] = None):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started, nbytes, path)
+
+    def timed_iter(self, stage: str, iterable: Iterable) -> Iterable:
+        """Yield from ``iterable``, charging the time spent producing each item"""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_time(stage, time.perf_counter() - started)
+                return
+            self.add(stage, time.perf_counter() - started)
+            yield item
+
+    def summary(self) -> Dict:
+        """Machine-readable per-stage figures; see write_report"""
+        wall = time.perf_counter() - self.started
+        stages = {}
+        for name, stats in self.stages.items():
+            samples = sorted(stats.samples)
+            busy = stats.seconds
+            stages[name] = {
+                "seconds": round(busy, 6),
+                "items": stats.items,
+                "bytes": stats.bytes,
+                "files_per_sec": round(stats.items / busy, 2) if busy else None,
+                "bytes_per_sec": round(stats.bytes / busy, 2) if busy and stats.bytes else None,
+                "p50_ms": round(_percentile(samples, 50) * 1000, 3) if samples else None,
+                "p99_ms": round(_percentile(samples, 99) * 1000, 3) if samples else None,
+                "slowest": [{"path": path, "ms": round(seconds * 1000, 3)}
+                            for seconds, path in sorted(stats.slowest, reverse=True)],
+            }
+        return {"wall_seconds": round(wall, 6), "stages": stages}
+
+def report_path_for(db_path: str, run_id: int, when: Optional[datetime] = None) -> str:
+    """Run report location: next to the tracking DB, one file per run"""
+    stamp = (when or datetime.now()).strftime("%Y%m%d-%H%M%S")
+    return f"{os.path.splitext(db_path)[0]}_run{run_id}_{stamp}.json"
+
+def write_report(path: str, report: Dict):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
 # ═══════════════════════════════════════════════════════════════
 # 🚀 MAIN ORGANIZATION ENGINE
 # ═══════════════════════════════════════════════════════════════
@@ -397,9 +1375,182 @@ def create_folder_structure(root: str):
     create_recursive(root, MASTER_STRUCTURE)
     print(f"✓ Created folder structure\n")
 
+class CopyTask(NamedTuple):
+    """One classified file waiting to be copied"""
+    seq: int
+    filename: str
+    source_path: str
+    dest_path: str
+    destination: str
+    new_filename: str
+    source_mtime: Optional[float] = None
+    file_hash: Optional[str] = None
+
+class CopyResult(NamedTuple):
+    """Outcome of a CopyTask, applied to the run stats in scan order"""
+    task: CopyTask
+    success: bool
+    error: Optional[str] = None
+    strategy: Optional[str] = None
+    size: int = 0
+    seconds: float = 0.0
+
+def copy_one(task: CopyTask, tracker: Union[str, TrackingWriter],
+             copy_mode: str = "copy") -> CopyResult:
+    """Copy a single classified file and log it to the tracking database"""
+    started = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(task.dest_path), exist_ok=True)
+        file_hash, file_size, strategy = transfer_file(
+            task.source_path, task.dest_path, copy_mode, task.file_hash)
+        seconds = time.perf_counter() - started
+        log_file_operation(tracker, task.source_path, task.dest_path, task.destination, True,
+                           file_hash=file_hash, file_size=file_size,
+                           source_mtime=task.source_mtime)
+        print(f"✓ {task.filename} → {task.destination}/{task.new_filename}")
+        return CopyResult(task, True, strategy=strategy, size=file_size, seconds=seconds)
+    except Exception as e:
+        print(f"✗ Error: {task.filename}: {str(e)}")
+        log_file_operation(tracker, task.source_path, "", task.destination, False, str(e))
+        return CopyResult(task, False, str(e), seconds=time.perf_counter() - started)
+
+class CopyWorkerPool:
+    """Worker threads copying files fed through a bounded queue.
+
+    Classification keeps running on the calling thread and blocks on
+    ``submit`` once ``queue_size`` tasks are waiting, so memory stays
+    bounded however large the source tree is.
+    """
+
+    _STOP = None
+
+    def __init__(self, tracker: Union[str, TrackingWriter], workers: int = 4,
+                 queue_size: int = 64, copy_mode: str = "copy"):
+        self.tracker = tracker
+        self.copy_mode = copy_mode
+        self.tasks: "queue.Queue[Optional[CopyTask]]" = queue.Queue(maxsize=queue_size)
+        self.results: List[CopyResult] = []
+        self._results_lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"organizer-copy-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self):
+        while True:
+            task = self.tasks.get()
+            if task is self._STOP:
+                break
+            result = copy_one(task, self.tracker, self.copy_mode)
+            with self._results_lock:
+                self.results.append(result)
+
+    def submit(self, task: CopyTask):
+        self.tasks.put(task)
+
+    def join(self) -> List[CopyResult]:
+        """Wait for queued copies to finish and return results in scan order"""
+        for _ in self._threads:
+            self.tasks.put(self._STOP)
+        for thread in self._threads:
+            thread.join()
+        return sorted(self.results, key=lambda result: result.task.seq)
+
+    def cancel(self):
+        """Drop queued tasks and stop once in-flight copies finish"""
+        while True:
+            try:
+                self.tasks.get_nowait()
+            except queue.Empty:
+                break
+        self.join()
+
+def reserve_destination(target_root: str, destination: str, new_filename: str,
+                        reserved: set) -> Tuple[str, str]:
+    """Pick a free destination path, appending _copyN on collision.
+
+    Names handed out earlier in the same run count as taken even if their
+    copy has not finished yet, so renaming only depends on scan order.
+    """
+    dest_path = os.path.join(target_root, destination, new_filename)
+    
+    if dest_path in reserved or os.path.exists(dest_path):
+        base, ext = os.path.splitext(new_filename)
+        counter = 1
+        while dest_path in reserved or os.path.exists(dest_path):
+            new_filename = f"{base}_copy{counter}{ext}"
+            dest_path = os.path.join(target_root, destination, new_filename)
+            counter += 1
+    
+    reserved.add(dest_path)
+    return dest_path, new_filename
+
+def is_already_organized(record: Optional[OrganizedRecord], source_path: str,
+                         st: os.stat_result) -> bool:
+    """True if the tracked copy of source_path is still present and current.
+
+    Size and mtime matching is enough; when only the mtime moved, the source
+    is hashed and compared with the recorded digest.
+    """
+    if record is None or record.file_size != st.st_size:
+        return False
+    if not os.path.exists(record.new_path):
+        return False
+    if record.source_mtime == st.st_mtime:
+        return True
+    if record.file_hash:
+        try:
+            return hash_file(source_path)[0] == record.file_hash
+        except OSError:
+            return False
+    return False
+
 def organize_dropbox(source_dir: str, target_root: str, 
-                    db_path: str, dry_run: bool = False):
-    """Main organization function"""
+                    db_path: str, dry_run: bool = False,
+                    workers: int = 1, queue_size: int = 64,
+                    incremental: bool = False, dedup: bool = True,
+                    copy_mode: str = "copy", content: bool = False,
+                    content_workers: int = 2, scan_workers: int = 4,
+                    report: bool = True):
+    """Main organization function
+
+    The source tree is listed by scan_tree on ``scan_workers`` threads and
+    each file's stat comes from its directory listing.
+
+    With ``workers`` > 1 copies run on a thread pool fed through a bounded
+    queue; naming and the final stats are identical to a sequential run.
+
+    With ``incremental`` the file_operations table is consulted first and
+    files already organized and unchanged since are skipped. Every copied
+    file is tracked as it completes, so rerunning after an interruption
+    resumes where the previous run stopped.
+
+    With ``dedup`` a file whose content is already organized (earlier in
+    this run, or already on disk under the same name) is hardlinked to that
+    copy, or not written at all when it would land in the same folder,
+    instead of being copied again as _copyN.
+
+    ``copy_mode`` selects the copy strategy (see COPY_MODES): ``copy``
+    streams each file once while hashing it, ``auto`` hardlinks on the same
+    filesystem and copies in-kernel elsewhere, ``move`` renames files into
+    place and removes the originals.
+
+    With ``content`` PDF/DOCX files whose name alone lands them in
+    10c_Unclassified have their first page extracted (``content_workers``
+    processes, cached in the tracking database by SHA-256) and are
+    classified again with that text. Scanning and copying carry on while
+    at most a few batches of extractions are in flight.
+
+    Every stage (walk, classify, content, dedup, copy, link, log) is timed;
+    the summary prints throughput and per-file latency, and with ``report``
+    a live run also writes them as JSON next to the tracking DB (see
+    report_path_for).
+    """
+    if copy_mode not in COPY_MODES:
+        raise ValueError(f"copy_mode must be one of {COPY_MODES}, got {copy_mode!r}")
+    
     print(f"""
 ╔════════════════════════════════════════════════════════════════╗
 ║  🔥 DROPBOX ORGANIZER - CASE 1FDV-23-0001009 🔥              ║
@@ -408,62 +1559,244 @@ def organize_dropbox(source_dir: str, target_root: str,
 ╚════════════════════════════════════════════════════════════════╝
     """)
     
+    metrics = RunMetrics()
+    started_at = datetime.now()
+    tracker = None
+    run_id = None
     if not dry_run:
         create_folder_structure(target_root)
-        init_tracking_db(db_path)
+        tracker = init_tracking_db(db_path)
+        run_id = start_run(db_path, source_dir, target_root)
+    
+    organized = load_organized_index(db_path, target_root) if incremental else {}
     
     stats = {
         "total_scanned": 0,
         "successfully_moved": 0,
         "renamed": 0,
         "skipped": 0,
+        "unchanged": 0,
+        "duplicates": 0,
+        "reclaimed_bytes": 0,
         "errors": [],
-        "by_category": defaultdict(int)
+        "content_classified": 0,
+        "by_category": defaultdict(int),
+        "by_strategy": defaultdict(int)
     }
     
+    # Errors are keyed by scan position so parallel runs report them in the same order
+    errors: List[Tuple[int, str]] = []
+    reserved = set()
+    pending = set()
+    finder = DuplicateFinder()
+    duplicates: List[DuplicateTask] = []
+    pool = None
+    if workers > 1 and not dry_run:
+        pool = CopyWorkerPool(tracker, workers, queue_size, copy_mode)
+    extractor = None
+    # Files waiting on text extraction, classified in scan order
+    deferred = deque()
+    max_deferred = max(1, content_workers) * 4
+    if content:
+        extractor = ContentExtractor(db_path, tracker, content_workers)
+    
+    def apply_result(result: CopyResult):
+        task = result.task
+        metrics.add("copy", result.seconds, result.size, task.source_path)
+        if result.success:
+            stats["successfully_moved"] += 1
+            stats["by_strategy"][result.strategy] += 1
+            if task.new_filename != task.filename:
+                stats["renamed"] += 1
+        else:
+            errors.append((task.seq, f"Error: {task.filename}: {result.error}"))
+    
+    def record_error(seq: int, filename: str, source_path: str, destination: str, e: Exception):
+        error_msg = f"Error: {filename}: {str(e)}"
+        errors.append((seq, error_msg))
+        print(f"✗ {error_msg}")
+        if not dry_run:
+            log_file_operation(tracker, source_path, "", destination, False, str(e))
+    
+    def plan_file(seq: int, filename: str, source_path: str, st: os.stat_result,
+                  record: Optional[OrganizedRecord], destination: str, new_filename: str,
+                  probe: Optional[DedupEntry] = None):
+        """Deduplicate, name and dispatch one classified file"""
+        try:
+            source_mtime = st.st_mtime
+            category = destination.split('/')[0]
+            stats["by_category"][category] += 1
+            dest_dir = os.path.join(target_root, destination)
+            
+            if dedup:
+                probe = probe or DedupEntry(source_path, st.st_size)
+                with metrics.timed("dedup"):
+                    original = (finder.find(probe)
+                                or find_identical_occupant(dest_dir, new_filename, probe, pending))
+                if original is not None:
+                    if os.path.dirname(original.organized_path) == dest_dir:
+                        link_path = original.organized_path
+                    else:
+                        link_path, _ = reserve_destination(
+                            target_root, destination, new_filename, reserved)
+                    duplicates.append(DuplicateTask(
+                        seq, filename, source_path, link_path, destination,
+                        original.organized_path, st.st_size, probe.full(), source_mtime))
+                    if dry_run:
+                        print(f"[DRY RUN] ≡ {filename} duplicate of "
+                              f"{os.path.relpath(original.organized_path, target_root)}")
+                    return
+            
+            if (incremental and record is not None and record.duplicate_of is None and
+                    os.path.dirname(record.new_path) == dest_dir):
+                # A changed file replaces its own earlier copy rather than adding _copyN
+                dest_path, new_filename = record.new_path, os.path.basename(record.new_path)
+                reserved.add(dest_path)
+            else:
+                dest_path, new_filename = reserve_destination(
+                    target_root, destination, new_filename, reserved)
+            pending.add(dest_path)
+            if dedup:
+                finder.add(source_path, st.st_size, dest_path)
+            
+            task = CopyTask(seq, filename, source_path, dest_path, destination,
+                            new_filename, source_mtime,
+                            probe.known_full() if probe is not None else None)
+            if dry_run:
+                print(f"[DRY RUN] {filename} → {destination}/{new_filename}")
+            elif pool is not None:
+                # Time blocked here means the copy workers are the bottleneck
+                with metrics.timed("copy_queue_wait"):
+                    pool.submit(task)
+            else:
+                apply_result(copy_one(task, tracker, copy_mode))
+        
+        except Exception as e:
+            record_error(seq, filename, source_path, destination, e)
+    
+    def plan_deferred(seq: int, filename: str, source_path: str, st: os.stat_result,
+                      record: Optional[OrganizedRecord], probe: DedupEntry, future: Future):
+        """Classify a file again with its extracted text, then plan it"""
+        try:
+            with metrics.timed("content_wait"):
+                text = future.result()
+        except Exception:
+            text = ""
+        with metrics.timed("classify"):
+            destination, new_filename = classify_file(filename, "", text, st.st_mtime)
+        if destination != UNCLASSIFIED_DESTINATION:
+            stats["content_classified"] += 1
+        plan_file(seq, filename, source_path, st, record, destination, new_filename, probe)
+    
     print("🔍 Scanning files...\n")
     
-    for root, dirs, files in os.walk(source_dir):
-        for filename in files:
+    completed = False
+    try:
+        seq = 0
+        for entry in metrics.timed_iter("walk", scan_tree(source_dir, scan_workers)):
+            filename = entry.name
             stats["total_scanned"] += 1
-            source_path = os.path.join(root, filename)
+            source_path = entry.path
+            seq += 1
             
             if filename.startswith('.') or filename.endswith('.tmp'):
                 stats["skipped"] += 1
                 continue
             
             try:
-                destination, new_filename = classify_file(filename, "")
-                category = destination.split('/')[0]
-                stats["by_category"][category] += 1
-                
-                dest_path = os.path.join(target_root, destination, new_filename)
+                st = entry.stat()
+                source_mtime = st.st_mtime
+                record = organized.get(source_path)
+                if incremental:
+                    with metrics.timed("incremental_check"):
+                        unchanged = is_already_organized(record, source_path, st)
+                if incremental and unchanged:
+                    stats["unchanged"] += 1
+                    stats["by_category"][record.classification.split('/')[0]] += 1
+                    reserved.add(record.new_path)
+                    if dedup:
+                        finder.add(source_path, st.st_size, record.new_path)
+                    if tracker is not None and record.source_mtime != source_mtime:
+                        tracker.submit(_TOUCH_OPERATION_SQL, (source_mtime, record.row_id))
+                    continue
                 
-                if os.path.exists(dest_path):
-                    base, ext = os.path.splitext(new_filename)
-                    counter = 1
-                    while os.path.exists(dest_path):
-                        new_filename = f"{base}_copy{counter}{ext}"
-                        dest_path = os.path.join(target_root, destination, new_filename)
-                        counter += 1
-                
-                if dry_run:
-                    print(f"[DRY RUN] {filename} → {destination}/{new_filename}")
-                else:
-                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                    shutil.copy2(source_path, dest_path)
-                    log_file_operation(db_path, source_path, dest_path, destination, True)
-                    stats["successfully_moved"] += 1
-                    if new_filename != filename:
-                        stats["renamed"] += 1
-                    print(f"✓ {filename} → {destination}/{new_filename}")
-            
+                with metrics.timed("classify"):
+                    destination, new_filename = classify_file(filename, "", mtime=source_mtime)
+                if extractor is not None and needs_content(filename, destination):
+                    probe = DedupEntry(source_path, st.st_size)
+                    with metrics.timed("content_hash", st.st_size, source_path):
+                        file_hash = probe.full()
+                    future = extractor.submit(source_path, file_hash)
+                    deferred.append((seq, filename, source_path, st, record, probe, future))
+                    while len(deferred) > max_deferred:
+                        plan_deferred(*deferred.popleft())
+                    continue
             except Exception as e:
-                error_msg = f"Error: {filename}: {str(e)}"
-                stats["errors"].append(error_msg)
-                print(f"✗ {error_msg}")
-                if not dry_run:
-                    log_file_operation(db_path, source_path, "", destination, False, str(e))
+                record_error(seq, filename, source_path, "", e)
+                continue
+            
+            plan_file(seq, filename, source_path, st, record, destination, new_filename)
+    
+        while deferred:
+            plan_deferred(*deferred.popleft())
+        
+        if pool is not None:
+            with metrics.timed("copy_drain"):
+                results = pool.join()
+            for result in results:
+                apply_result(result)
+        
+        # Originals are all on disk now, so duplicates can be linked to them
+        for task in duplicates:
+            stats["duplicates"] += 1
+            if dry_run:
+                stats["reclaimed_bytes"] += task.size
+                continue
+            with metrics.timed("link", task.size, task.source_path):
+                reclaimed, error = link_duplicate(task, tracker, remove_source=copy_mode == "move")
+            stats["reclaimed_bytes"] += reclaimed
+            if error is not None:
+                errors.append((task.seq, f"Error: {task.filename}: {error}"))
+        completed = True
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted - flushing tracking database...")
+        if pool is not None:
+            pool.cancel()
+        if extractor is not None:
+            extractor.close(cancel=True)
+            extractor = None
+        raise
+    finally:
+        if extractor is not None:
+            extractor.close()
+        if tracker is not None:
+            # An interrupted run stays 'running' so the next run reports the resume
+            if completed:
+                tracker.submit(
+                    "UPDATE organizer_runs SET status = 'complete', "
+                    "finished_at = CURRENT_TIMESTAMP WHERE id = ?", (run_id,))
+            tracker.close()
+            metrics.add_time("log", tracker.write_seconds, tracker.rows_written)
+    
+    stats["errors"] = [msg for _, msg in sorted(errors)]
+    run_summary = metrics.summary()
+    report_path = None
+    if report and not dry_run:
+        report_path = report_path_for(db_path, run_id, started_at)
+        write_report(report_path, {
+            "run_id": run_id,
+            "source_dir": source_dir,
+            "target_root": target_root,
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "options": {"workers": workers, "scan_workers": scan_workers,
+                        "incremental": incremental, "dedup": dedup,
+                        "copy_mode": copy_mode, "content": content},
+            "counts": {**{key: value for key, value in stats.items() if key != "errors"},
+                       "errors": len(errors)},
+            "tracking": {"rows_written": tracker.rows_written,
+                         "batches_written": tracker.batches_written},
+            **run_summary,
+        })
     
     print("\n" + "="*70)
     print("🎯 ORGANIZATION COMPLETE!")
@@ -472,10 +1805,37 @@ def organize_dropbox(source_dir: str, target_root: str,
     print(f"Successfully Moved: {stats['successfully_moved']}")
     print(f"Files Renamed:      {stats['renamed']}")
     print(f"Skipped:            {stats['skipped']}")
+    print(f"Unchanged:          {stats['unchanged']}")
+    print(f"Duplicates:         {stats['duplicates']} "
+          f"({stats['reclaimed_bytes'] / (1024 * 1024):.1f} MB reclaimed)")
+    if content:
+        print(f"Content Classified: {stats['content_classified']} "
+              f"({extractor.hits} cached, {extractor.extracted} parsed)")
     print(f"Errors:             {len(stats['errors'])}")
     print("\n📊 Distribution:")
     for cat, count in sorted(stats['by_category'].items()):
         print(f"  {cat}: {count}")
+    if stats['by_strategy']:
+        print("\n⚡ Copy strategies:")
+        for strategy, count in sorted(stats['by_strategy'].items()):
+            print(f"  {strategy}: {count}")
+    print(f"\n⏱️  Stages ({run_summary['wall_seconds']:.2f}s wall):")
+    for name, stage in run_summary["stages"].items():
+        line = f"  {name:<18} {stage['seconds']:8.3f}s  {stage['items']:>7} items"
+        if stage["files_per_sec"]:
+            line += f"  {stage['files_per_sec']:>10.1f}/s"
+        if stage["bytes_per_sec"]:
+            line += f"  {stage['bytes_per_sec'] / (1024 * 1024):8.1f} MB/s"
+        if stage["p50_ms"] is not None:
+            line += f"  p50 {stage['p50_ms']:.2f}ms p99 {stage['p99_ms']:.2f}ms"
+        print(line)
+    copy_stage = run_summary["stages"].get("copy")
+    if copy_stage and copy_stage["slowest"]:
+        print("\n🐢 Slowest copies:")
+        for sample in copy_stage["slowest"][:5]:
+            print(f"  {sample['ms']:9.2f}ms  {sample['path']}")
+    if report_path:
+        print(f"\n📝 Run report: {report_path}")
     print("="*70 + "\n")
     
     return stats
@@ -492,6 +1852,19 @@ if __name__ == "__main__":
     DB_PATH = "/Users/casey/Dropbox/organization_tracking.db"
     
     DRY_RUN = "--dry-run" in sys.argv or "-d" in sys.argv
+    INCREMENTAL = "--incremental" in sys.argv or "-i" in sys.argv
+    DEDUP = "--no-dedup" not in sys.argv
+    CONTENT = "--content" in sys.argv
+    COPY_MODE = "copy"
+    WORKERS = 1
+    SCAN_WORKERS = 4
+    for arg in sys.argv[1:]:
+        if arg.startswith("--workers="):
+            WORKERS = max(1, int(arg.split("=", 1)[1]))
+        elif arg.startswith("--scan-workers="):
+            SCAN_WORKERS = max(1, int(arg.split("=", 1)[1]))
+        elif arg.startswith("--copy-mode="):
+            COPY_MODE = arg.split("=", 1)[1]
     
     if DRY_RUN:
         print("⚠️  DRY RUN MODE\n")
@@ -502,7 +1875,9 @@ if __name__ == "__main__":
             print("❌ Aborted")
             sys.exit(0)
     
-    results = organize_dropbox(SOURCE_DIR, TARGET_DIR, DB_PATH, DRY_RUN)
+    results = organize_dropbox(SOURCE_DIR, TARGET_DIR, DB_PATH, DRY_RUN, workers=WORKERS,
+                               incremental=INCREMENTAL, dedup=DEDUP, copy_mode=COPY_MODE,
+                               content=CONTENT, scan_workers=SCAN_WORKERS)
     
     print("🎉 COMPLETE!")
     print(f"\n📂 Organized: {TARGET_DIR}")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Bulk Repository Operations Benchmark
+
+Times importing, updating and deleting evidence rows in two ways:
+  per-row  - what BaseRepository.create/update/delete do for one record:
+             a transaction per row, plus a refresh SELECT after each write
+  bulk     - what create_many/update_many/delete_many do: chunked multi-row
+             INSERT ... RETURNING, executemany UPDATE and DELETE ... IN,
+             all in one transaction
+
+The statements are issued through a plain synchronous Session against a
+table shaped like ``evidence``, so the numbers are database round trips
+and commits, not repository overhead. SQLite runs on a file in a temporary
+directory (commits are synced to disk); pass --postgres with a database URL
+to run against PostgreSQL as well.
+
+Usage:
+  python scripts/bench_bulk_operations.py
+  python scripts/bench_bulk_operations.py --rows 20000 --chunk-size 500
+  python scripts/bench_bulk_operations.py --postgres postgresql+psycopg://localhost/bench
+"""
+import argparse
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy import JSON, Column, DateTime, String, Text, create_engine, delete, insert, update
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.sql import func
+
+Base = declarative_base()
+
+
+class Evidence(Base):
+    """The columns of casebuilder.db.models.Evidence, without foreign keys."""
+
+    __tablename__ = "bench_evidence"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    evidence_type = Column(String(50), nullable=False)
+    status = Column(String(50), default="pending_review")
+    chain_of_custody = Column(JSON, default=list)
+    metadata_ = Column("metadata", JSON, default=dict)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    case_id = Column(String(36), nullable=False)
+
+
+def chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def rows(count: int):
+    return [
+        {"title": f"Exhibit {i}", "description": f"Imported item {i}",
+         "evidence_type": "document", "case_id": "case-1"}
+        for i in range(count)
+    ]
+
+
+def per_row(engine, count: int, chunk_size: int):
+    timings = {}
+    with Session(engine, expire_on_commit=False) as session:
+        start = time.perf_counter()
+        created = []
+        for data in rows(count):
+            db_obj = Evidence(**data)
+            session.add(db_obj)
+            session.commit()
+            session.refresh(db_obj)
+            created.append(db_obj)
+        timings["create"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for db_obj in created:
+            db_obj.status = "admitted"
+            session.add(db_obj)
+            session.commit()
+            session.refresh(db_obj)
+        timings["update"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for db_obj in created:
+            session.execute(
+                delete(Evidence).where(Evidence.id == db_obj.id).returning(Evidence.id)
+            )
+            session.commit()
+        timings["delete"] = time.perf_counter() - start
+    return timings
+
+
+def bulk(engine, count: int, chunk_size: int):
+    timings = {}
+    with Session(engine, expire_on_commit=False) as session:
+        start = time.perf_counter()
+        created = []
+        for chunk in chunks(rows(count), chunk_size):
+            result = session.execute(
+                insert(Evidence).returning(Evidence, sort_by_parameter_order=True), chunk
+            )
+            created.extend(result.scalars().all())
+        session.commit()
+        timings["create"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        changes = [{"id": db_obj.id, "status": "admitted"} for db_obj in created]
+        for chunk in chunks(changes, chunk_size):
+            session.execute(update(Evidence), chunk)
+        session.commit()
+        timings["update"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ids = [db_obj.id for db_obj in created]
+        for chunk in chunks(ids, chunk_size):
+            session.execute(delete(Evidence).where(Evidence.id.in_(chunk)))
+        session.commit()
+        timings["delete"] = time.perf_counter() - start
+    return timings
+
+
+def run(label: str, url: str, count: int, chunk_size: int):
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    try:
+        slow = per_row(engine, count, chunk_size)
+        fast = bulk(engine, count, chunk_size)
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+    print(f"{label}: {count} rows, chunks of {chunk_size}")
+    for operation in ("create", "update", "delete"):
+        print(f"  {operation:7} per-row {slow[operation]:8.3f} s  "
+              f"bulk {fast[operation]:8.3f} s  ({slow[operation] / fast[operation]:6.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--postgres", metavar="URL", help="PostgreSQL database URL")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run("sqlite", f"sqlite:///{Path(tmp) / 'bench.db'}", args.rows, args.chunk_size)
+    if args.postgres:
+        run("postgresql", args.postgres, args.rows, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Classifier Benchmark
+
+Compares the original per-rule ``re.search`` loop against the compiled
+single-pass classifier in dropbox_organizer_case_1009 over synthetic
+filenames shaped like the Case 1FDV-23-0001009 Dropbox export.
+
+Usage:
+  python scripts/bench_classifier.py            # 100,000 filenames
+  python scripts/bench_classifier.py -n 20000
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dropbox_organizer_case_1009 import (  # noqa: E402
+    CLASSIFICATION_RULES,
+    CompiledClassifier,
+    classify_files,
+)
+
+WORDS = (
+    "Motion to Quash Rule 58 Audio Record Reconsideration Plaintiff Casey Sanctions "
+    "Trial Date Defendant Teresa Brower ORDER Approved Signed Scheduling Protective "
+    "TRO Exhibit_T OFW Exhibit-U MyChart Doctor School Report Nanoa Science Exhibit_X "
+    "Asset Debt CSEA Child Support Subpoena Return of Service ChatGPT exporter Aloha "
+    "Kai Chat Evidence Management Setup Legal Tracker Custody Strategy Request.json "
+    "christmas Ex Parte Expedite Hearing Withdraw Counsel February 19 2025 notes scan "
+    "IMG receipt invoice photo draft final v2 2023-04-11 Dkt 112"
+).split()
+
+EXTENSIONS = [".pdf", ".docx", ".json", ".jpg", ".png", ".txt"]
+
+
+def synthetic_filenames(count: int, seed: int = 1009):
+    """Build a reproducible mix of docket PDFs and free-form filenames"""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(count):
+        if rng.random() < 0.05:
+            names.append(f"{rng.randint(10**9, 10**10 - 1)}.pdf")
+        else:
+            words = rng.choices(WORDS, k=rng.randint(1, 6))
+            names.append("_".join(words) + rng.choice(EXTENSIONS))
+    return names
+
+
+def legacy_match_rule(filename: str, description: str = ""):
+    """The original rule loop: two re.search calls per rule"""
+    for index, (pattern, _, _) in enumerate(CLASSIFICATION_RULES):
+        if (re.search(pattern, filename, re.IGNORECASE)
+                or re.search(pattern, description, re.IGNORECASE)):
+            return index
+    return None
+
+
+def timed(label: str, func, names):
+    start = time.perf_counter()
+    result = func(names)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f}s  {len(names) / elapsed:>12,.0f} files/sec")
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", "--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    names = synthetic_filenames(args.count)
+    classifier = CompiledClassifier()
+
+    print(f"\n📊 Classifying {len(names):,} synthetic filenames\n")
+    legacy_time, legacy = timed(
+        "legacy rule loop", lambda ns: [legacy_match_rule(n) for n in ns], names)
+    compiled_time, compiled = timed(
+        "compiled rule matching", lambda ns: [classifier.match_rule(n) for n in ns], names)
+    timed("classify_files (full)", classify_files, names)
+
+    mismatches = sum(1 for a, b in zip(legacy, compiled) if a != b)
+    print(f"\n  Speedup (rule matching): {legacy_time / compiled_time:.1f}x")
+    print(f"  Rule mismatches:         {mismatches}\n")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Copy Strategy Benchmark
+
+Times the organizer's copy strategies on a synthetic tree:
+  copy2     - shutil.copy2, then a separate hash pass (the original path)
+  stream    - copy_and_hash, one userspace pass          (copy_mode="copy")
+  kernel    - kernel_copy (copy_file_range/sendfile) + hash
+  hardlink  - os.link + hash                             (copy_mode="auto")
+  rename    - os.rename + hash                           (copy_mode="move")
+  hardlink-known, rename-known - the same with the hash passed in, as when
+              dedup or content extraction has already read the file
+
+hardlink and rename move no data, but the organizer still records a SHA-256
+for every file, so without a known hash they read the whole file once; on
+large files that read, not the link, is most of their time. stream is the
+only strategy that hashes while copying.
+
+Usage:
+  python scripts/bench_copy_strategies.py
+  python scripts/bench_copy_strategies.py --files 200 --size-mb 8 --dir /mnt/dropbox/tmp
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dropbox_organizer_case_1009 import (  # noqa: E402
+    copy_and_hash,
+    hash_file,
+    kernel_copy,
+    transfer_file,
+)
+
+
+def build_tree(root: Path, files: int, size: int):
+    """Write `files` files of `size` random-ish bytes across a few subfolders"""
+    block = os.urandom(min(size, 1024 * 1024))
+    for i in range(files):
+        folder = root / f"batch_{i % 10:02d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        with open(folder / f"evidence_{i:05d}.bin", "wb") as f:
+            remaining = size
+            f.write(i.to_bytes(8, "little"))  # keep every file distinct
+            while remaining > 0:
+                f.write(block[:remaining])
+                remaining -= len(block)
+
+
+# Stands in for a digest computed earlier; only its presence matters here
+KNOWN_HASH = "0" * 64
+
+
+def copy2_then_hash(src: str, dst: str):
+    shutil.copy2(src, dst)
+    return hash_file(src)
+
+
+def kernel_then_hash(src: str, dst: str):
+    kernel_copy(src, dst)
+    return hash_file(src)
+
+
+STRATEGIES = {
+    "copy2": copy2_then_hash,
+    "stream": copy_and_hash,
+    "kernel": kernel_then_hash,
+    "hardlink": lambda src, dst: transfer_file(src, dst, "auto"),
+    "rename": lambda src, dst: transfer_file(src, dst, "move"),
+    "hardlink-known": lambda src, dst: transfer_file(src, dst, "auto", KNOWN_HASH),
+    "rename-known": lambda src, dst: transfer_file(src, dst, "move", KNOWN_HASH),
+}
+
+
+def run(strategy: str, source: Path, target: Path):
+    func = STRATEGIES[strategy]
+    sources = sorted(p for p in source.rglob("*") if p.is_file())
+    total = sum(p.stat().st_size for p in sources)
+    start = time.perf_counter()
+    for src in sources:
+        dst = target / src.relative_to(source)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        func(str(src), str(dst))
+    elapsed = time.perf_counter() - start
+    return elapsed, total, len(sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--dir", default=None, help="where to build the tree (default: temp dir)")
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1024 * 1024)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        tmp = Path(tmp)
+        print(f"\n📊 {args.files} files x {args.size_mb} MB in {tmp}\n")
+        for strategy in STRATEGIES:
+            source, target = tmp / f"src_{strategy}", tmp / f"dst_{strategy}"
+            build_tree(source, args.files, size)
+            elapsed, total, count = run(strategy, source, target)
+            print(f"  {strategy:<14} {elapsed:8.3f}s  {total / elapsed / 1024 ** 2:10.1f} MB/s"
+                  f"  {count / elapsed:10.1f} files/sec")
+            shutil.rmtree(source, ignore_errors=True)
+            shutil.rmtree(target, ignore_errors=True)
+        print()
+
+
+if __name__ == "__main__":
+    main()
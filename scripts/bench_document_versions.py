@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Document Version Tree Benchmark
+
+Times fetching a document's versions, asked for by its newest version,
+for version chains of growing depth:
+  walk  - the old get_document_versions: one SELECT per ancestor up the
+          parent_id chain, then one for the versions
+  cte   - the current get_document_versions: a single recursive CTE that
+          walks up to the original and down the whole tree
+
+Queries go through a plain synchronous Session against the ``documents``
+table, which also holds unrelated version chains; the cte timing runs the
+repository's own statement. SQLite runs on a file in a temporary
+directory; pass --postgres with the URL of a scratch database (its
+CaseBuilder tables are dropped afterwards) to run against PostgreSQL as
+well.
+
+Usage:
+  python scripts/bench_document_versions.py
+  python scripts/bench_document_versions.py --depths 10 40 200 --repeat 50
+  python scripts/bench_document_versions.py --postgres postgresql+psycopg://localhost/bench
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, or_, select
+from sqlalchemy.orm import Session
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from casebuilder.db.models import Base, Case, Document, User
+from casebuilder.db.repositories.document import _version_tree_query
+
+
+def populate(session: Session, depths, chains: int):
+    """Build ``chains`` version chains of each depth; return each depth's newest id."""
+    newest = {}
+    session.add(User(id="u1", email="bench@example.com", hashed_password="x"))
+    session.add(Case(id="c1", title="Benchmark", owner_id="u1"))
+    for depth in depths:
+        for chain in range(chains):
+            parent = None
+            for version in range(depth):
+                doc_id = f"d{depth}-c{chain}-v{version}"
+                session.add(Document(
+                    id=doc_id, title=f"Brief v{version}", file_path=f"/bench/{doc_id}",
+                    file_name=f"{doc_id}.pdf", file_size=version, file_type="application/pdf",
+                    file_hash=doc_id, case_id="c1", uploaded_by_id="u1", parent_id=parent
+                ))
+                parent = doc_id
+        newest[depth] = f"d{depth}-c0-v{depth - 1}"
+    session.commit()
+    return newest
+
+
+def walk(session: Session, document_id: str):
+    doc = session.execute(select(Document).where(Document.id == document_id)).scalar_one()
+    queries = 1
+    while doc.parent_id is not None:
+        doc = session.execute(select(Document).where(Document.id == doc.parent_id)).scalar_one()
+        queries += 1
+    versions = session.execute(
+        select(Document)
+        .where(or_(Document.id == doc.id, Document.parent_id == doc.id))
+        .order_by(Document.created_at)
+    ).scalars().all()
+    return versions, queries + 1
+
+
+def cte(session: Session, document_id: str):
+    versions = session.execute(
+        _version_tree_query(), {"document_id": document_id}
+    ).scalars().all()
+    return versions, 1
+
+
+def timed(fetch, session: Session, document_id: str, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        session.expunge_all()
+        versions, queries = fetch(session, document_id)
+    return (time.perf_counter() - start) / repeat, len(versions), queries
+
+
+def run(label: str, url: str, depths, chains: int, repeat: int):
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            newest = populate(session, depths, chains)
+            print(f"{label}: {chains} chains per depth")
+            for depth in depths:
+                slow, slow_rows, slow_queries = timed(walk, session, newest[depth], repeat)
+                fast, fast_rows, _ = timed(cte, session, newest[depth], repeat)
+                print(f"  depth {depth:4}  walk {slow * 1000:8.2f} ms ({slow_queries:4} queries, "
+                      f"{slow_rows:4} rows)  cte {fast * 1000:8.2f} ms (1 query, {fast_rows:4} rows)"
+                      f"  ({slow / fast:5.1f}x)")
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--depths", type=int, nargs="+", default=[10, 40, 200, 1000])
+    parser.add_argument("--chains", type=int, default=50, help="Version chains per depth")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--postgres", metavar="URL", help="PostgreSQL database URL")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run("sqlite", f"sqlite:///{Path(tmp) / 'bench.db'}", args.depths, args.chains, args.repeat)
+    if args.postgres:
+        run("postgresql", args.postgres, args.depths, args.chains, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
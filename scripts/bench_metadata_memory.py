@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+FileMetadata Memory Benchmark
+
+Measures the memory held by the results of a large scan in three shapes:
+  legacy   - the old FileMetadata dataclass (per-instance __dict__) whose
+             ``metadata`` is the whole scan dictionary
+  slotted  - the current slotted FileMetadata with only extra scan details
+             in ``metadata``
+  batch    - a columnar FileMetadataBatch
+
+Entries are synthetic (no filesystem access) and memory is taken with
+tracemalloc, so the numbers are Python heap bytes per entry. Each shape is
+built and released in turn.
+
+Usage:
+  python scripts/bench_metadata_memory.py
+  python scripts/bench_metadata_memory.py --entries 200000
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from casebuilder.services.fileboss_integration import (  # noqa: E402
+    FileMetadata, FileMetadataBatch, FileType
+)
+
+EXTENSIONS = [
+    ('.pdf', FileType.DOCUMENT, 'application/pdf'),
+    ('.docx', FileType.DOCUMENT,
+     'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
+    ('.jpg', FileType.IMAGE, 'image/jpeg'),
+    ('.mp3', FileType.AUDIO, 'audio/mpeg'),
+    ('.mp4', FileType.VIDEO, 'video/mp4'),
+    ('.csv', FileType.DATA, 'text/csv'),
+]
+
+
+@dataclass
+class LegacyFileMetadata:
+    """FileMetadata as it was before slots"""
+    path: Path
+    name: str
+    size: int
+    file_type: FileType
+    extension: str
+    mime_type: str
+    created: float
+    modified: float
+    hash: str = ""
+    case_id: Optional[str] = None
+    evidence_id: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def scan_entries(count: int):
+    """Scan dictionaries shaped like _iter_scan_directory's"""
+    for i in range(count):
+        extension, file_type, mime_type = EXTENSIONS[i % len(EXTENSIONS)]
+        name = f"item_{i:07d}{extension}"
+        # splitext().lower() gives every scanned file its own extension string
+        yield {
+            'path': Path(f"/evidence/custodian_{i % 7}/box_{i // 1000:04d}/{name}"),
+            'name': name,
+            'extension': extension.upper().lower(),
+            'size': 1000 + i,
+            'created': 1.7e9 + i,
+            'modified': 1.7e9 + i,
+            'inode': 10_000_000 + i,
+            'type': file_type,
+        }, mime_type
+
+
+def build_legacy(count: int):
+    return [
+        LegacyFileMetadata(
+            path=info['path'], name=info['name'], size=info['size'], file_type=info['type'],
+            extension=info['extension'], mime_type=mime_type, created=info['created'],
+            modified=info['modified'], metadata=info
+        )
+        for info, mime_type in scan_entries(count)
+    ]
+
+
+def build_slotted(count: int):
+    return [
+        FileMetadata(
+            path=info['path'], name=info['name'], size=info['size'], file_type=info['type'],
+            extension=sys.intern(info['extension']), mime_type=mime_type,
+            created=info['created'], modified=info['modified'],
+            metadata={'inode': info['inode']}
+        )
+        for info, mime_type in scan_entries(count)
+    ]
+
+
+def build_batch(count: int):
+    batch = FileMetadataBatch()
+    for info, mime_type in scan_entries(count):
+        batch.append(info['path'], info['size'], info['modified'], info['created'],
+                     info['type'], info['extension'], mime_type)
+    return batch
+
+
+def measure(build, count: int):
+    """Build the representation; return (bytes held, peak bytes, seconds)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(count)
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return current, peak, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.entries} entries\n")
+    baseline = None
+    for name, build in (("legacy", build_legacy), ("slotted", build_slotted),
+                        ("batch", build_batch)):
+        current, peak, seconds = measure(build, args.entries)
+        baseline = baseline or current
+        print(f"{name:8} {current / 2**20:8.1f} MiB  {current / args.entries:7.1f} B/entry  "
+              f"peak {peak / 2**20:8.1f} MiB  {seconds:6.2f} s  "
+              f"({current / baseline:4.0%} of legacy)")
+
+
+if __name__ == "__main__":
+    main()
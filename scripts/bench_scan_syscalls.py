@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Directory Scan Syscall Benchmark
+
+Compares FileBossIntegrator's old Path.glob('**/*') scan with the
+scandir-based _scan_directory on a synthetic tree, counting the
+filesystem calls each one makes per scanned entry:
+  scandir   - os.scandir() directory listings
+  stat      - os.stat()/os.lstat() (Path.is_file, Path.stat, ...)
+  entry     - first DirEntry.stat() per entry (one stat syscall on POSIX;
+              DirEntry.is_file/is_dir are answered from the listing)
+
+The counts are taken at the Python level; run under `strace -f -c` to
+see the raw syscall totals.
+
+Usage:
+  python scripts/bench_scan_syscalls.py
+  python scripts/bench_scan_syscalls.py --dirs 200 --files 50 --dir /mnt/evidence/tmp
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from casebuilder.services.fileboss_integration import FileBossIntegrator  # noqa: E402
+
+SUPPORTED_EXTENSIONS = {
+    'document': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.md', '.odt'],
+    'image': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.svg'],
+    'audio': ['.mp3', '.wav', '.aac', '.flac', '.ogg', '.m4a'],
+    'video': ['.mp4', '.avi', '.mov', '.wmv', '.mkv', '.flv', '.webm'],
+    'archive': ['.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'],
+    'code': ['.py', '.js', '.java', '.c', '.cpp', '.h', '.hpp', '.cs', '.go', '.rs', '.rb', '.php', '.swift'],
+    'data': ['.json', '.xml', '.csv', '.xls', '.xlsx', '.db', '.sqlite']
+}
+
+# Mix of wanted and unwanted names, as on a real evidence drive
+SUFFIXES = ['.pdf', '.jpg', '.docx', '.tmp', '.log', '.mp3', '', '.bak', '.csv', '.DS_Store']
+
+
+def build_tree(root: Path, dirs: int, files: int):
+    """`dirs` folders (plus a .git folder) of `files` small files each"""
+    for d in range(dirs):
+        folder = root / f"custodian_{d % 7}" / f"box_{d:04d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        for f in range(files):
+            (folder / f"item_{f:04d}{SUFFIXES[f % len(SUFFIXES)]}").write_bytes(b"x")
+    git = root / ".git" / "objects"
+    git.mkdir(parents=True, exist_ok=True)
+    for f in range(files * 5):
+        (git / f"obj_{f:05d}.txt").write_bytes(b"x")
+
+
+def legacy_scan(integrator: FileBossIntegrator, directory: Path):
+    """The pre-scandir _scan_directory loop"""
+    extensions = set()
+    for exts in integrator.supported_extensions.values():
+        extensions.update(exts)
+    files = []
+    for file_path in directory.glob('**/*'):
+        if file_path.is_file() and file_path.suffix.lower() in extensions:
+            stat = file_path.stat()
+            files.append({'path': file_path, 'size': stat.st_size})
+    return files
+
+
+class CountingEntry:
+    """DirEntry proxy counting the first stat() of each entry"""
+
+    def __init__(self, entry, counts: Counter):
+        self._entry = entry
+        self._counts = counts
+        self._statted = False
+
+    def stat(self, **kwargs):
+        if not self._statted:
+            self._statted = True
+            self._counts['entry'] += 1
+        return self._entry.stat(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._entry, name)
+
+    def __fspath__(self):
+        return self._entry.path
+
+
+class CountingScandir:
+    def __init__(self, it, counts: Counter):
+        self._it = it
+        self._counts = counts
+
+    def __iter__(self):
+        return (CountingEntry(entry, self._counts) for entry in self._it)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._it.close()
+
+    def close(self):
+        self._it.close()
+
+
+def count_calls(fn):
+    """Run fn() with os.scandir/os.stat/os.lstat wrapped; return (result, counts, seconds)"""
+    counts = Counter()
+    real_scandir, real_stat, real_lstat = os.scandir, os.stat, os.lstat
+
+    def scandir(path='.'):
+        counts['scandir'] += 1
+        return CountingScandir(real_scandir(path), counts)
+
+    def stat(*args, **kwargs):
+        counts['stat'] += 1
+        return real_stat(*args, **kwargs)
+
+    def lstat(*args, **kwargs):
+        counts['stat'] += 1
+        return real_lstat(*args, **kwargs)
+
+    os.scandir, os.stat, os.lstat = scandir, stat, lstat
+    try:
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+    finally:
+        os.scandir, os.stat, os.lstat = real_scandir, real_stat, real_lstat
+    return result, counts, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dirs", type=int, default=100)
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--dir", help="Where to build the tree (default: system temp dir)")
+    args = parser.parse_args()
+
+    integrator = FileBossIntegrator.__new__(FileBossIntegrator)
+    integrator.config = {}
+    integrator.supported_extensions = SUPPORTED_EXTENSIONS
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        root = Path(tmp)
+        build_tree(root, args.dirs, args.files)
+        entries = sum(len(dirs) + len(files) for _, dirs, files in os.walk(root))
+        print(f"{entries} entries, {args.dirs} directories\n")
+
+        # Warm the dentry cache so both runs see the same state
+        legacy_scan(integrator, root)
+
+        for name, fn in (("glob", lambda: legacy_scan(integrator, root)),
+                         ("scandir", lambda: integrator._scan_directory(root))):
+            found, counts, seconds = count_calls(fn)
+            total = sum(counts.values())
+            print(f"{name:8} {len(found):7} files  {seconds * 1000:8.1f} ms  "
+                  f"{total / entries:5.2f} calls/entry  "
+                  f"(scandir {counts['scandir']}, stat {counts['stat']}, entry {counts['entry']})")
+
+
+if __name__ == "__main__":
+    main()
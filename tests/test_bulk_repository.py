@@ -0,0 +1,131 @@
+"""Tests for the create_many/update_many/delete_many bulk repository methods."""
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import IntegrityError
+
+pytest.importorskip("greenlet")  # for the async engine
+pytest.importorskip("aiosqlite")
+# ImportError, not just a missing module: the repository modules' relative
+# imports do not resolve in every checkout
+EvidenceRepositoryAsync = pytest.importorskip(
+    "casebuilder.db.repositories.evidence", exc_type=ImportError
+).EvidenceRepositoryAsync
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from casebuilder.db.models import Base, Evidence, EvidenceType  # noqa: E402
+
+
+def _run(tmp_path, scenario):
+    """Run ``scenario(repository, statements)`` against a fresh SQLite database."""
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+        statements = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split()[0])
+
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        statements.clear()
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                return await scenario(EvidenceRepositoryAsync(session), statements)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def _items(count, **fields):
+    return [
+        {"title": f"Exhibit {i}", "evidence_type": EvidenceType.DOCUMENT, "case_id": "c1", **fields}
+        for i in range(count)
+    ]
+
+
+async def _stored(repository):
+    result = await repository.db_session.execute(
+        select(Evidence.id, Evidence.title, Evidence.metadata_).order_by(Evidence.title)
+    )
+    return result.all()
+
+
+def test_create_many_inserts_in_chunks_and_returns_rows_in_order(tmp_path):
+    async def scenario(repository, statements):
+        created = await repository.create_many(_items(5), chunk_size=2, description="imported")
+        return created, statements.count("INSERT"), await _stored(repository)
+
+    created, inserts, stored = _run(tmp_path, scenario)
+
+    assert [item.title for item in created] == [f"Exhibit {i}" for i in range(5)]
+    assert all(item.id and item.created_at is not None for item in created)
+    assert all(item.description == "imported" for item in created)
+    assert inserts == 3
+    assert [row.title for row in stored] == [f"Exhibit {i}" for i in range(5)]
+
+
+def test_create_many_failure_rolls_back_every_chunk(tmp_path):
+    async def scenario(repository, statements):
+        rows = _items(3) + [{"title": None, "evidence_type": EvidenceType.DOCUMENT,
+                             "case_id": "c1"}]
+        with pytest.raises(IntegrityError):
+            await repository.create_many(rows, chunk_size=2)
+        return await repository.db_session.scalar(select(func.count()).select_from(Evidence))
+
+    assert _run(tmp_path, scenario) == 0
+
+
+def test_update_many_returns_rows_matched(tmp_path):
+    async def scenario(repository, statements):
+        created = await repository.create_many(_items(4))
+        statements.clear()
+        updated = await repository.update_many([
+            {"id": created[0].id, "title": "Exhibit A"},
+            {"id": created[1].id, "title": "Exhibit B"},
+            # A different set of fields, including one stored under another column name
+            {"id": created[2].id, "metadata_": {"pages": 3}},
+            {"id": "no-such-id", "title": "Exhibit Z"},
+        ])
+        return updated, statements.count("UPDATE"), await _stored(repository)
+
+    updated, update_statements, stored = _run(tmp_path, scenario)
+
+    assert updated == 3
+    assert update_statements == 2
+    assert [(row.title, row.metadata_) for row in stored] == [
+        ("Exhibit 2", {"pages": 3}), ("Exhibit 3", {}), ("Exhibit A", {}), ("Exhibit B", {}),
+    ]
+
+
+def test_update_many_counts_per_row_without_multi_rowcount(tmp_path, monkeypatch):
+    async def scenario(repository, statements):
+        created = await repository.create_many(_items(3))
+        monkeypatch.setattr(repository.dialect, "supports_sane_multi_rowcount", False)
+        statements.clear()
+        updated = await repository.update_many(
+            [{"id": item.id, "title": f"Renamed {item.title}"} for item in created]
+            + [{"id": "no-such-id", "title": "Missing"}]
+        )
+        return updated, statements.count("UPDATE")
+
+    assert _run(tmp_path, scenario) == (3, 4)
+
+
+def test_delete_many_returns_rows_deleted(tmp_path):
+    async def scenario(repository, statements):
+        created = await repository.create_many(_items(5))
+        statements.clear()
+        deleted = await repository.delete_many(
+            [item.id for item in created[:3]] + ["no-such-id"], chunk_size=2
+        )
+        return deleted, statements.count("DELETE"), await _stored(repository)
+
+    deleted, deletes, stored = _run(tmp_path, scenario)
+
+    assert deleted == 3
+    assert deletes == 2
+    assert [row.title for row in stored] == ["Exhibit 3", "Exhibit 4"]
@@ -0,0 +1,121 @@
+"""Tests for the custody event hash chain and its backfill migration."""
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import JSON, Column, DateTime, MetaData, String, Table, create_engine, select
+
+# ImportError, not just a missing module: casebuilder.db's __init__ does not
+# import cleanly in every checkout
+custody = pytest.importorskip("casebuilder.db.custody", exc_type=ImportError)
+GENESIS_HASH = custody.GENESIS_HASH
+custody_event_hash = custody.custody_event_hash
+verify_custody_chain = custody.verify_custody_chain
+
+MIGRATION = (
+    Path(__file__).parent.parent / "alembic" / "versions" / "a438c3077ff4_add_custody_events.py"
+)
+
+
+def _chain(evidence_id, actions):
+    events, previous_hash = [], GENESIS_HASH
+    start = datetime(2024, 3, 1, 9, 30)
+    for sequence, action in enumerate(actions):
+        fields = dict(
+            previous_hash=previous_hash, evidence_id=evidence_id, sequence=sequence,
+            action=action, actor_id="u1", occurred_at=start + timedelta(hours=sequence),
+            details={"location": f"locker {sequence}"},
+        )
+        previous_hash = custody_event_hash(**fields)
+        events.append(SimpleNamespace(**fields, hash=previous_hash))
+    return events
+
+
+def test_intact_chain_verifies():
+    assert verify_custody_chain(_chain("e1", ["collected", "transferred", "examined"])) is None
+    assert verify_custody_chain([]) is None
+
+
+def test_edits_deletions_and_reordering_are_detected():
+    events = _chain("e1", ["collected", "transferred", "examined", "returned"])
+    events[1].details = {"location": "somewhere else"}
+    assert verify_custody_chain(events) == 1
+
+    events = _chain("e1", ["collected", "transferred", "examined", "returned"])
+    assert verify_custody_chain(events[:1] + events[2:]) == 2
+
+    events = _chain("e1", ["collected", "transferred", "examined"])
+    events[1], events[2] = events[2], events[1]
+    assert verify_custody_chain(events) == 2
+
+    # An event copied from another item's chain does not fit
+    events = _chain("e1", ["collected", "transferred"])
+    events[1] = _chain("e2", ["collected", "transferred"])[1]
+    assert verify_custody_chain(events) == 1
+
+
+def test_hash_is_independent_of_timestamp_timezone():
+    fields = dict(previous_hash=GENESIS_HASH, evidence_id="e1", sequence=0, action="collected",
+                  actor_id=None, details={})
+    aware = datetime(2024, 3, 1, 11, 30, tzinfo=timezone(timedelta(hours=2)))
+    assert (custody_event_hash(occurred_at=aware, **fields)
+            == custody_event_hash(occurred_at=datetime(2024, 3, 1, 9, 30), **fields))
+
+
+def test_migration_backfills_and_restores_json_chains():
+    pytest.importorskip("alembic.migration")
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    spec = importlib.util.spec_from_file_location("custody_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    metadata = MetaData()
+    Table("users", metadata, Column("id", String(36), primary_key=True))
+    evidence = Table(
+        "evidence", metadata,
+        Column("id", String(36), primary_key=True),
+        Column("chain_of_custody", JSON),
+        Column("created_at", DateTime),
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    chain = [
+        {"action": "collected", "timestamp": "2024-03-01T09:30:00", "user_id": "u1",
+         "location": "scene"},
+        {"action": "transferred", "timestamp": "2024-03-02T10:00:00", "user_id": "u2"},
+        {"note": "no action or timestamp recorded"},
+    ]
+
+    with engine.begin() as connection:
+        connection.execute(evidence.insert(), [
+            {"id": "e1", "chain_of_custody": chain, "created_at": datetime(2024, 2, 28)},
+            {"id": "e2", "chain_of_custody": [], "created_at": datetime(2024, 2, 28)},
+        ])
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+
+        events = connection.execute(
+            select(migration.custody_events).order_by(migration.custody_events.c.sequence)
+        ).all()
+        assert [(e.evidence_id, e.action, e.actor_id) for e in events] == [
+            ("e1", "collected", "u1"), ("e1", "transferred", "u2"), ("e1", "custody_event", None),
+        ]
+        assert events[0].details == {"location": "scene"}
+        assert events[2].occurred_at == datetime(2024, 2, 28)
+        assert verify_custody_chain(events) is None
+
+        connection.execute(evidence.update().values(chain_of_custody=None))
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.downgrade()
+
+        restored = connection.execute(
+            select(evidence.c.chain_of_custody).where(evidence.c.id == "e1")
+        ).scalar_one()
+        assert [entry["action"] for entry in restored] == [
+            "collected", "transferred", "custody_event"
+        ]
+        assert restored[0]["location"] == "scene"
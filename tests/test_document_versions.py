@@ -0,0 +1,118 @@
+"""Tests for document version trees and the documents.parent_id migration."""
+import asyncio
+import importlib.util
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, create_engine, inspect
+
+pytest.importorskip("greenlet")  # for the async engine
+pytest.importorskip("aiosqlite")
+# ImportError, not just a missing module: the repository modules' relative
+# imports do not resolve in every checkout
+DocumentRepositoryAsync = pytest.importorskip(
+    "casebuilder.db.repositories.document", exc_type=ImportError
+).DocumentRepositoryAsync
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from casebuilder.db.models import Base, Document  # noqa: E402
+
+MIGRATION = (
+    Path(__file__).parent.parent / "alembic" / "versions" / "16a5f9cd18d7_add_documents_parent_id.py"
+)
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location("parent_id_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    return migration
+
+
+def test_migration_adds_and_drops_parent_id():
+    pytest.importorskip("alembic.migration")
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    migration = _load_migration()
+    metadata = MetaData()
+    documents = Table(
+        "documents", metadata,
+        Column("id", String(36), primary_key=True),
+        Column("title", String(255), nullable=False),
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(documents.insert(), [{"id": "d1", "title": "Brief"}])
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+            # A second run (e.g. after create_all) changes nothing
+            migration.upgrade()
+
+        inspector = inspect(connection)
+        assert "parent_id" in {c["name"] for c in inspector.get_columns("documents")}
+        assert {i["name"]: i["column_names"] for i in inspector.get_indexes("documents")} == {
+            "ix_documents_parent_id": ["parent_id"]
+        }
+        assert [fk["referred_columns"] for fk in inspector.get_foreign_keys("documents")] == [
+            ["id"]
+        ]
+        assert connection.exec_driver_sql("SELECT id, title FROM documents").all() == [
+            ("d1", "Brief")
+        ]
+
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.downgrade()
+
+        inspector = inspect(connection)
+        assert "parent_id" not in {c["name"] for c in inspector.get_columns("documents")}
+        assert inspector.get_indexes("documents") == []
+
+
+# Version trees: r -> (a -> a1 -> a2, b) and an unrelated s -> s1
+VERSIONS = [("r", None), ("a", "r"), ("b", "r"), ("a1", "a"), ("s", None), ("a2", "a1"),
+            ("s1", "s")]
+
+
+def _versions_of(tmp_path, document_ids):
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'versions.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        try:
+            async with AsyncSession(engine) as session:
+                start = datetime(2024, 3, 1)
+                session.add_all(
+                    Document(id=doc_id, parent_id=parent_id, title=f"Brief {doc_id}",
+                             file_path=f"/cas/{doc_id}", file_name=f"{doc_id}.pdf",
+                             file_size=1, file_type="application/pdf", file_hash=doc_id,
+                             case_id="c1", uploaded_by_id="u1",
+                             created_at=start + timedelta(days=day))
+                    for day, (doc_id, parent_id) in enumerate(VERSIONS)
+                )
+                await session.commit()
+                repository = DocumentRepositoryAsync(session)
+                return {
+                    doc_id: [doc.id for doc in await repository.get_document_versions(doc_id)]
+                    for doc_id in document_ids
+                }
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_get_document_versions_returns_the_whole_tree(tmp_path):
+    tree = ["r", "a", "b", "a1", "a2"]
+
+    versions = _versions_of(tmp_path, ["r", "a", "b", "a1", "a2", "s", "s1", "missing"])
+
+    # Asked for by the original, a leaf, a sibling branch or a middle version
+    for doc_id in ("r", "a", "b", "a1", "a2"):
+        assert versions[doc_id] == tree
+    assert versions["s"] == versions["s1"] == ["s", "s1"]
+    assert versions["missing"] == []
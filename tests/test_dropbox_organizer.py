@@ -0,0 +1,591 @@
+"""Tests for the Case 1FDV-23-0001009 Dropbox organizer"""
+import re
+
+import pytest
+
+import dropbox_organizer_case_1009 as organizer
+
+
+def _reference_classify(filename, description=""):
+    """The original per-rule loop, kept here as the behavioural reference"""
+    for index, (pattern, _, _) in enumerate(organizer.CLASSIFICATION_RULES):
+        if (re.search(pattern, filename, re.IGNORECASE)
+                or re.search(pattern, description, re.IGNORECASE)):
+            return index
+    return None
+
+
+SAMPLE_FILES = [
+    ("1234567890.pdf", ""),
+    ("NEF_2024-03-01.pdf", ""),
+    ("Motion to Quash per Rule 58.pdf", ""),
+    ("Casey_Motion_for_Custody.pdf", ""),
+    ("Teresa Motion for Sanctions.pdf", ""),
+    ("Signed Scheduling ORDER.pdf", ""),
+    ("Approved Protective Order TRO.pdf", ""),
+    ("Exhibit_T_messages.pdf", ""),
+    ("scan.pdf", "note from Doctor visit"),
+    ("School Subpoena Return of Service.pdf", ""),
+    ("Asset and Debt Statement 2023.pdf", ""),
+    ("ChatGPT_Exporter_dump.json", ""),
+    ("Feb 19 hearing prep.docx", ""),
+    ("IMG_0042.jpg", ""),
+    ("random_notes.txt", "Filed: 3/4/24 Dkt 112"),
+]
+
+
+@pytest.mark.parametrize("filename,description", SAMPLE_FILES)
+def test_compiled_classifier_matches_rule_loop(filename, description):
+    classifier = organizer.CompiledClassifier()
+    assert classifier.match_rule(filename, description) == _reference_classify(filename, description)
+
+
+def test_description_can_win_with_earlier_rule():
+    # filename alone hits the Exhibit_U rule, the description hits the earlier NEF rule
+    destination, _ = organizer.classify_file("Exhibit_U_labs.pdf", "Notice of Electronic Filing")
+    assert destination == "01_COURT_FILINGS/01e_Notices/NEF_Notices"
+
+
+def test_subfolder_post_rules():
+    assert organizer.classify_file("Signed Scheduling ORDER.pdf")[0] == \
+        "01_COURT_FILINGS/01d_Court_Orders/Scheduling_Orders"
+    assert organizer.classify_file("School Subpoena.pdf")[0] == \
+        "03_DISCOVERY/03d_Subpoenas/School_Subpoenas"
+    assert organizer.classify_file("1234567890.pdf")[0] == \
+        "01_COURT_FILINGS/01a_Docket_Entries/2024"
+
+
+def test_classify_files_batch():
+    items = ["IMG_0042.jpg", ("scan.pdf", "Child Support worksheet")]
+    assert organizer.classify_files(items) == [
+        organizer.classify_file("IMG_0042.jpg"),
+        organizer.classify_file("scan.pdf", "Child Support worksheet"),
+    ]
+
+
+def test_smart_filename():
+    name = organizer.generate_smart_filename("Motion 2024-03-01 Dkt 45.pdf")
+    assert name == "20240301_MOTION_Dkt45_Motion_2024-03-01_Dkt_45pdf.pdf"
+
+
+def _make_source_tree(root):
+    files = {
+        "a/Casey_Motion_for_Custody.pdf": b"one",
+        "b/Casey_Motion_for_Custody.pdf": b"two",
+        "c/Casey_Motion_for_Custody.pdf": b"three",
+        "a/IMG_0042.jpg": b"img",
+        "b/.hidden": b"skip",
+        "b/scratch.tmp": b"skip",
+        "c/Exhibit_T_messages.pdf": b"ofw",
+    }
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def _tree_listing(root):
+    return sorted(
+        (str(p.relative_to(root)), p.read_bytes()) for p in root.rglob("*") if p.is_file()
+    )
+
+
+def test_parallel_workers_match_sequential_run(tmp_path):
+    source = tmp_path / "source"
+    _make_source_tree(source)
+
+    sequential = organizer.organize_dropbox(
+        str(source), str(tmp_path / "seq"), str(tmp_path / "seq.db"))
+    parallel = organizer.organize_dropbox(
+        str(source), str(tmp_path / "par"), str(tmp_path / "par.db"), workers=4, queue_size=2)
+
+    assert parallel == sequential
+    assert sequential["successfully_moved"] == 5
+    assert sequential["skipped"] == 2
+    assert _tree_listing(tmp_path / "par") == _tree_listing(tmp_path / "seq")
+
+
+def test_copy_and_hash_streams_in_chunks(tmp_path, monkeypatch):
+    import hashlib
+    import os
+
+    monkeypatch.setattr(organizer, "COPY_CHUNK_SIZE", 7)
+    monkeypatch.setattr(organizer, "_copy_buffers", organizer.threading.local())
+    data = os.urandom(1000)
+    src = tmp_path / "src.bin"
+    src.write_bytes(data)
+    os.utime(src, (1_600_000_000, 1_600_000_000))
+
+    digest, size = organizer.copy_and_hash(str(src), str(tmp_path / "dst.bin"))
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert size == len(data)
+    assert (tmp_path / "dst.bin").read_bytes() == data
+    assert os.stat(tmp_path / "dst.bin").st_mtime == 1_600_000_000
+
+
+def test_copy_and_hash_completes_short_writes(tmp_path, monkeypatch):
+    import builtins
+    import hashlib
+    import os
+
+    class ShortWriter:
+        """Unbuffered file that takes at most 5 bytes per write"""
+
+        def __init__(self, f):
+            self.f = f
+            self.name = f.name
+
+        def write(self, data):
+            return self.f.write(data[:5])
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.f.close()
+
+    def short_open(path, mode='r', *args, **kwargs):
+        f = builtins.open(path, mode, *args, **kwargs)
+        return ShortWriter(f) if 'w' in mode else f
+
+    monkeypatch.setattr(organizer, "open", short_open, raising=False)
+    data = os.urandom(1000)
+    src = tmp_path / "src.bin"
+    src.write_bytes(data)
+
+    digest, size = organizer.copy_and_hash(str(src), str(tmp_path / "dst.bin"))
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert size == len(data)
+    assert (tmp_path / "dst.bin").read_bytes() == data
+
+
+def test_tracking_rows_carry_hash_and_size(tmp_path):
+    import hashlib
+    import sqlite3
+
+    source = tmp_path / "source"
+    _make_source_tree(source)
+    db_path = tmp_path / "tracking.db"
+    organizer.organize_dropbox(str(source), str(tmp_path / "out"), str(db_path))
+
+    rows = sqlite3.connect(db_path).execute(
+        "SELECT original_path, file_hash, file_size FROM file_operations WHERE success"
+    ).fetchall()
+    assert len(rows) == 5
+    for original_path, file_hash, file_size in rows:
+        data = open(original_path, "rb").read()
+        assert file_hash == hashlib.sha256(data).hexdigest()
+        assert file_size == len(data)
+
+
+def test_tracking_writer_batches_and_flushes_on_close(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "tracking.db")
+    writer = organizer.init_tracking_db(db_path, batch_size=4, flush_interval=60)
+    for i in range(10):
+        organizer.log_file_operation(writer, f"/src/{i}.pdf", f"/dst/{i}.pdf", "10_ARCHIVE",
+                                     True, file_hash="x", file_size=i)
+    writer.flush()
+    assert writer.rows_written == 10
+    organizer.log_file_operation(writer, "/src/last.pdf", "", "10_ARCHIVE", False, "boom",
+                                 file_hash="y", file_size=0)
+    writer.close()
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("SELECT COUNT(*) FROM file_operations").fetchone()[0] == 11
+
+
+def test_tracking_writer_keeps_failed_rows_and_raises(tmp_path):
+    db_path = str(tmp_path / "tracking.db")
+    writer = organizer.init_tracking_db(db_path, batch_size=2, flush_interval=60)
+    writer.submit("INSERT INTO no_such_table VALUES (?)", (1,))
+    writer.submit("INSERT INTO no_such_table VALUES (?)", (2,))
+    organizer.log_file_operation(writer, "/src/a.pdf", "/dst/a.pdf", "10_ARCHIVE", True,
+                                 file_hash="x", file_size=1)
+    with pytest.raises(RuntimeError, match="failed for 2 rows"):
+        writer.flush()
+    assert writer.rows_written == 1
+    assert [params for _, params in writer.failed_rows] == [(1,), (2,)]
+    with pytest.raises(RuntimeError, match="no_such_table"):
+        writer.close()
+
+
+def test_incremental_run_skips_unchanged_files(tmp_path):
+    import os
+
+    source = tmp_path / "source"
+    _make_source_tree(source)
+    target, db_path = str(tmp_path / "out"), str(tmp_path / "tracking.db")
+
+    first = organizer.organize_dropbox(str(source), target, db_path, incremental=True)
+    assert first["successfully_moved"] == 5
+
+    (source / "a" / "IMG_0042.jpg").write_bytes(b"edited image")
+    (source / "d").mkdir()
+    (source / "d" / "new_filing.pdf").write_bytes(b"new")
+    # touched but identical content is still treated as organized
+    os.utime(source / "c" / "Exhibit_T_messages.pdf", (1_700_000_000, 1_700_000_000))
+
+    second = organizer.organize_dropbox(str(source), target, db_path, incremental=True)
+    assert second["unchanged"] == 4
+    assert second["successfully_moved"] == 2
+    assert sum(second["by_category"].values()) == 6
+    assert len(list((tmp_path / "out").rglob("*IMG_0042*"))) == 1
+
+    third = organizer.organize_dropbox(str(source), target, db_path, incremental=True)
+    assert third["unchanged"] == 6
+    assert third["successfully_moved"] == 0
+
+
+def test_incremental_run_is_per_target(tmp_path):
+    import os
+
+    source = tmp_path / "source"
+    _make_source_tree(source)
+    db_path = str(tmp_path / "tracking.db")
+
+    organizer.organize_dropbox(str(source), str(tmp_path / "out"), db_path, incremental=True)
+    other = organizer.organize_dropbox(str(source), str(tmp_path / "out2"), db_path,
+                                       incremental=True)
+
+    assert other["successfully_moved"] == 5
+    assert other["unchanged"] == 0
+    for target in ("out", "out2"):
+        index = organizer.load_organized_index(db_path, str(tmp_path / target))
+        assert len(index) == 5
+        assert all(record.new_path.startswith(os.path.join(tmp_path, target, ""))
+                   for record in index.values())
+
+
+def test_interrupted_run_is_reported_on_resume(tmp_path, capsys):
+    import sqlite3
+
+    db_path = str(tmp_path / "tracking.db")
+    organizer.init_tracking_db(db_path).close()
+    first = organizer.start_run(db_path, "/src", "/out")
+    organizer.start_run(db_path, "/src", "/out")
+
+    assert f"interrupted run #{first}" in capsys.readouterr().out
+    status = sqlite3.connect(db_path).execute(
+        "SELECT status FROM organizer_runs WHERE id = ?", (first,)).fetchone()[0]
+    assert status == "interrupted"
+
+
+def test_identical_content_is_linked_not_copied(tmp_path):
+    import os
+    import sqlite3
+
+    source = tmp_path / "source"
+    payload = b"same bytes" * 1000
+    for rel in ("a/Casey_Motion_for_Custody.pdf", "b/Casey_Motion_for_Custody.pdf",
+                "c/Exhibit_T_messages.pdf"):
+        (source / rel).parent.mkdir(parents=True, exist_ok=True)
+        (source / rel).write_bytes(payload)
+    (source / "c" / "Casey_Motion_for_Custody.pdf").write_bytes(b"different" * 1111 + b"!")
+
+    target, db_path = tmp_path / "out", str(tmp_path / "tracking.db")
+    stats = organizer.organize_dropbox(str(source), str(target), db_path, workers=2)
+
+    assert stats["successfully_moved"] == 2
+    assert stats["duplicates"] == 2
+    assert stats["reclaimed_bytes"] == 2 * len(payload)
+    motions = sorted(p.name for p in target.rglob("*Custody*"))
+    assert len(motions) == 2  # no _copy for the identical one, _copy1 for the different one
+    exhibit = next(target.rglob("*Exhibit_T*"))
+    assert os.stat(exhibit).st_nlink == 2
+
+    rows = sqlite3.connect(db_path).execute(
+        "SELECT COUNT(*) FROM file_operations WHERE duplicate_of IS NOT NULL").fetchone()
+    assert rows[0] == 2
+
+    again = organizer.organize_dropbox(str(source), str(target), db_path, incremental=True)
+    assert again["unchanged"] == 4
+
+
+@pytest.mark.parametrize("mode,expected", [
+    ("copy", "stream"),
+    ("auto", "hardlink"),
+    ("move", "rename"),
+])
+def test_transfer_file_strategies(tmp_path, mode, expected):
+    import hashlib
+    import os
+
+    src = tmp_path / "src.pdf"
+    src.write_bytes(b"evidence" * 100)
+    os.utime(src, (1_600_000_000, 1_600_000_000))
+    dst = tmp_path / "out" / "dst.pdf"
+    dst.parent.mkdir()
+
+    digest, size, strategy = organizer.transfer_file(str(src), str(dst), mode)
+
+    assert strategy == expected
+    assert digest == hashlib.sha256(b"evidence" * 100).hexdigest()
+    assert size == 800
+    assert dst.read_bytes() == b"evidence" * 100
+    assert os.stat(dst).st_mtime == 1_600_000_000
+    assert src.exists() == (mode != "move")
+
+
+def test_move_across_filesystems_keeps_source_when_copy_differs(tmp_path, monkeypatch):
+    src = tmp_path / "src.pdf"
+    src.write_bytes(b"evidence" * 100)
+    dst = tmp_path / "dst.pdf"
+    monkeypatch.setattr(organizer, "same_filesystem", lambda *args: False)
+
+    def truncating_copy(source_path, dest_path):
+        with open(source_path, "rb") as f:
+            (tmp_path / "dst.pdf").write_bytes(f.read()[:-1])
+        return "copy_file_range"
+
+    monkeypatch.setattr(organizer, "kernel_copy", truncating_copy)
+    with pytest.raises(OSError, match="source kept"):
+        organizer.transfer_file(str(src), str(dst), "move")
+    assert src.read_bytes() == b"evidence" * 100
+    assert not dst.exists()
+
+    monkeypatch.undo()
+    monkeypatch.setattr(organizer, "same_filesystem", lambda *args: False)
+    digest, size, _ = organizer.transfer_file(str(src), str(dst), "move")
+    assert (digest, size) == (organizer.hash_file(str(dst))[0], 800)
+    assert not src.exists()
+
+
+def test_transfer_file_with_known_hash_skips_the_read_back(tmp_path, monkeypatch):
+    src = tmp_path / "src.pdf"
+    src.write_bytes(b"evidence" * 100)
+    known = organizer.hash_file(str(src))[0]
+
+    def no_hash(path):
+        raise AssertionError(f"{path} read again")
+
+    monkeypatch.setattr(organizer, "hash_file", no_hash)
+    assert organizer.transfer_file(str(src), str(tmp_path / "link.pdf"), "auto", known) == (
+        known, 800, "hardlink")
+    assert organizer.transfer_file(str(src), str(tmp_path / "moved.pdf"), "move", known) == (
+        known, 800, "rename")
+
+
+def test_kernel_copy_preserves_data_and_metadata(tmp_path):
+    import os
+
+    src = tmp_path / "big.bin"
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    src.write_bytes(data)
+    os.utime(src, (1_500_000_000, 1_500_000_000))
+
+    strategy = organizer.kernel_copy(str(src), str(tmp_path / "copy.bin"))
+
+    assert strategy in ("copy_file_range", "sendfile")
+    assert (tmp_path / "copy.bin").read_bytes() == data
+    assert os.stat(tmp_path / "copy.bin").st_mtime == 1_500_000_000
+
+
+def test_move_mode_empties_source(tmp_path):
+    source = tmp_path / "source"
+    _make_source_tree(source)
+    (source / "d").mkdir()
+    (source / "d" / "Exhibit_T_copy.pdf").write_bytes(b"ofw")
+
+    stats = organizer.organize_dropbox(str(source), str(tmp_path / "out"),
+                                       str(tmp_path / "tracking.db"), workers=3,
+                                       copy_mode="move")
+
+    assert stats["by_strategy"] == {"rename": 5}
+    assert stats["duplicates"] == 1
+    remaining = sorted(p.name for p in source.rglob("*") if p.is_file())
+    assert remaining == [".hidden", "scratch.tmp"]
+
+
+def _write_docx(path, first_page, second_page=""):
+    import zipfile
+
+    def paragraph(text):
+        return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+    body = paragraph(first_page)
+    if second_page:
+        body += '<w:p><w:r><w:br w:type="page"/></w:r></w:p>' + paragraph(second_page)
+    xml = ('<?xml version="1.0" encoding="UTF-8"?><w:document xmlns:w="urn:w">'
+           f"<w:body>{body}</w:body></w:document>")
+    with zipfile.ZipFile(path, "w") as docx:
+        docx.writestr("word/document.xml", xml)
+
+
+def test_extract_first_page_text_stops_at_page_break(tmp_path):
+    _write_docx(tmp_path / "scan.docx", "Casey Motion &amp; Declaration", "Exhibit T")
+
+    text = organizer.extract_first_page_text(str(tmp_path / "scan.docx"))
+
+    assert text == "Casey Motion & Declaration"
+    (tmp_path / "broken.docx").write_bytes(b"not a zip")
+    assert organizer.extract_first_page_text(str(tmp_path / "broken.docx")) == ""
+
+
+def test_extract_pdf_without_pypdf_returns_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr(organizer, "PdfReader", None)
+    (tmp_path / "scan.pdf").write_bytes(b"%PDF-1.4")
+
+    assert organizer.extract_first_page_text(str(tmp_path / "scan.pdf")) == ""
+
+
+def test_pdfs_need_no_content_without_pypdf(monkeypatch):
+    unplaced = organizer.UNCLASSIFIED_DESTINATION
+    monkeypatch.setattr(organizer, "PdfReader", None)
+
+    assert not organizer.needs_content("scan_0001.pdf", unplaced)
+    assert organizer.needs_content("scan_0001.docx", unplaced)
+
+    monkeypatch.setattr(organizer, "PdfReader", object)
+    assert organizer.needs_content("scan_0001.pdf", unplaced)
+    assert not organizer.needs_content("scan_0001.pdf", "02_EVIDENCE")
+
+
+def test_content_cache_reads_share_one_connection(tmp_path, monkeypatch):
+    import sqlite3
+
+    db = tmp_path / "tracking.db"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE extracted_text (file_hash TEXT PRIMARY KEY, text TEXT)")
+        conn.executemany("INSERT INTO extracted_text VALUES (?, ?)",
+                         [(f"h{i}", f"text {i}") for i in range(5)])
+    conn.close()
+    opened = []
+    connect = sqlite3.connect
+    monkeypatch.setattr(organizer.sqlite3, "connect",
+                        lambda *args, **kwargs: opened.append(args) or connect(*args, **kwargs))
+
+    with organizer.ContentExtractor(str(db)) as extractor:
+        texts = [extractor.submit("unused.pdf", f"h{i}").result() for i in range(5)]
+
+    assert texts == [f"text {i}" for i in range(5)]
+    assert extractor.hits == 5
+    assert len(opened) == 1
+    assert extractor._conn is None
+
+
+def test_content_joins_rule_matching_but_not_naming():
+    destination, name = organizer.classify_file("scan_0001.pdf", "", "Exhibit T OFW messages")
+
+    assert destination == "02_EVIDENCE/02a_Teresa_Exhibits/Exhibit_T_OFW_Communications"
+    assert name == organizer.generate_smart_filename("scan_0001.pdf")
+
+
+def test_content_stage_classifies_and_caches_text(tmp_path):
+    import sqlite3
+
+    source = tmp_path / "source"
+    source.mkdir()
+    _write_docx(source / "scan_0001.docx", "Plaintiff Motion for Custody")
+    _write_docx(source / "scan_0002.docx", "Grocery list")
+    db = tmp_path / "tracking.db"
+
+    stats = organizer.organize_dropbox(str(source), str(tmp_path / "out"), str(db),
+                                       content=True, content_workers=2)
+
+    assert stats["content_classified"] == 1
+    motions = tmp_path / "out/01_COURT_FILINGS/01b_Casey_Motions/Other_Motions"
+    unclassified = tmp_path / "out/10_ARCHIVE/10c_Unclassified"
+    assert [p.name for p in motions.iterdir()] == ["UNDATED_DOC_scan_0001docx.docx"]
+    assert [p.name for p in unclassified.iterdir()] == ["UNDATED_DOC_scan_0002docx.docx"]
+    conn = sqlite3.connect(db)
+    cached = dict(conn.execute("SELECT file_hash, text FROM extracted_text"))
+    conn.close()
+    assert sorted(cached.values()) == ["Grocery list", "Plaintiff Motion for Custody"]
+
+    extractor = organizer.ContentExtractor(str(db))
+    digest = organizer.hash_file(str(source / "scan_0001.docx"))[0]
+    assert extractor.submit(str(source / "scan_0001.docx"), digest).result() == \
+        "Plaintiff Motion for Custody"
+    assert (extractor.hits, extractor.extracted) == (1, 0)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scan_tree_matches_os_walk_order(tmp_path, workers):
+    import os
+
+    for rel in ("b/z.txt", "b/a/one.txt", "b/a/deep/two.txt", "a/three.txt", "top.txt", "c/x/y/z.txt"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    (tmp_path / "link").symlink_to(tmp_path / "b", target_is_directory=True)
+
+    expected = [os.path.join(root, name) for root, _, files in os.walk(tmp_path) for name in files]
+    entries = list(organizer.scan_tree(str(tmp_path), workers))
+
+    assert [entry.path for entry in entries] == expected
+    assert all(entry.stat().st_size > 0 for entry in entries)
+
+
+def test_scan_tree_bounds_prefetched_listings(tmp_path, monkeypatch):
+    for i in range(100):
+        (tmp_path / f"d{i:03d}").mkdir()
+        (tmp_path / f"d{i:03d}" / "f.txt").write_text("x")
+    listed = []
+    list_directory = organizer._list_directory
+
+    def counting(path):
+        listed.append(path)
+        return list_directory(path)
+
+    monkeypatch.setattr(organizer, "_list_directory", counting)
+    limit = organizer.SCAN_PREFETCH_PER_WORKER * 2
+
+    seen = 0
+    for entry in organizer.scan_tree(str(tmp_path), workers=2):
+        seen += 1
+        # The root and the directories yielded so far, plus at most limit ahead
+        assert len(listed) <= 1 + seen + limit
+    assert seen == 100
+    assert len(listed) == 101
+
+
+def test_year_subfolder_uses_listing_mtime(tmp_path):
+    import os
+
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "1234567890.pdf").write_bytes(b"docket")
+    os.utime(source / "1234567890.pdf", (1_700_000_000, 1_700_000_000))  # Nov 2023
+
+    organizer.organize_dropbox(str(source), str(tmp_path / "out"), str(tmp_path / "t.db"))
+
+    assert (tmp_path / "out/01_COURT_FILINGS/01a_Docket_Entries/2023").is_dir()
+    assert organizer.get_file_year("1234567890.pdf", 1_700_000_000) == "2023"
+
+
+def test_run_report_records_stage_metrics(tmp_path):
+    import json
+
+    source = tmp_path / "source"
+    _make_source_tree(source)
+
+    stats = organizer.organize_dropbox(str(source), str(tmp_path / "out"),
+                                       str(tmp_path / "tracking.db"), workers=2)
+
+    reports = list(tmp_path.glob("tracking_run1_*.json"))
+    assert len(reports) == 1
+    report = json.loads(reports[0].read_text())
+    assert report["run_id"] == 1
+    assert report["counts"]["successfully_moved"] == stats["successfully_moved"] == 5
+    stages = report["stages"]
+    assert stages["walk"]["items"] == stats["total_scanned"]
+    assert stages["classify"]["items"] == 5
+    copy = stages["copy"]
+    assert copy["items"] == 5 and copy["bytes"] == len(b"onetwothreeimgofw")
+    assert copy["p50_ms"] <= copy["p99_ms"]
+    assert len(copy["slowest"]) == 5
+    assert stages["log"]["items"] == report["tracking"]["rows_written"] > 0
+
+
+def test_percentile_nearest_rank():
+    samples = sorted(float(i) for i in range(1, 101))
+
+    assert organizer._percentile(samples, 50) == 50.0
+    assert organizer._percentile(samples, 99) == 99.0
+    assert organizer._percentile([3.0], 99) == 3.0
+    assert organizer._percentile([], 50) == 0.0
@@ -0,0 +1,496 @@
+"""Tests for the FileBoss integration service."""
+import asyncio
+import contextlib
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from casebuilder.services import fileboss_integration
+from casebuilder.services.fileboss_integration import FileBossIntegrator, FileType
+
+SUPPORTED_EXTENSIONS = {
+    'document': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.md', '.odt'],
+    'image': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.svg'],
+    'audio': ['.mp3', '.wav', '.aac', '.flac', '.ogg', '.m4a'],
+    'video': ['.mp4', '.avi', '.mov', '.wmv', '.mkv', '.flv', '.webm'],
+    'archive': ['.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'],
+    'code': ['.py', '.js', '.java', '.c', '.cpp', '.h', '.hpp', '.cs', '.go', '.rs', '.rb', '.php', '.swift'],
+    'data': ['.json', '.xml', '.csv', '.xls', '.xlsx', '.db', '.sqlite']
+}
+
+
+class FakeFileProcessor:
+    """Stand-in for FileSystemMaster's FileProcessor (importable, so picklable)."""
+
+    def __init__(self, config=None):
+        self.config = config
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def process_file(self, path):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.01)
+            if "corrupt" in os.path.basename(str(path)):
+                raise ValueError("unreadable file")
+            return {"processed_by": os.getpid(), "words": len(os.path.basename(str(path)))}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def integrator(monkeypatch):
+    def initialize(self):
+        self.fs_config = {"fake": True}
+        self.file_processor = FakeFileProcessor(self.fs_config)
+        self.file_organizer = None
+        self.supported_extensions = SUPPORTED_EXTENSIONS
+
+    monkeypatch.setattr(FileBossIntegrator, "_initialize_components", initialize)
+    integrator = FileBossIntegrator({"process_workers": 0})
+    yield integrator
+    integrator.close()
+
+
+@pytest.fixture
+def evidence_dir(tmp_path):
+    for rel in ("a/report.pdf", "a/photo.jpg", "b/corrupt_scan.pdf", "b/notes.txt",
+                "b/deep/call.mp3", "c/skip.unknown", "c/data.csv"):
+        path = tmp_path / "evidence" / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    return tmp_path / "evidence"
+
+
+def _summary(files):
+    return [(f.path, f.file_type, f.metadata["words"], f.case_id) for f in files]
+
+
+def test_concurrent_mode_matches_sequential_order(integrator, evidence_dir, caplog):
+    sequential = asyncio.run(integrator.process_directory(evidence_dir, case_id="case-1"))
+    with caplog.at_level(logging.ERROR, logger=fileboss_integration.__name__):
+        concurrent = asyncio.run(
+            integrator.process_directory(evidence_dir, case_id="case-1", max_concurrency=4)
+        )
+
+    assert _summary(concurrent) == _summary(sequential)
+    assert len(concurrent) == 5
+    assert any("corrupt_scan.pdf" in r.message and "unreadable file" in r.message
+               for r in caplog.records)
+
+
+def test_concurrent_mode_respects_bound(integrator, evidence_dir):
+    asyncio.run(integrator.process_directory(evidence_dir, max_concurrency=2))
+
+    assert integrator.file_processor.peak == 2
+
+
+def test_process_pool_runs_process_file_in_workers(integrator, evidence_dir):
+    integrator.config["process_workers"] = 2
+
+    files = asyncio.run(integrator.process_directory(evidence_dir, max_concurrency=4))
+
+    assert len(files) == 5
+    assert os.getpid() not in {f.metadata["processed_by"] for f in files}
+
+
+def test_process_pool_is_not_forked_and_closes_with_the_integrator(integrator, evidence_dir):
+    integrator.config["process_workers"] = 2
+
+    async def run():
+        async with integrator:
+            files = [metadata async for metadata in integrator.iter_directory(evidence_dir)]
+            start_method = integrator._process_pool._mp_context.get_start_method()
+        return files, start_method
+
+    files, start_method = asyncio.run(run())
+
+    assert len(files) == 5
+    assert start_method in ("forkserver", "spawn")
+    assert integrator._process_pool is None
+
+
+def test_iter_directory_streams_in_scan_order(integrator, evidence_dir):
+    async def collect():
+        return [metadata async for metadata in integrator.iter_directory(
+            evidence_dir, evidence_id="ev-9", max_concurrency=3)]
+
+    streamed = asyncio.run(collect())
+    listed = asyncio.run(integrator.process_directory(evidence_dir, evidence_id="ev-9"))
+
+    assert _summary(streamed) == _summary(listed)
+    assert all(metadata.evidence_id == "ev-9" for metadata in streamed)
+
+
+def test_iter_directory_stops_early(integrator, tmp_path):
+    for i in range(40):
+        (tmp_path / f"doc_{i:02d}.txt").write_text("x")
+
+    async def first():
+        async with contextlib.aclosing(
+                integrator.iter_directory(tmp_path, max_concurrency=2)) as stream:
+            async for metadata in stream:
+                return metadata
+
+    metadata = asyncio.run(first())
+
+    assert metadata.name.startswith("doc_")
+    assert integrator.file_processor.calls <= 3
+
+
+def test_iter_directory_cancelled_mid_scan(integrator, tmp_path, monkeypatch):
+    scanning, release, closed = threading.Event(), threading.Event(), threading.Event()
+
+    def slow_scan(directory, recursive, file_types):
+        try:
+            scanning.set()
+            release.wait(5)
+            yield from ()
+        finally:
+            closed.set()
+
+    monkeypatch.setattr(integrator, "_iter_scan_directory", slow_scan)
+
+    async def consume():
+        return [metadata async for metadata in integrator.iter_directory(tmp_path)]
+
+    async def cancel_mid_scan():
+        task = asyncio.ensure_future(consume())
+        await asyncio.to_thread(scanning.wait, 5)
+        task.cancel()
+        asyncio.get_running_loop().call_later(0.05, release.set)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_mid_scan())
+
+    assert closed.is_set()
+
+
+def test_organize_files_accepts_stream(integrator, evidence_dir, tmp_path):
+    output = tmp_path / "organized"
+
+    results = asyncio.run(integrator.organize_files(
+        integrator.iter_directory(evidence_dir), output, organization_scheme="type"))
+
+    assert sorted(r["file_type"] for r in results) == \
+        ["audio", "data", "document", "document", "image"]
+    assert (output / "audio" / "call.mp3").read_text() == "b/deep/call.mp3"
+
+
+def _legacy_scan(root, extensions):
+    return sorted(
+        str(p) for p in root.glob('**/*') if p.is_file() and p.suffix.lower() in extensions
+    )
+
+
+def test_scan_prunes_excluded_dirs_and_matches_glob(integrator, evidence_dir):
+    for rel in (".git/objects/blob.txt", "node_modules/pkg/index.js", ".venv/lib/site.py",
+                "b/.venv/notes.md"):
+        path = evidence_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+
+    scanned = integrator._scan_directory(evidence_dir)
+    extensions = set(integrator.extension_index)
+    kept = [p for p in _legacy_scan(evidence_dir, extensions)
+            if not set(Path(p).relative_to(evidence_dir).parts) & fileboss_integration.EXCLUDED_DIRS]
+
+    assert sorted(str(info['path']) for info in scanned) == kept
+    assert {info['name']: info['type'] for info in scanned}['call.mp3'] == FileType.AUDIO
+    info = next(info for info in scanned if info['name'] == 'report.pdf')
+    assert info['size'] == len("a/report.pdf")
+    assert info['modified'] == (evidence_dir / "a/report.pdf").stat().st_mtime
+
+
+def test_scan_filters_types_and_recursion(integrator, evidence_dir):
+    (evidence_dir / "top.pdf").write_text("top")
+
+    documents = integrator._scan_directory(evidence_dir, file_types=['document'])
+    shallow = integrator._scan_directory(evidence_dir, recursive=False)
+
+    assert sorted(info['name'] for info in documents) == \
+        ["corrupt_scan.pdf", "notes.txt", "report.pdf", "top.pdf"]
+    assert [info['name'] for info in shallow] == ["top.pdf"]
+
+
+def test_get_file_type_uses_extension_index(integrator):
+    assert integrator._get_file_type('.PDF') == FileType.DOCUMENT
+    assert integrator._get_file_type('.sqlite') == FileType.DATA
+    assert integrator._get_file_type('.exe') == FileType.OTHER
+
+
+def test_index_reprocesses_only_changed_files(integrator, evidence_dir, tmp_path):
+    indexed = FileBossIntegrator({"process_workers": 0, "index_path": str(tmp_path / "index.db")})
+    try:
+        first = asyncio.run(indexed.process_directory(evidence_dir, case_id="case-1"))
+        assert indexed.last_scan.added == 6  # corrupt_scan.pdf fails and is not indexed
+        calls = indexed.file_processor.calls
+
+        again = asyncio.run(indexed.process_directory(evidence_dir, case_id="case-1"))
+        assert _summary(again) == _summary(first)
+        assert indexed.file_processor.calls == calls + 1  # only the failing file is retried
+        assert (indexed.last_scan.unchanged, indexed.last_scan.processed) == (5, 1)
+
+        (evidence_dir / "a/report.pdf").write_text("amended report")
+        (evidence_dir / "b/notes.txt").unlink()
+        (evidence_dir / "c/new_photo.png").write_text("new")
+        changed = asyncio.run(indexed.process_directory(evidence_dir, case_id="case-1"))
+
+        summary = indexed.last_scan
+        assert (summary.added, summary.modified, summary.unchanged, summary.deleted) == (2, 1, 3, 1)
+        assert indexed.index.deleted_paths(evidence_dir) == [str(evidence_dir / "b/notes.txt")]
+        report = next(f for f in changed if f.name == "report.pdf")
+        assert report.size == len("amended report")
+        assert report.metadata["words"] == len("report.pdf")
+    finally:
+        indexed.close()
+
+
+def test_index_drops_scans_stopped_early(integrator, evidence_dir, tmp_path):
+    indexed = FileBossIntegrator({"process_workers": 0, "index_path": str(tmp_path / "index.db")})
+
+    async def first():
+        async with contextlib.aclosing(indexed.iter_directory(evidence_dir)) as stream:
+            async for metadata in stream:
+                return metadata
+
+    try:
+        assert asyncio.run(first()) is not None
+        assert indexed.index._summaries == {}
+        assert indexed.index.deleted_paths(evidence_dir) == []
+
+        asyncio.run(indexed.process_directory(evidence_dir))
+        assert indexed.last_scan.processed + indexed.last_scan.unchanged == 6
+        assert indexed.index._summaries == {}
+    finally:
+        indexed.close()
+
+
+def test_index_scope_limits_deletions(integrator, evidence_dir, tmp_path):
+    indexed = FileBossIntegrator({"process_workers": 0, "index_path": str(tmp_path / "index.db")})
+    try:
+        asyncio.run(indexed.process_directory(evidence_dir))
+        asyncio.run(indexed.process_directory(evidence_dir, file_types=["audio"]))
+        asyncio.run(indexed.process_directory(evidence_dir / "a", recursive=False))
+
+        assert indexed.last_scan.deleted == 0
+        assert indexed.index.deleted_paths(evidence_dir) == []
+    finally:
+        indexed.close()
+
+
+class RecordingBus:
+    """EventBus stand-in recording emit_async calls."""
+
+    def __init__(self):
+        self.events = []
+        self.changed = None
+
+    async def emit_async(self, event_name, data=None):
+        self.events.append((event_name, data))
+        self.changed.set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_directory_watcher_reconciles_then_follows_events(integrator, evidence_dir, tmp_path):
+    from casebuilder.services.directory_watcher import DirectoryWatcher
+
+    indexed = FileBossIntegrator({"process_workers": 0, "index_path": str(tmp_path / "index.db")})
+    asyncio.run(indexed.process_directory(evidence_dir))
+    (evidence_dir / "a/photo.jpg").unlink()  # removed while nobody was watching
+    bus = RecordingBus()
+
+    async def scenario():
+        bus.changed = asyncio.Event()
+        watcher = DirectoryWatcher(indexed, evidence_dir, bus, case_id="case-7", debounce=0.05)
+        task = asyncio.create_task(watcher.run())
+        await asyncio.wait_for(watcher.ready.wait(), 5)
+        reconciled = list(bus.events)
+        bus.events.clear()
+
+        async def settle(count):
+            while len(bus.events) < count:
+                bus.changed.clear()
+                await asyncio.wait_for(bus.changed.wait(), 5)
+
+        for i in range(3):  # coalesced into one work item
+            (evidence_dir / "a/report.pdf").write_text(f"revision {i}")
+        (evidence_dir / "new").mkdir()
+        (evidence_dir / "new/filing.docx").write_text("filing")
+        (evidence_dir / "b/notes.txt").unlink()
+        (evidence_dir / "b/ignored.tmp").write_text("not a supported type")
+        await settle(3)
+        await asyncio.sleep(0.2)  # nothing else should arrive
+
+        watcher.stop()
+        await asyncio.wait_for(task, 5)
+        return reconciled
+
+    reconciled = asyncio.run(scenario())
+    indexed.close()
+
+    assert reconciled == [("document_deleted", {"path": str(evidence_dir / "a/photo.jpg"),
+                                                "case_id": "case-7"})]
+    uploaded = sorted(data["path"] for name, data in bus.events if name == "document_uploaded")
+    deleted = [data["path"] for name, data in bus.events if name == "document_deleted"]
+    assert uploaded == [str(evidence_dir / "a/report.pdf"), str(evidence_dir / "new/filing.docx")]
+    assert deleted == [str(evidence_dir / "b/notes.txt")]
+    assert all(data["case_id"] == "case-7" for _, data in bus.events)
+
+
+def test_content_store_keeps_one_blob_per_content(integrator, evidence_dir, tmp_path):
+    from casebuilder.services.content_store import ContentStore
+
+    integrator.content_store = ContentStore(tmp_path / "cas")
+    (evidence_dir / "a/copy_of_report.pdf").write_text("a/report.pdf")
+
+    async def organize_twice():
+        files = await integrator.process_directory(evidence_dir)
+        by_type = await integrator.organize_files(files, tmp_path / "by_type", "type")
+        flat = await integrator.organize_files(files, tmp_path / "flat", "flat")
+        return by_type, flat
+
+    by_type, flat = asyncio.run(organize_twice())
+
+    blobs = [p for p in (tmp_path / "cas" / "objects").rglob("*") if p.is_file()]
+    assert len(by_type) == len(flat) == 6
+    assert len(blobs) == 5  # the duplicated report is stored once
+    assert {r["link_mode"] for r in by_type + flat} == {"hardlink"}
+    report = tmp_path / "by_type" / "document" / "report.pdf"
+    assert report.read_text() == "a/report.pdf"
+    assert report.stat().st_ino == (tmp_path / "flat" / "copy_of_report.pdf").stat().st_ino
+    assert not os.access(blobs[0], os.W_OK) or os.geteuid() == 0
+
+
+def test_content_store_symlink_views_and_streams(tmp_path):
+    import io
+
+    from casebuilder.services.content_store import ContentStore
+
+    store = ContentStore(tmp_path / "cas")
+    first = store.put_stream(io.BytesIO(b"uploaded twice"))
+    second = store.put_stream(io.BytesIO(b"uploaded twice"))
+
+    assert first.created and not second.created
+    assert first.path == second.path and first.size == 14
+    assert store.put_file(first.path, first.file_hash).created is False
+
+    view = tmp_path / "view.bin"
+    assert store.link(first.file_hash, view, "symlink") == "symlink"
+    assert view.is_symlink() and view.read_bytes() == b"uploaded twice"
+    with pytest.raises(FileNotFoundError):
+        store.link("0" * 64, tmp_path / "missing.bin")
+    assert list((tmp_path / "cas" / "tmp").iterdir()) == []
+
+
+def test_content_store_rejects_a_stale_hash(tmp_path):
+    import hashlib
+
+    from casebuilder.services.content_store import ContentStore
+
+    store = ContentStore(tmp_path / "cas")
+    source = tmp_path / "exhibit.txt"
+    source.write_bytes(b"original")
+    old = store.put_file(source)
+    source.write_bytes(b"edited, same fingerprint")
+
+    blob = store.put_file(source, old.file_hash)
+
+    assert blob.created
+    assert blob.file_hash == hashlib.sha256(b"edited, same fingerprint").hexdigest()
+    assert blob.path.read_bytes() == b"edited, same fingerprint"
+    assert old.path.read_bytes() == b"original"
+
+
+def test_link_modes_need_a_content_store(integrator, evidence_dir, tmp_path):
+    with pytest.raises(ValueError):
+        asyncio.run(integrator.organize_files([], tmp_path / "out", link_mode="hardlink"))
+
+
+def test_file_fingerprint_samples_only_the_ends(tmp_path):
+    from casebuilder.services.fileboss_integration import FINGERPRINT_SAMPLE_SIZE, file_fingerprint
+
+    path = tmp_path / "video.mp4"
+    data = bytearray(b"x" * (4 * FINGERPRINT_SAMPLE_SIZE))
+    path.write_bytes(data)
+    before = file_fingerprint(path, len(data), 1.0)
+
+    data[2 * FINGERPRINT_SAMPLE_SIZE] = ord("y")  # middle: not sampled
+    path.write_bytes(data)
+    assert file_fingerprint(path, len(data), 1.0) == before
+    assert file_fingerprint(path, len(data), 2.0) != before
+
+    data[-1] = ord("z")  # tail
+    path.write_bytes(data)
+    assert file_fingerprint(path, len(data), 1.0) != before
+
+
+def test_fingerprint_mode_hashes_lazily(integrator, evidence_dir, tmp_path):
+    from casebuilder.services.fileboss_integration import compute_sha256
+
+    indexed = FileBossIntegrator({"process_workers": 0, "hash_mode": "fingerprint",
+                                  "index_path": str(tmp_path / "index.db")})
+    report = evidence_dir / "a/report.pdf"
+
+    async def first_scan():
+        files = {f.name: f for f in await indexed.process_directory(evidence_dir)}
+        assert all(f.fingerprint and not f.hash for f in files.values())
+        return await indexed.ensure_hash(files["report.pdf"])  # e.g. for a custody record
+
+    assert asyncio.run(first_scan()) == compute_sha256(report)
+
+    # Same size and mtime, different first bytes: only the fingerprint notices
+    stat = report.stat()
+    report.write_text("A/report.pdf")
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    files = {f.name: f for f in asyncio.run(indexed.process_directory(evidence_dir))}
+    indexed.close()
+
+    assert indexed.last_scan.modified == 1
+    assert files["report.pdf"].hash == compute_sha256(report)  # stale hash refreshed
+    assert files["notes.txt"].hash == ""  # never needed, never computed
+
+
+def test_hash_mode_is_validated(integrator):
+    with pytest.raises(ValueError):
+        FileBossIntegrator({"hash_mode": "md5"})
+
+
+def test_file_metadata_is_slotted_and_not_a_scan_copy(integrator, evidence_dir):
+    files = asyncio.run(integrator.process_directory(evidence_dir))
+
+    assert not hasattr(files[0], "__dict__")
+    assert "path" not in files[0].metadata and "inode" in files[0].metadata
+
+
+def test_scan_batch_matches_scan(integrator, evidence_dir):
+    from casebuilder.services.fileboss_integration import FileMetadataBatch
+
+    batch = integrator.scan_batch(evidence_dir)
+    files = asyncio.run(integrator.process_directory(evidence_dir))
+
+    assert batch.paths == [str(info['path']) for info in integrator._scan_directory(evidence_dir)]
+    assert len(batch.extensions) == len(set(batch.extensions)) == 5
+    assert batch.counts_by_type() == {FileType.DOCUMENT: 3, FileType.IMAGE: 1,
+                                      FileType.AUDIO: 1, FileType.DATA: 1}
+    assert batch.total_size() == sum(batch.sizes)
+    assert batch.total_size(FileType.AUDIO) == len("b/deep/call.mp3")
+    assert sorted(batch[i].name for i in batch.select(FileType.DOCUMENT)) == \
+        ["corrupt_scan.pdf", "notes.txt", "report.pdf"]
+
+    rebuilt = FileMetadataBatch.from_metadata(files)
+    first = rebuilt[0]
+    assert (first.path, first.size, first.file_type, first.mime_type) == \
+        (files[0].path, files[0].size, files[0].file_type, files[0].mime_type)
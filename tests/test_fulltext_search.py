@@ -0,0 +1,173 @@
+"""Tests for the full-text search indexes behind repository search()."""
+import pytest
+from sqlalchemy import Column, String, Text, create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, declarative_base
+
+# ImportError, not just a missing module: casebuilder.db's __init__ does not
+# import cleanly in every checkout
+fulltext = pytest.importorskip("casebuilder.db.fulltext", exc_type=ImportError)
+build_search_query = fulltext.build_search_query
+install_fulltext_indexes = fulltext.install_fulltext_indexes
+parse_search_query = fulltext.parse_search_query
+register_fulltext_indexes = fulltext.register_fulltext_indexes
+to_fts5_match = fulltext.to_fts5_match
+to_tsquery = fulltext.to_tsquery
+
+Base = declarative_base()
+
+
+class Document(Base):
+    """The searchable columns of casebuilder.db.models.Document."""
+
+    __tablename__ = "documents"
+
+    id = Column(String(36), primary_key=True)
+    title = Column(String(255), nullable=False)
+    file_name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    case_id = Column(String(36), nullable=False)
+
+
+register_fulltext_indexes(Base.metadata)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([
+            Document(id="1", title="Deposition of John Smith", file_name="depo.pdf",
+                     description="Witness testimony about the accident", case_id="a"),
+            Document(id="2", title="Motion to dismiss", file_name="motion.docx",
+                     description="The deposition transcript is attached", case_id="a"),
+            Document(id="3", title="Scene photo", file_name="smith-jones.jpg",
+                     description=None, case_id="b"),
+        ])
+        session.commit()
+        yield session
+
+
+def _ids(session, query, **filters):
+    stmt = build_search_query(Document, query, "sqlite")
+    for key, value in filters.items():
+        stmt = stmt.where(getattr(Document, key) == value)
+    return [row[0].id for row in session.execute(stmt)]
+
+
+def test_parse_search_query():
+    terms = parse_search_query('depo* "John  Smith" smith-jones "unclosed')
+
+    assert [(t.words, t.prefix) for t in terms] == [
+        (("depo",), True), (("John", "Smith"), False),
+        (("smith", "jones"), False), (("unclosed",), False),
+    ]
+    assert to_fts5_match(terms[:2]) == '"depo"* "John Smith"'
+    assert to_tsquery(terms[:2]) == "(depo:*) & (John <-> Smith)"
+    assert parse_search_query('"" * ()') == []
+    # FTS5 operators are only ever matched as plain words
+    assert to_fts5_match(parse_search_query("NEAR(a OR")) == '"NEAR a" "OR"'
+
+
+
+def test_sqlite_search_ranks_and_snippets(session):
+    rows = session.execute(build_search_query(Document, "deposition", "sqlite")).all()
+
+    assert [row[0].id for row in rows] == ["1", "2"]  # title match outranks description
+    assert rows[0].rank >= rows[1].rank
+    assert rows[0].snippet == "<mark>Deposition</mark> of John Smith"
+    assert _ids(session, "depo*") == ["1", "2"]
+    assert _ids(session, '"john smith"') == ["1"]
+    assert _ids(session, '"smith john"') == []
+    assert _ids(session, "smith-jones") == ["3"]
+    assert _ids(session, "deposition", case_id="b") == []
+    assert build_search_query(Document, "  ", "sqlite") is None
+
+
+def test_triggers_keep_the_index_in_sync(session):
+    session.get(Document, "2").title = "Opposition brief"
+    session.delete(session.get(Document, "1"))
+    session.add(Document(id="4", title="Dismissal order", file_name="order.pdf", case_id="a"))
+    session.commit()
+
+    assert _ids(session, "dismiss") == []
+    assert _ids(session, "dismiss*") == ["4"]
+    assert _ids(session, "deposition") == ["2"]
+
+    install_fulltext_indexes(session.connection())  # idempotent, rebuilds the index
+    assert _ids(session, "deposition") == ["2"]
+
+
+def test_index_survives_vacuum_renumbering_rowids(session):
+    session.delete(session.get(Document, "1"))
+    session.commit()
+    session.connection().exec_driver_sql("VACUUM")
+    session.get(Document, "3").description = "Deposition exhibit"
+    session.commit()
+
+    assert sorted(_ids(session, "deposition")) == ["2", "3"]
+    session.delete(session.get(Document, "2"))
+    session.commit()
+    assert _ids(session, "deposition") == ["3"]
+    assert session.connection().exec_driver_sql(
+        "SELECT id FROM documents_fts ORDER BY id").scalars().all() == ["3"]
+
+
+def test_postgres_query_uses_tsvector_index():
+    stmt = build_search_query(Document, 'depo* "john smith"', "postgresql")
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "documents.search_vector @@ to_tsquery('english'" in sql
+    assert "ts_rank_cd" in sql and "ts_headline" in sql
+
+
+def test_fallback_matches_every_term(session):
+    stmt = build_search_query(Document, "deposition witness", "mysql")
+
+    assert [row[0].id for row in session.execute(stmt)] == ["1"]
+
+
+def test_migration_indexes_existing_rows():
+    pytest.importorskip("alembic.migration")
+    import importlib.util
+    from pathlib import Path
+
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+    from sqlalchemy import MetaData, inspect
+
+    path = (Path(__file__).parent.parent / "alembic" / "versions"
+            / "3ec20bc09800_add_fulltext_indexes.py")
+    spec = importlib.util.spec_from_file_location("fulltext_migration", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    # The documents table as it was before full-text search: no FTS table or triggers
+    metadata = MetaData()
+    Document.__table__.to_metadata(metadata)
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(metadata.tables["documents"].insert(), [
+            {"id": "1", "title": "Deposition of John Smith", "file_name": "depo.pdf",
+             "case_id": "a"},
+            {"id": "2", "title": "Scene photo", "file_name": "photo.jpg", "case_id": "a"},
+        ])
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+
+    with Session(engine) as session:
+        assert _ids(session, "deposition") == ["1"]
+        session.add(Document(id="3", title="Second deposition", file_name="d2.pdf",
+                             case_id="a"))
+        session.commit()
+        assert sorted(_ids(session, "deposition")) == ["1", "3"]
+
+    with engine.begin() as connection:
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.downgrade()
+        assert inspect(connection).get_table_names() == ["documents"]
+        assert connection.exec_driver_sql(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger'"
+        ).scalar_one() == 0
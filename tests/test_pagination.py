@@ -0,0 +1,173 @@
+"""Tests for keyset (cursor) pagination."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, String, create_engine, insert, select
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.sql import func
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from casebuilder.pagination import (
+    InvalidCursor, build_counted_page, build_page, count_select, counted_select,
+    decode_cursor, encode_cursor, estimate_select, keyset_select, parse_estimate
+)
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    case_id = Column(String, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    base = datetime(2024, 5, 1, 9, 30, 15, 250000)
+    with Session(engine) as session:
+        # Explicit timestamps, some shared, plus rows stamped by the server
+        # default (stored without microseconds)
+        session.add_all(
+            Item(id=i, case_id="a" if i % 4 else "b", created_at=base + timedelta(seconds=i // 3))
+            for i in range(1, 31)
+        )
+        session.flush()
+        session.execute(insert(Item), [{"id": i, "case_id": "a"} for i in range(31, 36)])
+        session.commit()
+        yield session
+
+
+def _walk(session, limit, descending=False):
+    query = select(Item).where(Item.case_id == "a")
+    cursor, seen, pages = None, [], 0
+    while pages <= 100:
+        rows = session.execute(
+            keyset_select(query, (Item.created_at, Item.id), cursor, limit, "sqlite", descending)
+        ).all()
+        page = build_page(rows, limit)
+        seen.extend(item.id for item in page.items)
+        pages += 1
+        if page.next_cursor is None:
+            return seen, pages
+        cursor = page.next_cursor
+    raise AssertionError("pagination did not terminate")
+
+
+@pytest.mark.parametrize("limit", [1, 4, 7, 100])
+def test_pages_cover_every_row_once_in_order(session, limit):
+    expected = [
+        item.id for item in session.scalars(
+            select(Item).where(Item.case_id == "a").order_by(Item.created_at, Item.id)
+        )
+    ]
+
+    seen, pages = _walk(session, limit)
+
+    assert seen == expected
+    assert len(expected) == 28
+    assert pages == -(-len(expected) // limit)
+
+
+def test_descending_pages(session):
+    seen, _ = _walk(session, 5, descending=True)
+    ascending, _ = _walk(session, 5)
+
+    assert seen == ascending[::-1]
+
+
+def test_cursor_round_trip_and_validation():
+    values = [datetime(2024, 5, 1, 9, 30), "3f2a", 7]
+    token = encode_cursor(values)
+
+    assert decode_cursor(token, 3) == values
+    assert "=" not in token
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token, 2)
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not a cursor!", 3)
+    with pytest.raises(InvalidCursor):
+        decode_cursor(encode_cursor([{"x": 1}]), 1)
+
+
+@pytest.mark.parametrize("skip", [0, 10, 25])
+def test_counted_page_carries_the_total(session, skip):
+    query = select(Item).where(Item.case_id == "a").order_by(Item.created_at, Item.id)
+    expected = session.scalars(query).all()
+
+    page = build_counted_page(session.execute(counted_select(query, skip, 10)).all(), skip)
+
+    assert page.items == expected[skip:skip + 10]
+    assert page.total == 28
+    assert not page.total_is_estimate
+
+
+def test_counted_page_past_the_end(session):
+    query = select(Item).where(Item.case_id == "a")
+
+    page = build_counted_page(session.execute(counted_select(query, 50, 10)).all(), 50)
+    assert page.items == [] and page.total is None
+    assert session.execute(count_select(query)).scalar_one() == 28
+
+    empty = select(Item).where(Item.case_id == "none")
+    page = build_counted_page(session.execute(counted_select(empty, 0, 10)).all(), 0)
+    assert page.items == [] and page.total == 0
+
+
+def test_estimate_select():
+    query = select(Item).where(Item.case_id == "a:b", Item.created_at > datetime(2024, 5, 1, 9, 30))
+
+    assert estimate_select(query, sqlite.dialect()) is None
+    statement = estimate_select(query, postgresql.dialect())
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "'a:b'" in sql and "'2024-05-01 09:30:00'" in sql
+    assert not statement.compile(dialect=postgresql.dialect()).params
+
+    assert parse_estimate([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 125000}}]) == 125000
+    assert parse_estimate('[{"Plan": {"Plan Rows": 12}}]') == 12
+
+
+def test_migration_adds_keyset_indexes():
+    pytest.importorskip("alembic.migration")
+    import importlib.util
+    from pathlib import Path
+
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+    from sqlalchemy import MetaData, Table, inspect
+
+    path = (Path(__file__).parent.parent / "alembic" / "versions"
+            / "d9ac50bb900e_add_keyset_pagination_indexes.py")
+    spec = importlib.util.spec_from_file_location("keyset_migration", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    metadata = MetaData()
+    for table, columns in (("cases", ["created_at"]),
+                           ("documents", ["case_id", "created_at"]),
+                           ("evidence", ["case_id", "created_at"]),
+                           ("timeline_events", ["case_id", "event_date"])):
+        Table(table, metadata, Column("id", String(36), primary_key=True),
+              *(Column(name, String if name == "case_id" else DateTime) for name in columns))
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+            migration.upgrade()
+        inspector = inspect(connection)
+        assert {
+            (index["name"], table, tuple(index["column_names"]))
+            for table in metadata.tables for index in inspector.get_indexes(table)
+        } == {(name, table, tuple(columns)) for name, table, columns in migration.INDEXES}
+
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.downgrade()
+        inspector = inspect(connection)
+        assert not any(inspector.get_indexes(table) for table in metadata.tables)
@@ -0,0 +1,149 @@
+"""Tests for the UnitOfWork that defers repository commits."""
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import Column, Integer, String, create_engine, event, func, select
+from sqlalchemy.orm import Session, declarative_base
+
+pytest.importorskip("greenlet")  # for the async engine
+pytest.importorskip("aiosqlite")
+# ImportError, not just a missing module: the repository modules' relative
+# imports do not resolve in every checkout
+CaseRepository = pytest.importorskip(
+    "casebuilder.db.repositories.case", exc_type=ImportError
+).CaseRepository
+EvidenceRepository = pytest.importorskip(
+    "casebuilder.db.repositories.evidence", exc_type=ImportError
+).EvidenceRepository
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from casebuilder.db import models  # noqa: E402
+from casebuilder.db.unit_of_work import UnitOfWork, in_unit_of_work  # noqa: E402
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.commits = 0
+
+        @event.listens_for(session, "after_commit")
+        def count_commit(session_):
+            session.commits += 1
+
+        yield session
+
+
+def _count(session):
+    return session.execute(select(func.count()).select_from(Item)).scalar_one()
+
+
+def test_commits_once_at_exit(session):
+    with UnitOfWork(session):
+        assert in_unit_of_work(session)
+        for name in ("a", "b", "c"):
+            session.add(Item(name=name))
+            session.flush()  # what a repository write does inside a unit
+        assert session.commits == 0
+
+    assert not in_unit_of_work(session)
+    assert session.commits == 1
+    assert _count(session) == 3
+
+
+def test_nested_units_join_the_outer_one(session):
+    with UnitOfWork(session):
+        with UnitOfWork(session):
+            session.add(Item(name="inner"))
+            session.flush()
+        assert in_unit_of_work(session)
+        assert session.commits == 0
+
+    assert session.commits == 1
+    assert _count(session) == 1
+
+
+def test_rolls_back_everything_on_error(session):
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(session):
+            session.add(Item(name="a"))
+            session.flush()
+            raise RuntimeError("custody append failed")
+
+    assert not in_unit_of_work(session)
+    assert session.commits == 0
+    assert _count(session) == 0
+
+
+def test_async_with_requires_an_async_session(session):
+    async def enter():
+        async with UnitOfWork(session):
+            pass
+
+    coroutine = enter()
+    with pytest.raises(RuntimeError):
+        coroutine.send(None)
+
+
+class CaseIn(BaseModel):
+    title: str
+    owner_id: str
+
+
+class EvidenceIn(BaseModel):
+    title: str
+    evidence_type: models.EvidenceType
+
+
+def _repository_workflow(tmp_path, fail: bool):
+    """Create a case and its evidence through two repositories in one unit."""
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'uow.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(models.Base.metadata.create_all)
+        try:
+            async with AsyncSession(engine) as session:
+                commits = []
+                event.listen(session.sync_session, "after_commit", commits.append)
+                cases, evidence = CaseRepository(session), EvidenceRepository(session)
+                try:
+                    async with UnitOfWork(session):
+                        case = await cases.create(CaseIn(title="Smith v. Jones", owner_id="u1"))
+                        await evidence.create(
+                            EvidenceIn(title="Exhibit A", evidence_type="document"),
+                            case_id=case.id
+                        )
+                        assert commits == []
+                        if fail:
+                            raise RuntimeError("timeline insert failed")
+                except RuntimeError:
+                    pass
+                counts = [
+                    await session.scalar(select(func.count()).select_from(model))
+                    for model in (models.Case, models.Evidence)
+                ]
+                return len(commits), counts
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_repository_writes_commit_together(tmp_path):
+    assert _repository_workflow(tmp_path, fail=False) == (1, [1, 1])
+
+
+def test_repository_writes_roll_back_together(tmp_path):
+    assert _repository_workflow(tmp_path, fail=True) == (0, [0, 0])